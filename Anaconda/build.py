@@ -4,15 +4,26 @@ import platform
 import shutil
 import subprocess
 import glob
+import concurrent.futures
 
 version = "5.7.6"
 pyreq = ">=3.7"
 
+# Directories already created by copy_force, so repeated copies skip the makedirs syscalls
+_mkdir_cache = set()
+
 def copy_force(src, dst):
-    os.makedirs(os.path.dirname(dst), exist_ok=True)
-    if os.path.exists(dst):
-        os.remove(dst)
-    shutil.copy2(src, dst)
+    # Metadata is not needed for the packaged binaries, so use copyfile which
+    # lets the standard library pick the fastest platform copy (sendfile, fcopyfile, CopyFile2).
+    d = os.path.dirname(dst)
+    if d not in _mkdir_cache:
+        os.makedirs(d, exist_ok=True)
+        _mkdir_cache.add(d)
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    shutil.copyfile(src, dst)
 
 # Copy main Python file
 copy_force("../sdds/sdds.py", "src/sdds/sdds.py")
@@ -23,34 +34,41 @@ machine = platform.machine()
 if system == "Linux":
     binDir = "/home/oxygen/SOLIDAY/miniconda3/bin"
     copy_force("../lib/Linux-x86_64/libsddsdata.so", "src/sdds/sddsdata.so")
-    files_str = "sddsdata.so"
+    files_str = '"sddsdata.so"'
 elif system == "Darwin" and machine == "x86_64":
     binDir = "/Users/soliday/miniconda3/bin"
     copy_force("../lib/Darwin-x86_64/libsddsdata.so", "src/sdds/sddsdata.so")
-    files_str = "sddsdata.so"
+    files_str = '"sddsdata.so"'
 elif system == "Darwin" and machine == "arm64":
     pyreq = ">=3.8"
     binDir = "/Users/soliday/miniconda3/bin"
     copy_force("../lib/Darwin-arm64/libsddsdata.so", "src/sdds/sddsdata.so")
-    files_str = "sddsdata.so"
+    files_str = '"sddsdata.so"'
 else:
     pyreq = ">=3.8"
     binDir = r"c:/Users/solid/miniconda3/Scripts"
-    # Windows files
-    copy_force("../bin/Windows-x86_64/sddsdata14.dll", "src/sdds/sddsdata14.pyd")
-    copy_force("../bin/Windows-x86_64/sddsdata8.dll", "src/sdds/sddsdata8.pyd")
-    copy_force("../bin/Windows-x86_64/sddsdata9.dll", "src/sdds/sddsdata9.pyd")
-    copy_force("../bin/Windows-x86_64/sddsdata10.dll", "src/sdds/sddsdata10.pyd")
-    copy_force("../bin/Windows-x86_64/sddsdata11.dll", "src/sdds/sddsdata11.pyd")
-    copy_force("../bin/Windows-x86_64/sddsdata12.dll", "src/sdds/sddsdata12.pyd")
-    copy_force("../bin/Windows-x86_64/sddsdata13.dll", "src/sdds/sddsdata13.pyd")
-    copy_force("../../SDDS/bin/Windows-x86_64/SDDS1.dll", "src/sdds/SDDS1.dll")
-    copy_force("../../SDDS/bin/Windows-x86_64/rpnlib.dll", "src/sdds/rpnlib.dll")
-    copy_force("../../SDDS/bin/Windows-x86_64/mdbmth.dll", "src/sdds/mdbmth.dll")
-    copy_force("../../SDDS/bin/Windows-x86_64/mdblib.dll", "src/sdds/mdblib.dll")
-    copy_force("../../SDDS/bin/Windows-x86_64/lzma.dll", "src/sdds/lzma.dll")
+    # Windows files. The copies are independent, so overlap them in a thread pool.
+    copy_pairs = [
+        ("../bin/Windows-x86_64/sddsdata14.dll", "src/sdds/sddsdata14.pyd"),
+        ("../bin/Windows-x86_64/sddsdata8.dll", "src/sdds/sddsdata8.pyd"),
+        ("../bin/Windows-x86_64/sddsdata9.dll", "src/sdds/sddsdata9.pyd"),
+        ("../bin/Windows-x86_64/sddsdata10.dll", "src/sdds/sddsdata10.pyd"),
+        ("../bin/Windows-x86_64/sddsdata11.dll", "src/sdds/sddsdata11.pyd"),
+        ("../bin/Windows-x86_64/sddsdata12.dll", "src/sdds/sddsdata12.pyd"),
+        ("../bin/Windows-x86_64/sddsdata13.dll", "src/sdds/sddsdata13.pyd"),
+        ("../../SDDS/bin/Windows-x86_64/SDDS1.dll", "src/sdds/SDDS1.dll"),
+        ("../../SDDS/bin/Windows-x86_64/rpnlib.dll", "src/sdds/rpnlib.dll"),
+        ("../../SDDS/bin/Windows-x86_64/mdbmth.dll", "src/sdds/mdbmth.dll"),
+        ("../../SDDS/bin/Windows-x86_64/mdblib.dll", "src/sdds/mdblib.dll"),
+        ("../../SDDS/bin/Windows-x86_64/lzma.dll", "src/sdds/lzma.dll"),
+    ]
+    # Create the destination directory once so the worker threads do not race on it
+    os.makedirs("src/sdds", exist_ok=True)
+    _mkdir_cache.add("src/sdds")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda pair: copy_force(*pair), copy_pairs))
     files_list = ["sddsdata.pyd", "SDDS1.dll", "rpnlib.dll", "mdbmth.dll", "mdblib.dll", "lzma.dll"]
-    files_str = ",".join(files_list)
+    files_str = ", ".join(f'"{name}"' for name in files_list)
 
 # Delete old build files
 for f in ["src/setup.py", "src/meta.yaml", "src/conda_build_config.yaml"]:
@@ -62,57 +80,54 @@ for f in ["src/setup.py", "src/meta.yaml", "src/conda_build_config.yaml"]:
 def run_cmd(cmd_list):
     subprocess.run(cmd_list, check=True)
 
+def replace_text(template, output, replacements):
+    # In-process equivalent of the SDDS replaceText tool for the small build templates
+    with open(template) as f:
+        data = f.read()
+    for orig, repl in replacements.items():
+        data = data.replace(orig, repl)
+    with open(output, "w") as f:
+        f.write(data)
+
 def get_glob_files():
     matches = glob.glob("src/sdds/*.dll") + glob.glob("src/sdds/*.pyd") + glob.glob("src/sdds/*.so")
     return " ".join(matches)
 
 # Execute replacement commands based on platform
 if system == "Linux":
-    run_cmd(["../../SDDS/bin/Linux-x86_64/replaceText",
-             "src/setup.py.template", "src/setup.py",
-             "-orig=<VERSION>,<PYFILES>", f"-repl={version},{files_str}"])
-    run_cmd(["../../SDDS/bin/Linux-x86_64/replaceText",
-             "src/meta.yaml.template", "src/meta.yaml",
-             "-orig=<VERSION>,<LIBGCC>", f"-repl={version},- libgcc-ng"])
-    run_cmd(["../../SDDS/bin/Linux-x86_64/replaceText",
-             "src/conda_build_config.yaml.template", "src/conda_build_config.yaml",
-             "-orig=<VER37>", "-repl=- 3.7"])
+    replace_text("src/setup.py.template", "src/setup.py",
+                 {"<VERSION>": version, "<PYFILES>": files_str})
+    replace_text("src/meta.yaml.template", "src/meta.yaml",
+                 {"<VERSION>": version, "<LIBGCC>": "- libgcc-ng"})
+    replace_text("src/conda_build_config.yaml.template", "src/conda_build_config.yaml",
+                 {"<VER37>": "- 3.7"})
     print("\nManually run from Anaconda directory:")
     print(f"{binDir}/conda-build . --package-format=.conda ; rm -f src/conda_build_config.yaml src/meta.yaml src/setup.py src/sdds/sdds.py {get_glob_files()}")
 elif system == "Darwin" and machine == "x86_64":
-    run_cmd(["../../SDDS/bin/Darwin-x86_64/replaceText",
-             "src/setup.py.template", "src/setup.py",
-             "-orig=<VERSION>,<PYFILES>", f"-repl={version},{files_str}"])
-    run_cmd(["../../SDDS/bin/Darwin-x86_64/replaceText",
-             "src/meta.yaml.template", "src/meta.yaml",
-             "-orig=<VERSION>,<LIBGCC>", f"-repl={version},"])
-    run_cmd(["../../SDDS/bin/Darwin-x86_64/replaceText",
-             "src/conda_build_config.yaml.template", "src/conda_build_config.yaml",
-             "-orig=<VER37>", "-repl=- 3.7"])
+    replace_text("src/setup.py.template", "src/setup.py",
+                 {"<VERSION>": version, "<PYFILES>": files_str})
+    replace_text("src/meta.yaml.template", "src/meta.yaml",
+                 {"<VERSION>": version, "<LIBGCC>": ""})
+    replace_text("src/conda_build_config.yaml.template", "src/conda_build_config.yaml",
+                 {"<VER37>": "- 3.7"})
     print("\nManually run from Anaconda directory:")
     print(f"{binDir}/conda-build . --package-format=.conda ; rm -f src/conda_build_config.yaml src/meta.yaml src/setup.py src/sdds/sdds.py {get_glob_files()}")
 elif system == "Darwin" and machine == "arm64":
-    run_cmd(["../../SDDS/bin/Darwin-arm64/replaceText",
-             "src/setup.py.template", "src/setup.py",
-             "-orig=<VERSION>,<PYFILES>", f"-repl={version},{files_str}"])
-    run_cmd(["../../SDDS/bin/Darwin-arm64/replaceText",
-             "src/meta.yaml.template", "src/meta.yaml",
-             "-orig=<VERSION>,<LIBGCC>", f"-repl={version},"])
-    run_cmd(["../../SDDS/bin/Darwin-arm64/replaceText",
-             "src/conda_build_config.yaml.template", "src/conda_build_config.yaml",
-             "-orig=<VER37>", "-repl="])
+    replace_text("src/setup.py.template", "src/setup.py",
+                 {"<VERSION>": version, "<PYFILES>": files_str})
+    replace_text("src/meta.yaml.template", "src/meta.yaml",
+                 {"<VERSION>": version, "<LIBGCC>": ""})
+    replace_text("src/conda_build_config.yaml.template", "src/conda_build_config.yaml",
+                 {"<VER37>": ""})
     print("\nManually run from Anaconda directory:")
     print(f"{binDir}/conda-build . --package-format=.conda ; rm -f src/conda_build_config.yaml src/meta.yaml src/setup.py src/sdds/sdds.py {get_glob_files()}")
 else:
-    run_cmd(["../../SDDS/bin/Windows-x86_64/replaceText",
-             "src/setup.py.template", "src/setup.py",
-             "-orig=<VERSION>,<PYFILES>", f"-repl={version},({files_str})"])
-    run_cmd(["../../SDDS/bin/Windows-x86_64/replaceText",
-             "src/meta.yaml.template", "src/meta.yaml",
-             "-orig=<VERSION>,<LIBGCC>", f"-repl={version},"])
-    run_cmd(["../../SDDS/bin/Windows-x86_64/replaceText",
-             "src/conda_build_config.yaml.template", "src/conda_build_config.yaml",
-             "-orig=<VER37>", "-repl="])
+    replace_text("src/setup.py.template", "src/setup.py",
+                 {"<VERSION>": version, "<PYFILES>": files_str})
+    replace_text("src/meta.yaml.template", "src/meta.yaml",
+                 {"<VERSION>": version, "<LIBGCC>": ""})
+    replace_text("src/conda_build_config.yaml.template", "src/conda_build_config.yaml",
+                 {"<VER37>": ""})
     output = ""
     output += f"copy /Y src\\sdds\\sddsdata14.pyd src\\sdds\\sddsdata.pyd & {binDir}/conda-build . --package-format=.conda --python=3.14 & "
     output += (
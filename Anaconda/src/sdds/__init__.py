@@ -1,4 +1,4 @@
-from .sdds import SDDS, load, loadSparse, loadLastRows, save, sdds_data_type_to_string, sdds_data_type_to_short_string, sdds_short_string_to_data_type, demo1, demo2, demo3, demo4, demo5, demo6, read, write
+from .sdds import SDDS, load, loadSparse, loadLastRows, clearLoadCache, save, sdds_data_type_to_string, sdds_data_type_to_short_string, sdds_short_string_to_data_type, demo1, demo2, demo3, demo4, demo5, demo6, read, readPages, write
 
 
 # Expose all constants from sdds.py
@@ -37,6 +37,7 @@ __all__ = [
     "load",
     "loadSparse",
     "loadLastRows",
+    "clearLoadCache",
     "save",
     "sdds_data_type_to_string",
     "sdds_data_type_to_short_string",
@@ -48,6 +49,7 @@ __all__ = [
     "demo5",
     "demo6",
     "read",
+    "readPages",
     "write",
     "SDDS_VERBOSE_PrintErrors",
     "SDDS_EXIT_PrintErrors",
@@ -45,25 +45,31 @@ def find_first_existing_in_dirs(file_names, directories):
                 return candidate
     return None
 
-def run_replace_text(replace_path, version, files_str):
-    cmd = [
-        replace_path,
-        "src/pyproject.toml.template",
-        "src/pyproject.toml",
-        "-orig=<PYVERSION>,<PYREQPYVER>,<PYFILES>",
-        f"-replacement={version},>=3.7,{files_str}"
-    ]
-    subprocess.run(cmd, check=True)
+# Matches template placeholders such as <PYVERSION>
+PLACEHOLDER_PATTERN = re.compile(r"<\w+>")
+
+def replace_text(template, output, replacements):
+    # Fill in every placeholder in a single scan. Keys are the full placeholders, as in
+    # Anaconda/build.py; unknown placeholders are left untouched
+    with open(template) as f:
+        data = f.read()
+    data = PLACEHOLDER_PATTERN.sub(lambda m: replacements.get(m.group(0), m.group(0)), data)
+    with open(output, "w") as f:
+        f.write(data)
+
+def run_replace_text(version, files_str):
+    replace_text("src/pyproject.toml.template", "src/pyproject.toml",
+                 {"<PYVERSION>": version, "<PYREQPYVER>": ">=3.7", "<PYFILES>": files_str})
 
 def main():
     version = "5.7.6"
-    # Copy sdds.py
-    shutil.copy(os.path.join("..", "sdds", "sdds.py"),
-                os.path.join("src", "sdds", "sdds.py"))
-    shutil.copy(os.path.join("..", "LICENSE"),
-                os.path.join("src", "LICENSE"))
-    shutil.copy(os.path.join("..", "README.md"),
-                os.path.join("src", "README.md"))
+    # Stage sdds.py, the license and the readme
+    for src, dst in [
+        (os.path.join("..", "sdds", "sdds.py"), os.path.join("src", "sdds", "sdds.py")),
+        (os.path.join("..", "LICENSE"), os.path.join("src", "LICENSE")),
+        (os.path.join("..", "README.md"), os.path.join("src", "README.md")),
+    ]:
+        shutil.copyfile(src, dst)
 
     current_os = sys.platform
     machine = platform.machine()
@@ -124,8 +130,7 @@ def main():
         run_optional_command([patchelf, "--replace-needed", "libgsl.so.23", "libgsl.so.27", sdds_so])
         run_optional_command([patchelf, "--replace-needed", "/lib64/libgslcblas.so.0", "libgslcblas.so.0", sdds_so])
 
-        replace_path = os.path.join("..", "..", "SDDS", "bin", "Linux-x86_64", "replaceText")
-        files_str = '("sdds.py", "sddsdata.so", "libgsl.so.27", "libgslcblas.so.0")'
+        files_str = '"sdds.py", "sddsdata.so", "libgsl.so.27", "libgslcblas.so.0"'
 
     elif current_os == "darwin" and machine in ("x86_64", "arm64"):
         home_dir = os.path.expanduser("~")
@@ -135,8 +140,7 @@ def main():
         lib_dir = "Darwin-x86_64" if machine == "x86_64" else "Darwin-arm64"
         shutil.copy(os.path.join("..", "lib", lib_dir, "libsddsdata.so"),
                     os.path.join("src", "sdds", "sddsdata.so"))
-        replace_path = os.path.join("..", "..", "SDDS", "bin", lib_dir, "replaceText")
-        files_str = '("sdds.py", "sddsdata.so")'
+        files_str = '"sdds.py", "sddsdata.so"'
 
     elif current_os.startswith("win"):
         home_dir = os.environ.get("USERPROFILE")
@@ -178,16 +182,15 @@ def main():
         for dll in dlls:
             shutil.copy(os.path.join("..", "..", "SDDS", "bin", "Windows-x86_64", dll),
                         os.path.join("src", "sdds", dll))
-        replace_path = os.path.join("..", "..", "SDDS", "bin", "Windows-x86_64", "replaceText")
         files_list = ["sdds.py", "sddsdata.pyd", *sdds_pyds, *dlls]
-        files_str = "(" + ", ".join(f'\"{name}\"' for name in files_list) + ")"
+        files_str = ", ".join(f'"{name}"' for name in files_list)
 
     else:
         print("Unsupported platform")
         sys.exit(1)
 
-    # Run the replaceText command
-    run_replace_text(replace_path, version, files_str)
+    # Fill in the pyproject.toml template
+    run_replace_text(version, files_str)
 
     os.chdir("src")
     print("Building sdds PyPI Package for Python")
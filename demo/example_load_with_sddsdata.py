@@ -49,69 +49,80 @@ def main():
     if description[1]:
         print(f"SDDS file description contents: {description[1]}")
 
-    # Print parameter definitions
+    # Fetch each definition and its datatype string once; they do not change while the file is open
     parameterNames = GetParameterNames(fileIndex)
+    arrayNames = GetArrayNames(fileIndex)
+    columnNames = GetColumnNames(fileIndex)
+    parameterDefinitions = {name: GetParameterDefinition(fileIndex, name) for name in parameterNames}
+    arrayDefinitions = {name: GetArrayDefinition(fileIndex, name) for name in arrayNames}
+    columnDefinitions = {name: GetColumnDefinition(fileIndex, name) for name in columnNames}
+    parameterTypes = {name: sdds.sdds_data_type_to_string(d[4]) for name, d in parameterDefinitions.items()}
+    arrayTypes = {name: sdds.sdds_data_type_to_string(d[5]) for name, d in arrayDefinitions.items()}
+    columnTypes = {name: sdds.sdds_data_type_to_string(d[4]) for name, d in columnDefinitions.items()}
+
+    # Print parameter definitions
     if parameterNames:
         print("\nParameters:")
         for name in parameterNames:
-            definition = GetParameterDefinition(fileIndex, name)
-            print(f"  {name}")
-            print(f"    Datatype: {sdds.sdds_data_type_to_string(definition[4])}", end="")
+            definition = parameterDefinitions[name]
+            parts = [f"    Datatype: {parameterTypes[name]}"]
             if definition[1]:
-                print(f", Units: {definition[1]}", end="")
+                parts.append(f"Units: {definition[1]}")
             if definition[2]:
-                print(f", Description: {definition[2]}", end="")
-            print("")
+                parts.append(f"Description: {definition[2]}")
+            print(f"  {name}\n" + ", ".join(parts))
 
     # Print array definitions
-    arrayNames = GetArrayNames(fileIndex)
     if arrayNames:
         print("\nArrays:")
         for name in arrayNames:
-            definition = GetArrayDefinition(fileIndex, name)
-            print(f"  {name}")
-            print(f"    Datatype: {sdds.sdds_data_type_to_string(definition[5])}, Dimensions: {definition[7]}", end="")
+            definition = arrayDefinitions[name]
+            parts = [f"    Datatype: {arrayTypes[name]}", f"Dimensions: {definition[7]}"]
             if definition[1]:
-                print(f", Units: {definition[1]}", end="")
+                parts.append(f"Units: {definition[1]}")
             if definition[2]:
-                print(f", Description: {definition[2]}", end="")
-            print("")
+                parts.append(f"Description: {definition[2]}")
+            print(f"  {name}\n" + ", ".join(parts))
 
     # Print column definitions
-    columnNames = GetColumnNames(fileIndex)
     if columnNames:
         print("\nColumns:")
         for name in columnNames:
-            definition = GetColumnDefinition(fileIndex, name)
-            print(f"  {name}")
-            print(f"    Datatype: {sdds.sdds_data_type_to_string(definition[4])}", end="")
+            definition = columnDefinitions[name]
+            parts = [f"    Datatype: {columnTypes[name]}"]
             if definition[1]:
-                print(f", Units: {definition[1]}", end="")
+                parts.append(f"Units: {definition[1]}")
             if definition[2]:
-                print(f", Description: {definition[2]}", end="")
-            print("")
+                parts.append(f"Description: {definition[2]}")
+            print(f"  {name}\n" + ", ".join(parts))
 
-    # Read pages and display parameter, array, and column data
+    # Read pages and display parameter, array, and column data.
+    # Data is fetched by integer index so each page avoids the name to index lookup.
     page = ReadPage(fileIndex)
     while page > 0:
-        print(f"\nPage: {page}")
+        # Collect the page output and write it with a single print call
+        lines = [f"\nPage: {page}"]
 
         # Display parameter data for the current page
-        for name in parameterNames:
-            value = GetParameter(fileIndex, name)
-            print(f"  Parameter '{name}': {value}")
+        for i, name in enumerate(parameterNames):
+            value = GetParameter(fileIndex, i)
+            lines.append(f"  Parameter '{name}': {value}")
 
         # Display array data for the current page
-        for name in arrayNames:
-            data = GetArray(fileIndex, name)
-            dimensions = GetArrayDimensions(fileIndex, name)
-            print(f"  Array '{name}': {data}, Dimensions: {dimensions}")
-
-        # Display column data for the current page
-        for name in columnNames:
-            data = GetColumn(fileIndex, name)
-            print(f"  Column '{name}': {data}")
-
+        for i, name in enumerate(arrayNames):
+            data = GetArray(fileIndex, i)
+            dimensions = GetArrayDimensions(fileIndex, i)
+            lines.append(f"  Array '{name}': {data}, Dimensions: {dimensions}")
+
+        # Display column data for the current page, fetching every column in one call
+        if columnNames:
+            columns = GetColumns(fileIndex)
+            if columns is None:
+                raise ValueError(f"Failed to get column data for page {page}.")
+            for name, data in zip(columnNames, columns):
+                lines.append(f"  Column '{name}': {data}")
+
+        print("\n".join(lines))
         page = ReadPage(fileIndex)
 
     # Terminate the SDDS dataset
@@ -79,124 +79,93 @@ def main():
     sdds_obj.defineSimpleArray("array_character", sdds.SDDS_CHARACTER, 1)
     
     # -------------------------
-    # Populate Page 1 with Data
+    # Populate Pages 1 and 2 with Data
     # -------------------------
     
-    # Set parameter values for Page 1
-    sdds_obj.setParameterValue("param_short", 1, page=1)
-    sdds_obj.setParameterValue("param_ushort", 2, page=1)
-    sdds_obj.setParameterValue("param_long", 3, page=1)
-    sdds_obj.setParameterValue("param_ulong", 4, page=1)
-    sdds_obj.setParameterValue("param_long64", 5, page=1)
-    sdds_obj.setParameterValue("param_ulong64", 6, page=1)
-    sdds_obj.setParameterValue("param_float", 7.7, page=1)
-    sdds_obj.setParameterValue("param_double", 8.8, page=1)
-    sdds_obj.setParameterValue("param_string", "Page 1 String", page=1)
-    sdds_obj.setParameterValue("param_character", "A", page=1)
-    
-    # Define column data for Page 1
-    columns_page1 = {
-        "col_short": [1, 2],
-        "col_ushort": [3, 4],
-        "col_long": [5, 6],
-        "col_ulong": [7, 8],
-        "col_long64": [9, 10],
-        "col_ulong64": [11, 12],
-        "col_float": [13.1, 14.2],
-        "col_double": [15.3, 16.4],
-        "col_string": ["String1", "String2"],
-        "col_character": ["X", "Y"],
-    }
-    
-    # Populate column data for Page 1
-    for col_name, col_data in columns_page1.items():
-        sdds_obj.setColumnValueList(col_name, col_data, page=1)
-    
-    # Define array data for Page 1 (one-dimensional arrays)
-    arrays_page1_1d = {
-        "array_short": [1, 2, 3],
-        "array_ushort": [4, 5, 6],
-        "array_ulong": [10, 11, 12],
-        "array_long64": [13, 14, 15],
-        "array_ulong64": [16, 17, 18],
-        "array_float": [19.1, 20.2, 21.3],
-        "array_double": [22.4, 23.5, 24.6],
-        "array_string": ["Array1", "Array2", "Array3"],
-        "array_character": ["M", "N", "O"],
-    }
-    
-    # Populate one-dimensional array data for Page 1
-    for array_name, array_data in arrays_page1_1d.items():
-        sdds_obj.setArrayValueList(array_name, array_data, [3], page=1)
-        
-    # Define array data for Page 1 (two-dimensional array)
-    arrays_page1_2d = {
-        "array_long": [7, 8, 9, 17, 18, 19],
-    }
-    
-    # Populate two-dimensional array data for Page 1
-    for array_name, array_data in arrays_page1_2d.items():
-        sdds_obj.setArrayValueList(array_name, array_data, [2, 3], page=1)
-    
-    # -------------------------
-    # Populate Page 2 with Data
-    # -------------------------
-    
-    # Set parameter values for Page 2
-    sdds_obj.setParameterValue("param_short", 10, page=2)
-    sdds_obj.setParameterValue("param_ushort", 20, page=2)
-    sdds_obj.setParameterValue("param_long", 30, page=2)
-    sdds_obj.setParameterValue("param_ulong", 40, page=2)
-    sdds_obj.setParameterValue("param_long64", 50, page=2)
-    sdds_obj.setParameterValue("param_ulong64", 60, page=2)
-    sdds_obj.setParameterValue("param_float", 70.7, page=2)
-    sdds_obj.setParameterValue("param_double", 80.8, page=2)
-    sdds_obj.setParameterValue("param_string", "Page 2 String", page=2)
-    sdds_obj.setParameterValue("param_character", "B", page=2)
-    
-    # Define column data for Page 2
-    columns_page2 = {
-        "col_short": [21, 22],
-        "col_ushort": [23, 24],
-        "col_long": [25, 26],
-        "col_ulong": [27, 28],
-        "col_long64": [29, 30],
-        "col_ulong64": [31, 32],
-        "col_float": [33.1, 34.2],
-        "col_double": [35.3, 36.4],
-        "col_string": ["String3", "String4"],
-        "col_character": ["Z", "W"],
-    }
-    
-    # Populate column data for Page 2
-    for col_name, col_data in columns_page2.items():
-        sdds_obj.setColumnValueList(col_name, col_data, page=2)
-    
-    # Define array data for Page 2 (one-dimensional arrays)
-    arrays_page2_1d = {
-        "array_short": [101, 102, 103],
-        "array_ushort": [104, 105, 106],
-        "array_ulong": [110, 111, 112],
-        "array_long64": [113, 114, 115],
-        "array_ulong64": [116, 117, 118],
-        "array_float": [119.1, 120.2, 121.3],
-        "array_double": [122.4, 123.5, 124.6],
-        "array_string": ["Array4", "Array5", "Array6"],
-        "array_character": ["P", "Q", "R"],
-    }
-    
-    # Populate one-dimensional array data for Page 2
-    for array_name, array_data in arrays_page2_1d.items():
-        sdds_obj.setArrayValueList(array_name, array_data, [3], page=2)
-    
-    # Define array data for Page 2 (two-dimensional array)
-    arrays_page2_2d = {
-        "array_long": [107, 108, 109, 207, 208, 209],
-    }
+    # The parameter, column, and array values of each page.
+    # Array values are given as (values, dimensions) tuples.
+    pages = (
+        {
+            "parameters": {
+                "param_short": 1,
+                "param_ushort": 2,
+                "param_long": 3,
+                "param_ulong": 4,
+                "param_long64": 5,
+                "param_ulong64": 6,
+                "param_float": 7.7,
+                "param_double": 8.8,
+                "param_string": "Page 1 String",
+                "param_character": "A",
+            },
+            "columns": {
+                "col_short": [1, 2],
+                "col_ushort": [3, 4],
+                "col_long": [5, 6],
+                "col_ulong": [7, 8],
+                "col_long64": [9, 10],
+                "col_ulong64": [11, 12],
+                "col_float": [13.1, 14.2],
+                "col_double": [15.3, 16.4],
+                "col_string": ["String1", "String2"],
+                "col_character": ["X", "Y"],
+            },
+            "arrays": {
+                "array_short": ([1, 2, 3], [3]),
+                "array_ushort": ([4, 5, 6], [3]),
+                "array_long": ([7, 8, 9, 17, 18, 19], [2, 3]),
+                "array_ulong": ([10, 11, 12], [3]),
+                "array_long64": ([13, 14, 15], [3]),
+                "array_ulong64": ([16, 17, 18], [3]),
+                "array_float": ([19.1, 20.2, 21.3], [3]),
+                "array_double": ([22.4, 23.5, 24.6], [3]),
+                "array_string": (["Array1", "Array2", "Array3"], [3]),
+                "array_character": (["M", "N", "O"], [3]),
+            },
+        },
+        {
+            "parameters": {
+                "param_short": 10,
+                "param_ushort": 20,
+                "param_long": 30,
+                "param_ulong": 40,
+                "param_long64": 50,
+                "param_ulong64": 60,
+                "param_float": 70.7,
+                "param_double": 80.8,
+                "param_string": "Page 2 String",
+                "param_character": "B",
+            },
+            "columns": {
+                "col_short": [21, 22],
+                "col_ushort": [23, 24],
+                "col_long": [25, 26],
+                "col_ulong": [27, 28],
+                "col_long64": [29, 30],
+                "col_ulong64": [31, 32],
+                "col_float": [33.1, 34.2],
+                "col_double": [35.3, 36.4],
+                "col_string": ["String3", "String4"],
+                "col_character": ["Z", "W"],
+            },
+            "arrays": {
+                "array_short": ([101, 102, 103], [3]),
+                "array_ushort": ([104, 105, 106], [3]),
+                "array_long": ([107, 108, 109, 207, 208, 209], [2, 3]),
+                "array_ulong": ([110, 111, 112], [3]),
+                "array_long64": ([113, 114, 115], [3]),
+                "array_ulong64": ([116, 117, 118], [3]),
+                "array_float": ([119.1, 120.2, 121.3], [3]),
+                "array_double": ([122.4, 123.5, 124.6], [3]),
+                "array_string": (["Array4", "Array5", "Array6"], [3]),
+                "array_character": (["P", "Q", "R"], [3]),
+            },
+        },
+    )
     
-    # Populate two-dimensional array data for Page 2
-    for array_name, array_data in arrays_page2_2d.items():
-        sdds_obj.setArrayValueList(array_name, array_data, [2, 3], page=2)
+    # Set every page through the same call
+    for page, values in enumerate(pages, start=1):
+        sdds_obj.setPage(page, **values)
     
     # -------------------------
     # Save the SDDS File
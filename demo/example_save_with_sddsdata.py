@@ -32,178 +32,193 @@ try:
 except:
     from sddsdata import *
 import time
+import array
+
+# Definitions written by main(). They are constant, so build them once at import time.
+_PARAMETER_DEFINITIONS = (
+    ("param_short", sdds.SDDS_SHORT),
+    ("param_ushort", sdds.SDDS_USHORT),
+    ("param_long", sdds.SDDS_LONG),
+    ("param_ulong", sdds.SDDS_ULONG),
+    ("param_long64", sdds.SDDS_LONG64),
+    ("param_ulong64", sdds.SDDS_ULONG64),
+    ("param_float", sdds.SDDS_FLOAT),
+    ("param_double", sdds.SDDS_DOUBLE),
+    ("param_string", sdds.SDDS_STRING),
+    ("param_character", sdds.SDDS_CHARACTER),
+)
+
+# For real data, prefer SDDS_FLOAT over SDDS_DOUBLE when single precision is enough:
+# it halves the bytes written and read for every value in binary files.
+_COLUMN_DEFINITIONS = (
+    ("col_short", sdds.SDDS_SHORT),
+    ("col_ushort", sdds.SDDS_USHORT),
+    ("col_long", sdds.SDDS_LONG),
+    ("col_ulong", sdds.SDDS_ULONG),
+    ("col_long64", sdds.SDDS_LONG64),
+    ("col_ulong64", sdds.SDDS_ULONG64),
+    ("col_float", sdds.SDDS_FLOAT),
+    ("col_double", sdds.SDDS_DOUBLE),
+    ("col_string", sdds.SDDS_STRING),
+    ("col_character", sdds.SDDS_CHARACTER),
+)
+
+_ARRAY_DEFINITIONS = (
+    ("array_short", sdds.SDDS_SHORT, 1),
+    ("array_ushort", sdds.SDDS_USHORT, 1),
+    ("array_long", sdds.SDDS_LONG, 2),
+    ("array_ulong", sdds.SDDS_ULONG, 1),
+    ("array_long64", sdds.SDDS_LONG64, 1),
+    ("array_ulong64", sdds.SDDS_ULONG64, 1),
+    ("array_float", sdds.SDDS_FLOAT, 1),
+    ("array_double", sdds.SDDS_DOUBLE, 1),
+    ("array_string", sdds.SDDS_STRING, 1),
+    ("array_character", sdds.SDDS_CHARACTER, 1),
+)
+
+def make_page_writer(fileIndex):
+    """
+    Returns a function that writes one page of the dataset defined by the tables above.
+
+    The schema is fixed, so the parameter order and the array name to index table are
+    built here once. Each page then only passes its values to sddsdata, setting all
+    parameters with one call and the arrays by index.
+    """
+    parameterNames = [name for name, dtype in _PARAMETER_DEFINITIONS]
+    arrayIndex = {name: i for i, (name, dtype, dimensions) in enumerate(_ARRAY_DEFINITIONS)}
+
+    def write_page(page, parameters, columns, arrays):
+        rows = len(next(iter(columns.values()))) if columns else 0
+        if StartPage(fileIndex, rows) != 1:
+            raise ValueError(f"Failed to start page {page}.")
+        if SetParameters(fileIndex, [parameters[name] for name in parameterNames]) != 1:
+            raise ValueError("Failed to set parameter values.")
+        if SetColumnsFromDict(fileIndex, columns) != 1:
+            raise ValueError("Failed to set column values.")
+        for name, (data, dims) in arrays.items():
+            if SetArray(fileIndex, arrayIndex[name], data, dims) != 1:
+                raise ValueError(f"Failed to set array {name}.")
+        if WritePage(fileIndex) != 1:
+            raise ValueError(f"Failed to write page {page}.")
+
+    return write_page
 
 def main():
     fileIndex = 0  # Dataset index for this SDDS file
     output_file = "output_all_data_types.sdds"
 
-    # Initialize SDDS output file
-    if InitializeOutput(fileIndex, sdds.SDDS_ASCII, 1, "Example output file for demonstration purposes", "Includes parameters, columns, and arrays for every supported datatype.", output_file) != 1:
+    # Initialize SDDS output file in binary mode (for ASCII use SDDS_ASCII)
+    if InitializeOutput(fileIndex, sdds.SDDS_BINARY, 1, "Example output file for demonstration purposes", "Includes parameters, columns, and arrays for every supported datatype.", output_file) != 1:
         raise ValueError("Failed to initialize SDDS output file.")
 
-    # Define parameters
-    for name, dtype in [
-        ("param_short", sdds.SDDS_SHORT),
-        ("param_ushort", sdds.SDDS_USHORT),
-        ("param_long", sdds.SDDS_LONG),
-        ("param_ulong", sdds.SDDS_ULONG),
-        ("param_long64", sdds.SDDS_LONG64),
-        ("param_ulong64", sdds.SDDS_ULONG64),
-        ("param_float", sdds.SDDS_FLOAT),
-        ("param_double", sdds.SDDS_DOUBLE),
-        ("param_string", sdds.SDDS_STRING),
-        ("param_character", sdds.SDDS_CHARACTER),
-    ]:
-        if DefineSimpleParameter(fileIndex, name, "", dtype) != 1:
-            raise ValueError(f"Failed to define parameter {name}.")
-
-    # Define columns
-    for name, dtype in [
-        ("col_short", sdds.SDDS_SHORT),
-        ("col_ushort", sdds.SDDS_USHORT),
-        ("col_long", sdds.SDDS_LONG),
-        ("col_ulong", sdds.SDDS_ULONG),
-        ("col_long64", sdds.SDDS_LONG64),
-        ("col_ulong64", sdds.SDDS_ULONG64),
-        ("col_float", sdds.SDDS_FLOAT),
-        ("col_double", sdds.SDDS_DOUBLE),
-        ("col_string", sdds.SDDS_STRING),
-        ("col_character", sdds.SDDS_CHARACTER),
-    ]:
-        if DefineSimpleColumn(fileIndex, name, "", dtype) != 1:
-            raise ValueError(f"Failed to define column {name}.")
-
-    # Define arrays
-    for name, dtype, dimensions in [
-        ("array_short", sdds.SDDS_SHORT, 1),
-        ("array_ushort", sdds.SDDS_USHORT, 1),
-        ("array_long", sdds.SDDS_LONG, 2),
-        ("array_ulong", sdds.SDDS_ULONG, 1),
-        ("array_long64", sdds.SDDS_LONG64, 1),
-        ("array_ulong64", sdds.SDDS_ULONG64, 1),
-        ("array_float", sdds.SDDS_FLOAT, 1),
-        ("array_double", sdds.SDDS_DOUBLE, 1),
-        ("array_string", sdds.SDDS_STRING, 1),
-        ("array_character", sdds.SDDS_CHARACTER, 1),
-    ]:
-        if DefineSimpleArray(fileIndex, name, "", dtype, dimensions) != 1:
-            raise ValueError(f"Failed to define array {name}.")
+    # Use a 1 MB output buffer so the small pages below reach the file together
+    if SetOutputBufferSize(fileIndex, 1 << 20) != 1:
+        raise ValueError("Failed to set the output buffer size.")
+
+    # Define all parameters with a single call
+    names, dtypes = zip(*_PARAMETER_DEFINITIONS)
+    if DefineSimpleParameters(fileIndex, list(names), [""] * len(names), list(dtypes)) != 1:
+        raise ValueError("Failed to define parameters.")
+
+    # Define all columns with a single call
+    names, dtypes = zip(*_COLUMN_DEFINITIONS)
+    if DefineSimpleColumns(fileIndex, list(names), [""] * len(names), list(dtypes)) != 1:
+        raise ValueError("Failed to define columns.")
+
+    # Define all arrays with a single call
+    names, dtypes, dimensions = zip(*_ARRAY_DEFINITIONS)
+    if DefineSimpleArrays(fileIndex, list(names), [""] * len(names), list(dtypes), list(dimensions)) != 1:
+        raise ValueError("Failed to define arrays.")
 
     # Write layout
     if WriteLayout(fileIndex) != 1:
         raise ValueError("Failed to write layout.")
 
-    # Populate Page 1
-    if StartPage(fileIndex, 2) != 1:
-        raise ValueError("Failed to start page 1.")
-
-    # Set parameter values
-    for name, data in [
-        ("param_short", 1),
-        ("param_ushort", 2),
-        ("param_long", 3),
-        ("param_ulong", 4),
-        ("param_long64", 5),
-        ("param_ulong64", 6),
-        ("param_float", 7.7),
-        ("param_double", 8.8),
-        ("param_string", "Page 1 String"),
-        ("param_character", "A"),
-    ]:
-        if SetParameter(fileIndex, name, data) != 1:
-            raise ValueError(f"Failed to set parameter {name}.")
-
-    # Set column values
-    for name, data, in [
-        ("col_short", [1, 2]),
-        ("col_ushort", [3, 4]),
-        ("col_long", [5, 6]),
-        ("col_ulong", [7, 8]),
-        ("col_long64", [9, 10]),
-        ("col_ulong64", [11, 12]),
-        ("col_float", [13.1, 14.2]),
-        ("col_double", [15.3, 16.4]),
-        ("col_string", ["String1", "String2"]),
-        ("col_character", ["X", "Y"]),
-    ]:
-        if SetColumn(fileIndex, name, data) != 1:
-            raise ValueError(f"Failed to set column {name}.")
-
-    # Set array values
-    for name, data, dims in [
-        ("array_short", [1, 2, 3], [3]),
-        ("array_ushort", [4, 5, 6], [3]),
-        ("array_long", [7, 8, 9, 17, 18, 19], [2, 3]),
-        ("array_ulong", [10, 11, 12], [3]),
-        ("array_long64", [13, 14, 15], [3]),
-        ("array_ulong64", [16, 17, 18], [3]),
-        ("array_float", [19.1, 20.2, 21.3], [3]),
-        ("array_double", [22.4, 23.5, 24.6], [3]),
-        ("array_string", ["Array1", "Array2", "Array3"], [3]),
-        ("array_character", ["M", "N", "O"], [3]),
-    ]:
-        if SetArray(fileIndex, name, data, dims) != 1:
-            raise ValueError(f"Failed to set array {name}.")
-
-    # Write page
-    if WritePage(fileIndex) != 1:
-        raise ValueError("Failed to write page 1.")
+    # Build the page writer once the layout is fixed
+    write_page = make_page_writer(fileIndex)
+
+    # Populate Page 1. Numeric columns and arrays are given as typed arrays so they
+    # are copied without converting each element; arrays are (values, dimensions).
+    write_page(
+        1,
+        {
+            "param_short": 1,
+            "param_ushort": 2,
+            "param_long": 3,
+            "param_ulong": 4,
+            "param_long64": 5,
+            "param_ulong64": 6,
+            "param_float": 7.7,
+            "param_double": 8.8,
+            "param_string": "Page 1 String",
+            "param_character": "A",
+        },
+        {
+            "col_short": array.array("h", [1, 2]),
+            "col_ushort": array.array("H", [3, 4]),
+            "col_long": array.array("i", [5, 6]),
+            "col_ulong": array.array("I", [7, 8]),
+            "col_long64": array.array("q", [9, 10]),
+            "col_ulong64": array.array("Q", [11, 12]),
+            "col_float": array.array("f", [13.1, 14.2]),
+            "col_double": array.array("d", [15.3, 16.4]),
+            "col_string": ["String1", "String2"],
+            "col_character": ["X", "Y"],
+        },
+        {
+            "array_short": (array.array("h", [1, 2, 3]), [3]),
+            "array_ushort": (array.array("H", [4, 5, 6]), [3]),
+            "array_long": (array.array("i", [7, 8, 9, 17, 18, 19]), [2, 3]),
+            "array_ulong": (array.array("I", [10, 11, 12]), [3]),
+            "array_long64": (array.array("q", [13, 14, 15]), [3]),
+            "array_ulong64": (array.array("Q", [16, 17, 18]), [3]),
+            "array_float": (array.array("f", [19.1, 20.2, 21.3]), [3]),
+            "array_double": (array.array("d", [22.4, 23.5, 24.6]), [3]),
+            "array_string": (["Array1", "Array2", "Array3"], [3]),
+            "array_character": (["M", "N", "O"], [3]),
+        },
+    )
 
     # Populate Page 2
-    if StartPage(fileIndex, 2) != 1:
-        raise ValueError("Failed to start page 2.")
-
-    # Set parameter values
-    for name, data in [
-        ("param_short", 10),
-        ("param_ushort", 20),
-        ("param_long", 30),
-        ("param_ulong", 40),
-        ("param_long64", 50),
-        ("param_ulong64", 60),
-        ("param_float", 70.7),
-        ("param_double", 80.8),
-        ("param_string", "Page 2 String"),
-        ("param_character", "B"),
-    ]:
-        if SetParameter(fileIndex, name, data) != 1:
-            raise ValueError(f"Failed to set parameter {name}.")
-
-    # Set column values
-    for name, data, in [
-        ("col_short", [21, 22]),
-        ("col_ushort", [23, 24]),
-        ("col_long", [25, 26]),
-        ("col_ulong", [27, 28]),
-        ("col_long64", [29, 30]),
-        ("col_ulong64", [31, 32]),
-        ("col_float", [33.1, 34.2]),
-        ("col_double", [35.3, 36.4]),
-        ("col_string", ["String3", "String4"]),
-        ("col_character", ["Z", "W"]),
-    ]:
-        if SetColumn(fileIndex, name, data) != 1:
-            raise ValueError(f"Failed to set column {name}.")
-
-    # Set array values
-    for name, data, dims in [
-        ("array_short", [101, 102, 103], [3]),
-        ("array_ushort", [104, 105, 106], [3]),
-        ("array_long", [107, 108, 109, 207, 208, 209], [2, 3]),
-        ("array_ulong", [110, 111, 112], [3]),
-        ("array_long64", [113, 114, 115], [3]),
-        ("array_ulong64", [116, 117, 118], [3]),
-        ("array_float", [119.1, 120.2, 121.3], [3]),
-        ("array_double", [122.4, 123.5, 124.6], [3]),
-        ("array_string", ["Array4", "Array5", "Array6"], [3]),
-        ("array_character", ["P", "Q", "R"], [3]),
-    ]:
-        if SetArray(fileIndex, name, data, dims) != 1:
-            raise ValueError(f"Failed to set array {name}.")
-
-    # Write page
-    if WritePage(fileIndex) != 1:
-        raise ValueError("Failed to write page 1.")
+    write_page(
+        2,
+        {
+            "param_short": 10,
+            "param_ushort": 20,
+            "param_long": 30,
+            "param_ulong": 40,
+            "param_long64": 50,
+            "param_ulong64": 60,
+            "param_float": 70.7,
+            "param_double": 80.8,
+            "param_string": "Page 2 String",
+            "param_character": "B",
+        },
+        {
+            "col_short": array.array("h", [21, 22]),
+            "col_ushort": array.array("H", [23, 24]),
+            "col_long": array.array("i", [25, 26]),
+            "col_ulong": array.array("I", [27, 28]),
+            "col_long64": array.array("q", [29, 30]),
+            "col_ulong64": array.array("Q", [31, 32]),
+            "col_float": array.array("f", [33.1, 34.2]),
+            "col_double": array.array("d", [35.3, 36.4]),
+            "col_string": ["String3", "String4"],
+            "col_character": ["Z", "W"],
+        },
+        {
+            "array_short": (array.array("h", [101, 102, 103]), [3]),
+            "array_ushort": (array.array("H", [104, 105, 106]), [3]),
+            "array_long": (array.array("i", [107, 108, 109, 207, 208, 209]), [2, 3]),
+            "array_ulong": (array.array("I", [110, 111, 112]), [3]),
+            "array_long64": (array.array("q", [113, 114, 115]), [3]),
+            "array_ulong64": (array.array("Q", [116, 117, 118]), [3]),
+            "array_float": (array.array("f", [119.1, 120.2, 121.3]), [3]),
+            "array_double": (array.array("d", [122.4, 123.5, 124.6]), [3]),
+            "array_string": (["Array4", "Array5", "Array6"], [3]),
+            "array_character": (["P", "Q", "R"], [3]),
+        },
+    )
 
     # Terminate SDDS dataset
     if Terminate(fileIndex) != 1:
@@ -9,6 +9,9 @@ Dependencies:
     sddsdata module
 """
 
+import array
+import functools
+import heapq
 import importlib
 import os
 import sys
@@ -38,10 +41,120 @@ def _load_sddsdata_module():
 
 sddsdata = _load_sddsdata_module()
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from typing import Optional, Any
 
 
+class _Description:
+    """
+    Description text and contents of an SDDS object.
+
+    The values are held in slots and read by name, but the object still behaves like the
+    [text, contents] list it replaces: it can be indexed, assigned by index, and unpacked.
+
+    Attributes:
+        text (str): Description text.
+        contents (str): Description contents.
+    """
+
+    __slots__ = ("text", "contents")
+
+    def __init__(self, text="", contents=""):
+        self.text = text
+        self.contents = contents
+
+    def __getitem__(self, i):
+        return (self.text, self.contents)[i]
+
+    def __setitem__(self, i, value):
+        if i in (0, -2):
+            self.text = value
+        elif i in (1, -1):
+            self.contents = value
+        else:
+            raise IndexError("description index out of range")
+
+    def __iter__(self):
+        return iter((self.text, self.contents))
+
+    def __len__(self):
+        return 2
+
+    def __eq__(self, other):
+        if isinstance(other, (_Description, list, tuple)):
+            return [self.text, self.contents] == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr([self.text, self.contents])
+
+
+def _findIndex(names, indexes, name):
+    """
+    Returns the index of a name in a list of names, or None if it is not in the list.
+
+    Args:
+        names (list): Parameter, array, or column names.
+        indexes (dict): Name to index dictionary kept for `names`, updated in place.
+        name (str): Name to look up.
+
+    A hit in `indexes` is checked against `names`, and a miss or a stale entry rebuilds
+    the dictionary, so assigning or editing the public name lists directly stays safe.
+    """
+    i = indexes.get(name)
+    if i is not None and i < len(names) and names[i] == name:
+        return i
+    indexes.clear()
+    for i, n in enumerate(names):
+        # Keep the first occurrence, as list.index does
+        indexes.setdefault(n, i)
+    return indexes.get(name)
+
+
+def _setCell(values, k, value, label="page"):
+    """
+    Sets values[k], appending the value when k is one past the end.
+
+    Args:
+        values (list): Per-page or per-row values of a parameter, array, or column.
+        k (int): 0-based page or row index.
+        value: Value to store.
+        label (str, optional): "page" or "row", used in the error message.
+
+    Raises:
+        Exception: If k is negative or more than one past the end.
+    """
+    n = len(values)
+    if 0 <= k < n:
+        values[k] = value
+    elif k == n:
+        values.append(value)
+    else:
+        msg = "Invalid " + label + " " + str(k + 1)
+        raise Exception(msg)
+
+
+def _getCell(values, k, label="page"):
+    """
+    Returns values[k], or an empty slice when k is one past the end.
+
+    Args:
+        values (list): Per-page or per-row values of a parameter, array, or column.
+        k (int): 0-based page or row index.
+        label (str, optional): "page" or "row", used in the error message.
+
+    Raises:
+        Exception: If k is negative or more than one past the end.
+    """
+    n = len(values)
+    if 0 <= k < n:
+        return values[k]
+    if k == n:
+        return values[k:]
+    msg = "Invalid " + label + " " + str(k + 1)
+    raise Exception(msg)
+
+
 class SDDS:
     """
     A class to represent and manipulate SDDS datasets.
@@ -51,7 +164,7 @@ class SDDS:
 
     Attributes:
         index (int): The index of the SDDS dataset (integer from 0 to 1000).
-        description (list): List containing the description text and contents of the SDDS file.
+        description (_Description): Description text and contents of the SDDS file, also indexable as [text, contents].
         parameterName (list): List of parameter names.
         arrayName (list): List of array names.
         columnName (list): List of column names.
@@ -65,6 +178,29 @@ class SDDS:
         mode (int): The data storage mode (`SDDS_ASCII` or `SDDS_BINARY`).
     """
 
+    # Instance attributes. Slots keep the objects small and their attribute access fast;
+    # attributes not listed here cannot be added to an instance.
+    __slots__ = (
+        "index",
+        "description",
+        "parameterName",
+        "arrayName",
+        "columnName",
+        "parameterDefinition",
+        "arrayDefinition",
+        "arrayDimensions",
+        "columnDefinition",
+        "parameterData",
+        "arrayData",
+        "columnData",
+        "mode",
+        "loaded_pages",
+        "_parameterIndex",
+        "_arrayIndex",
+        "_columnIndex",
+        "__weakref__",
+    )
+
     # Class constants for error printing modes
     SDDS_VERBOSE_PrintErrors = 1     # Verbose error printing mode
     SDDS_EXIT_PrintErrors = 2        # Exit on error printing mode
@@ -102,8 +238,30 @@ class SDDS:
     SDDS_ASCII = 2
     SDDS_FLUSH_TABLE = 1
 
-    _used_indices = set()  # Class-level attribute to track used indices
+    # array module type codes of the numeric data types, used by packColumnData.
+    # Indexed by type code; None marks the types that stay as lists.
+    _ARRAY_TYPECODES = (
+        None,  # unused
+        None,  # SDDS_LONGDOUBLE
+        "d",   # SDDS_DOUBLE
+        "f",   # SDDS_FLOAT
+        "q",   # SDDS_LONG64
+        "Q",   # SDDS_ULONG64
+        "i",   # SDDS_LONG
+        "I",   # SDDS_ULONG
+        "h",   # SDDS_SHORT
+        "H",   # SDDS_USHORT
+        None,  # SDDS_STRING
+        None,  # SDDS_CHARACTER
+    )
+
+    # Values given to new rows by setPageRowCount, indexed by type code.
+    _ZERO_VALUES = (None, 0.0, 0.0, 0.0, 0, 0, 0, 0, 0, 0, "", "\0")
+
     _max_index = 1000  # Maximum allowable index
+    _occupied = bytearray(_max_index + 1)  # Class-level flags marking the indices in use
+    _free_indices = list(range(_max_index + 1))  # Min-heap of indices that may be free
+    _queued = bytearray(b"\x01" * (_max_index + 1))  # Class-level flags marking the indices in the heap
 
     def __init__(self, index=None):
         """
@@ -117,24 +275,27 @@ class SDDS:
             ValueError: If no index is provided and all indices are in use.
         """
         if index is None:
-            # Automatically assign an unused index
-            for i in range(self._max_index + 1):
-                if i not in self._used_indices:
-                    self.index = i
-                    self._used_indices.add(i)
+            # Automatically assign the lowest unused index. Indices taken explicitly
+            # stay in the heap and are skipped here.
+            while self._free_indices:
+                i = heapq.heappop(self._free_indices)
+                self._queued[i] = 0
+                if not self._occupied[i]:
                     break
             else:
                 raise ValueError("All SDDS indices are in use. Cannot create a new SDDS object.")
+            self.index = i
+            self._occupied[i] = 1
         elif 0 <= index <= self._max_index:
-            if index in self._used_indices:
+            if self._occupied[index]:
                 raise ValueError(f"Index {index} is already in use.")
             self.index = index
-            self._used_indices.add(index)
+            self._occupied[index] = 1
         else:
             raise ValueError(f"Index {index} must be between 0 and {self._max_index}.")
 
         # Initialize data storage variables
-        self.description = ["", ""]
+        self.description = _Description()
         self.parameterName = []
         self.arrayName = []
         self.columnName = []
@@ -147,13 +308,21 @@ class SDDS:
         self.columnData = []
         self.mode = self.SDDS_ASCII
         self.loaded_pages = 0
+        # Name to index dictionaries for the name lists, maintained by _findIndex
+        self._parameterIndex = {}
+        self._arrayIndex = {}
+        self._columnIndex = {}
 
     def __del__(self):
         """
         Destructor to release the index when the object is deleted.
         """
-        if hasattr(self, 'index') and self.index in self._used_indices:
-            self._used_indices.remove(self.index)
+        if hasattr(self, 'index') and self._occupied[self.index]:
+            self._occupied[self.index] = 0
+            # Indices taken explicitly may still be in the heap; queue each index only once
+            if not self._queued[self.index]:
+                self._queued[self.index] = 1
+                heapq.heappush(self._free_indices, self.index)
             
     def load(self, input):
         """
@@ -168,73 +337,7 @@ class SDDS:
         This method reads the SDDS file specified by `input`, and populates the object's data structures
         with the parameters, arrays, columns, and their respective data.
         """
-        try:
-            # Open SDDS file
-            if sddsdata.InitializeInput(self.index, input) != 1:
-                time.sleep(1)
-                if sddsdata.InitializeInput(self.index, input) != 1:
-                    raise ValueError("Failed to initialize SDDS input.")
-
-            # Get data storage mode (SDDS_ASCII or SDDS_BINARY)
-            self.mode = sddsdata.GetMode(self.index)
-
-            # Get description text and contents
-            self.description = sddsdata.GetDescription(self.index)
-
-            # Get parameter names
-            self.parameterName = sddsdata.GetParameterNames(self.index)
-            numberOfParameters = len(self.parameterName)
-
-            # Get array names
-            self.arrayName = sddsdata.GetArrayNames(self.index)
-            numberOfArrays = len(self.arrayName)
-
-            # Get column names
-            self.columnName = sddsdata.GetColumnNames(self.index)
-            numberOfColumns = len(self.columnName)
-
-            # Get parameter definitions
-            self.parameterDefinition = [sddsdata.GetParameterDefinition(self.index, name) for name in self.parameterName]
-
-            # Get array definitions
-            self.arrayDefinition = [sddsdata.GetArrayDefinition(self.index, name) for name in self.arrayName]
-
-            # Get column definitions
-            self.columnDefinition = [sddsdata.GetColumnDefinition(self.index, name) for name in self.columnName]
-
-            # Initialize parameter, array, and column data
-            self.parameterData = [[] for _ in range(numberOfParameters)]
-            self.arrayData = [[] for _ in range(numberOfArrays)]
-            self.columnData = [[] for _ in range(numberOfColumns)]
-            self.arrayDimensions = [[] for _ in range(numberOfArrays)]
-
-            # Read in SDDS data
-            page = sddsdata.ReadPage(self.index)
-            if page != 1:
-                raise Exception("Unable to read SDDS data for the first page")
-            while page > 0:
-                self.loaded_pages += 1
-                for i in range(numberOfParameters):
-                    self.parameterData[i].append(sddsdata.GetParameter(self.index, i))
-                for i in range(numberOfArrays):
-                    self.arrayData[i].append(sddsdata.GetArray(self.index, i))
-                    self.arrayDimensions[i].append(sddsdata.GetArrayDimensions(self.index, i))
-                rows = sddsdata.RowCount(self.index)
-                if rows > 0:
-                    for i in range(numberOfColumns):
-                        self.columnData[i].append(sddsdata.GetColumn(self.index, i))
-                else:
-                    for i in range(numberOfColumns):
-                        self.columnData[i].append([])
-                page = sddsdata.ReadPage(self.index)
-
-            # Close SDDS file
-            if sddsdata.Terminate(self.index) != 1:
-                raise ValueError("Failed to terminate SDDS input.")
-
-        except:
-            sddsdata.PrintErrors(self.SDDS_VERBOSE_PrintErrors)
-            raise
+        self._load(input, lambda: sddsdata.ReadPage(self.index))
 
     def loadSparse(self, input, interval, offset):
         """
@@ -250,39 +353,40 @@ class SDDS:
 
         This method reads every `interval` pages from the SDDS file, starting from the page at `offset`.
         """
-        try:
-            # Open SDDS file
-            if sddsdata.InitializeInput(self.index, input) != 1:
-                time.sleep(1)
-                if sddsdata.InitializeInput(self.index, input) != 1:
-                    raise ValueError("Failed to initialize SDDS input.")
-
-            # Get data storage mode (SDDS_ASCII or SDDS_BINARY)
-            self.mode = sddsdata.GetMode(self.index)
+        self._load(input, lambda: sddsdata.ReadPageSparse(self.index, interval, offset))
 
-            # Get description text and contents
-            self.description = sddsdata.GetDescription(self.index)
+    def loadLastRows(self, input, lastrows):
+        """
+        Loads an SDDS file into the SDDS object, reading only the last few rows.
 
-            # Get parameter names
-            self.parameterName = sddsdata.GetParameterNames(self.index)
-            numberOfParameters = len(self.parameterName)
+        Args:
+            input (str): The input SDDS filename to load.
+            lastrows (int): Number of last rows to read.
 
-            # Get array names
-            self.arrayName = sddsdata.GetArrayNames(self.index)
-            numberOfArrays = len(self.arrayName)
+        Raises:
+            Exception: If unable to read the SDDS data.
 
-            # Get column names
-            self.columnName = sddsdata.GetColumnNames(self.index)
-            numberOfColumns = len(self.columnName)
+        This method reads only the last `lastrows` rows from each page of the SDDS file.
+        """
+        self._load(input, lambda: sddsdata.ReadPageLastRows(self.index, lastrows))
 
-            # Get parameter definitions
-            self.parameterDefinition = [sddsdata.GetParameterDefinition(self.index, name) for name in self.parameterName]
+    def _load(self, input, readPage):
+        """
+        Shared implementation of load, loadSparse, and loadLastRows.
 
-            # Get array definitions
-            self.arrayDefinition = [sddsdata.GetArrayDefinition(self.index, name) for name in self.arrayName]
+        Args:
+            input (str): The input SDDS filename to load.
+            readPage (callable): Reads the next page and returns its page number, or a value
+                                 below 1 when no pages are left.
 
-            # Get column definitions
-            self.columnDefinition = [sddsdata.GetColumnDefinition(self.index, name) for name in self.columnName]
+        Raises:
+            Exception: If unable to read the SDDS data.
+        """
+        try:
+            self._loadLayout(input)
+            numberOfParameters = len(self.parameterName)
+            numberOfArrays = len(self.arrayName)
+            numberOfColumns = len(self.columnName)
 
             # Initialize parameter, array, and column data
             self.parameterData = [[] for _ in range(numberOfParameters)]
@@ -290,24 +394,48 @@ class SDDS:
             self.columnData = [[] for _ in range(numberOfColumns)]
             self.arrayDimensions = [[] for _ in range(numberOfArrays)]
 
-            # Read in SDDS data sparsely
-            page = sddsdata.ReadPageSparse(self.index, interval, offset)
+            # Bind the per-page calls and the append methods of the data lists to locals
+            # so the read loop does no global or attribute lookups
+            index = self.index
+            getParameters = sddsdata.GetParameters
+            getArrays = sddsdata.GetArrays
+            getColumns = sddsdata.GetColumns
+            parameterAppends = [values.append for values in self.parameterData]
+            arrayAppends = [values.append for values in self.arrayData]
+            dimensionAppends = [values.append for values in self.arrayDimensions]
+            columnAppends = [values.append for values in self.columnData]
+
+            # Read in SDDS data
+            page = readPage()
             if page != 1:
                 raise Exception("Unable to read SDDS data for the first page")
+            pages = 0
             while page > 0:
-                for i in range(numberOfParameters):
-                    self.parameterData[i].append(sddsdata.GetParameter(self.index, i))
-                for i in range(numberOfArrays):
-                    self.arrayData[i].append(sddsdata.GetArray(self.index, i))
-                    self.arrayDimensions[i].append(sddsdata.GetArrayDimensions(self.index, i))
-                rows = sddsdata.RowCount(self.index)
-                if rows > 0:
-                    for i in range(numberOfColumns):
-                        self.columnData[i].append(sddsdata.GetColumn(self.index, i))
-                else:
-                    for i in range(numberOfColumns):
-                        self.columnData[i].append([])
-                page = sddsdata.ReadPageSparse(self.index, interval, offset)
+                pages += 1
+                if numberOfParameters > 0:
+                    # Fetch every parameter of the page in one call
+                    values = getParameters(index)
+                    if values is None:
+                        raise Exception("Unable to read SDDS parameter data")
+                    for append, value in zip(parameterAppends, values):
+                        append(value)
+                if numberOfArrays > 0:
+                    # Fetch the values and dimensions of every array of the page in one call
+                    arrays = getArrays(index)
+                    if arrays is None:
+                        raise Exception("Unable to read SDDS array data")
+                    for append, dimensionAppend, (values, dimensions) in zip(arrayAppends, dimensionAppends, arrays):
+                        append(values)
+                        dimensionAppend(dimensions)
+                if numberOfColumns > 0:
+                    # Fetch every column of the page in one call; empty pages give empty lists
+                    columns = getColumns(index)
+                    if columns is None:
+                        raise Exception("Unable to read SDDS column data")
+                    for append, values in zip(columnAppends, columns):
+                        append(values)
+                page = readPage()
+            self.loaded_pages += pages
 
             # Close SDDS file
             if sddsdata.Terminate(self.index) != 1:
@@ -317,85 +445,115 @@ class SDDS:
             sddsdata.PrintErrors(self.SDDS_VERBOSE_PrintErrors)
             raise
 
-    def loadLastRows(self, input, lastrows):
+    def _loadLayout(self, input):
         """
-        Loads an SDDS file into the SDDS object, reading only the last few rows.
+        Opens an SDDS file and reads its description and definitions.
 
         Args:
-            input (str): The input SDDS filename to load.
-            lastrows (int): Number of last rows to read.
+            input (str): The input SDDS filename to open.
 
         Raises:
-            Exception: If unable to read the SDDS data.
-
-        This method reads only the last `lastrows` rows from each page of the SDDS file.
+            ValueError: If unable to open the SDDS file.
         """
-        try:
-            # Open SDDS file
-            if sddsdata.InitializeInput(self.index, input) != 1:
-                time.sleep(1)
-                if sddsdata.InitializeInput(self.index, input) != 1:
-                    raise ValueError("Failed to initialize SDDS input.")
+        # Open SDDS file. On file systems where the first open can fail (NFS), retry
+        # with delays doubling from 10 ms up to 200 ms, for about one second in total.
+        delay = 0.01
+        elapsed = 0.0
+        while sddsdata.InitializeInput(self.index, input) != 1:
+            if elapsed >= 1.0:
+                raise ValueError("Failed to initialize SDDS input.")
+            # Drop this attempt's error so only the last failure is reported
+            sddsdata.ClearErrors()
+            time.sleep(delay)
+            elapsed += delay
+            delay = min(delay * 2, 0.2)
 
-            # Get data storage mode (SDDS_ASCII or SDDS_BINARY)
-            self.mode = sddsdata.GetMode(self.index)
+        # Get data storage mode (SDDS_ASCII or SDDS_BINARY)
+        self.mode = sddsdata.GetMode(self.index)
 
-            # Get description text and contents
-            self.description = sddsdata.GetDescription(self.index)
+        # Get description text and contents
+        self.description = _Description(*sddsdata.GetDescription(self.index))
 
-            # Get parameter names
-            self.parameterName = sddsdata.GetParameterNames(self.index)
-            numberOfParameters = len(self.parameterName)
+        # Get parameter names
+        self.parameterName = sddsdata.GetParameterNames(self.index)
 
-            # Get array names
-            self.arrayName = sddsdata.GetArrayNames(self.index)
-            numberOfArrays = len(self.arrayName)
+        # Get array names
+        self.arrayName = sddsdata.GetArrayNames(self.index)
 
-            # Get column names
-            self.columnName = sddsdata.GetColumnNames(self.index)
-            numberOfColumns = len(self.columnName)
+        # Get column names
+        self.columnName = sddsdata.GetColumnNames(self.index)
 
-            # Get parameter definitions
-            self.parameterDefinition = [sddsdata.GetParameterDefinition(self.index, name) for name in self.parameterName]
+        # Get parameter definitions
+        self.parameterDefinition = [sddsdata.GetParameterDefinition(self.index, name) for name in self.parameterName]
 
-            # Get array definitions
-            self.arrayDefinition = [sddsdata.GetArrayDefinition(self.index, name) for name in self.arrayName]
+        # Get array definitions
+        self.arrayDefinition = [sddsdata.GetArrayDefinition(self.index, name) for name in self.arrayName]
 
-            # Get column definitions
-            self.columnDefinition = [sddsdata.GetColumnDefinition(self.index, name) for name in self.columnName]
+        # Get column definitions
+        self.columnDefinition = [sddsdata.GetColumnDefinition(self.index, name) for name in self.columnName]
 
-            # Initialize parameter, array, and column data
-            self.parameterData = [[] for _ in range(numberOfParameters)]
-            self.arrayData = [[] for _ in range(numberOfArrays)]
-            self.columnData = [[] for _ in range(numberOfColumns)]
-            self.arrayDimensions = [[] for _ in range(numberOfArrays)]
+    def iterPages(self, input):
+        """
+        Reads an SDDS file one page at a time.
+
+        Args:
+            input (str): The input SDDS filename to read.
+
+        Yields:
+            int: The number of the page in the file.
+
+        Raises:
+            Exception: If unable to read the SDDS data.
 
-            # Read in SDDS data (last rows)
-            page = sddsdata.ReadPageLastRows(self.index, lastrows)
+        The file stays open while the pages are read. Before each page number is yielded,
+        the object's data is replaced by the data of that page alone, so the getters read
+        it as page 1 and only one page is held in memory at a time. The file is closed when
+        the last page has been read or the loop is left early.
+
+        Example:
+            for page in sdds_obj.iterPages("input.sdds"):
+                print(page, sdds_obj.getColumnValueList("x"))
+        """
+        opened = False
+        try:
+            self._loadLayout(input)
+            opened = True
+            index = self.index
+            self.parameterData = [[] for _ in self.parameterName]
+            self.arrayData = [[] for _ in self.arrayName]
+            self.arrayDimensions = [[] for _ in self.arrayName]
+            self.columnData = [[] for _ in self.columnName]
+
+            page = sddsdata.ReadPage(index)
             if page != 1:
                 raise Exception("Unable to read SDDS data for the first page")
             while page > 0:
-                for i in range(numberOfParameters):
-                    self.parameterData[i].append(sddsdata.GetParameter(self.index, i))
-                for i in range(numberOfArrays):
-                    self.arrayData[i].append(sddsdata.GetArray(self.index, i))
-                    self.arrayDimensions[i].append(sddsdata.GetArrayDimensions(self.index, i))
-                rows = sddsdata.RowCount(self.index)
-                if rows > 0:
-                    for i in range(numberOfColumns):
-                        self.columnData[i].append(sddsdata.GetColumn(self.index, i))
-                else:
-                    for i in range(numberOfColumns):
-                        self.columnData[i].append([])
-                page = sddsdata.ReadPageLastRows(self.index, lastrows)
-
-            # Close SDDS file
-            if sddsdata.Terminate(self.index) != 1:
-                raise ValueError("Failed to terminate SDDS input.")
-
-        except:
+                if self.parameterName:
+                    values = sddsdata.GetParameters(index)
+                    if values is None:
+                        raise Exception("Unable to read SDDS parameter data")
+                    self.parameterData = [[value] for value in values]
+                if self.arrayName:
+                    arrays = sddsdata.GetArrays(index)
+                    if arrays is None:
+                        raise Exception("Unable to read SDDS array data")
+                    self.arrayData = [[values] for values, dimensions in arrays]
+                    self.arrayDimensions = [[dimensions] for values, dimensions in arrays]
+                if self.columnName:
+                    columns = sddsdata.GetColumns(index)
+                    if columns is None:
+                        raise Exception("Unable to read SDDS column data")
+                    self.columnData = [[values] for values in columns]
+                self.loaded_pages = 1
+                yield page
+                page = sddsdata.ReadPage(index)
+        except Exception:
             sddsdata.PrintErrors(self.SDDS_VERBOSE_PrintErrors)
             raise
+        finally:
+            # Close SDDS file, also when the caller stops iterating early
+            if opened and sddsdata.Terminate(self.index) != 1:
+                raise ValueError("Failed to terminate SDDS input.")
 
     def save(self, output):
         """
@@ -437,95 +595,58 @@ class SDDS:
             elif numberOfArrays > 0:
                 pages = len(self.arrayData[0])
 
-            for i in range(numberOfParameters):
-                if pages != len(self.parameterData[i]):
+            for values in self.parameterData:
+                if pages != len(values):
                     raise Exception("Unequal number of pages in parameter data")
-            for i in range(numberOfArrays):
-                if pages != len(self.arrayData[i]):
+            for values, dimensions in zip(self.arrayData, self.arrayDimensions):
+                if pages != len(values):
                     raise Exception("Unequal number of pages in array data")
-                if pages != len(self.arrayDimensions[i]):
+                if pages != len(dimensions):
                     raise Exception("Unequal number of pages in array dimension data")
-            for i in range(numberOfColumns):
-                if pages != len(self.columnData[i]):
-                    raise Exception("Unequal number of pages in column data")
-            for page in range(pages):
-                rows = 0
-                if numberOfColumns > 0:
-                    rows = len(self.columnData[0][page])
-                for i in range(numberOfColumns):
-                    if rows != len(self.columnData[i][page]):
+            # Check the page count and the per-page row counts of each column in one pass,
+            # comparing whole lists of row counts instead of checking each page in Python
+            maxRows = 0
+            if numberOfColumns > 0:
+                rowCounts = list(map(len, self.columnData[0]))
+                for i, values in enumerate(self.columnData):
+                    if pages != len(values):
+                        raise Exception("Unequal number of pages in column data")
+                    if i > 0 and list(map(len, values)) != rowCounts:
                         raise Exception("Unequal number of rows in column data")
+                maxRows = max(rowCounts, default=0)
 
             # Open SDDS output file
-            if sddsdata.InitializeOutput(self.index, self.mode, 1, self.description[0], self.description[1], output) != 1:
+            text, contents = self.description
+            if sddsdata.InitializeOutput(self.index, self.mode, 1, text, contents, output) != 1:
                 raise ValueError("Failed to initialize SDDS output.")
 
-            # Define parameters, arrays, and columns
-            for i in range(numberOfParameters):
-                if sddsdata.DefineParameter(
-                    self.index,
-                    self.parameterName[i],
-                    self.parameterDefinition[i][0],
-                    self.parameterDefinition[i][1],
-                    self.parameterDefinition[i][2],
-                    self.parameterDefinition[i][3],
-                    self.parameterDefinition[i][4],
-                    self.parameterDefinition[i][5],
-                ) == -1:
+            # Define parameters, arrays, and columns. Each definition list holds the
+            # remaining DefineParameter/DefineArray/DefineColumn arguments in order.
+            index = self.index
+            for name, definition in zip(self.parameterName, self.parameterDefinition):
+                if sddsdata.DefineParameter(index, name, *definition) == -1:
                     raise ValueError("Failed to define parameter.")
 
-            for i in range(numberOfArrays):
-                if sddsdata.DefineArray(
-                    self.index,
-                    self.arrayName[i],
-                    self.arrayDefinition[i][0],
-                    self.arrayDefinition[i][1],
-                    self.arrayDefinition[i][2],
-                    self.arrayDefinition[i][3],
-                    self.arrayDefinition[i][4],
-                    self.arrayDefinition[i][5],
-                    self.arrayDefinition[i][6],
-                    self.arrayDefinition[i][7],
-                ) == -1:
+            for name, definition in zip(self.arrayName, self.arrayDefinition):
+                if sddsdata.DefineArray(index, name, *definition) == -1:
                     raise ValueError("Failed to define array.")
 
-            for i in range(numberOfColumns):
-                if sddsdata.DefineColumn(
-                    self.index,
-                    self.columnName[i],
-                    self.columnDefinition[i][0],
-                    self.columnDefinition[i][1],
-                    self.columnDefinition[i][2],
-                    self.columnDefinition[i][3],
-                    self.columnDefinition[i][4],
-                    self.columnDefinition[i][5],
-                ) == -1:
+            for name, definition in zip(self.columnName, self.columnDefinition):
+                if sddsdata.DefineColumn(index, name, *definition) == -1:
                     raise ValueError("Failed to define column.")
 
             # Write SDDS header
             if sddsdata.WriteLayout(self.index) != 1:
                 raise ValueError("Failed to write SDDS layout.")
 
-            # Write SDDS data
-            for page in range(pages):
-                rows = 0
-                if numberOfColumns > 0:
-                    rows = len(self.columnData[0][page])
-                if sddsdata.StartPage(self.index, rows) != 1:
-                    raise ValueError("Failed to start SDDS page.")
-                for i in range(numberOfParameters):
-                    if sddsdata.SetParameter(self.index, i, self.parameterData[i][page]) != 1:
-                        raise ValueError("Failed to set parameter value.")
-                for i in range(numberOfArrays):
-                    if sddsdata.SetArray(
-                        self.index, i, self.arrayData[i][page], self.arrayDimensions[i][page]
-                    ) != 1:
-                        raise ValueError("Failed to set array value.")
-                for i in range(numberOfColumns):
-                    if sddsdata.SetColumn(self.index, i, self.columnData[i][page]) != 1:
-                        raise ValueError("Failed to set column value.")
-                if sddsdata.WritePage(self.index) != 1:
-                    raise ValueError("Failed to write SDDS page.")
+            # Write SDDS data. All pages are written by a single call that loops in C.
+            # Every page asks for the largest row count so the column buffers are
+            # allocated once and reused by the following pages.
+            if sddsdata.WritePages(
+                self.index, pages, maxRows,
+                self.parameterData, self.arrayData, self.arrayDimensions, self.columnData,
+            ) != 1:
+                raise ValueError("Failed to write SDDS pages.")
 
             # Close SDDS output file
             if sddsdata.Terminate(self.index) != 1:
@@ -542,7 +663,7 @@ class SDDS:
             text (str): Description text.
             contents (str): Description contents.
         """
-        self.description = [text, contents]
+        self.description = _Description(text, contents)
 
     def defineParameter(self, name, symbol="", units="", description="", formatString="", type=SDDS_DOUBLE, fixedValue=""):
         """
@@ -568,6 +689,9 @@ class SDDS:
                 - SDDS_CHARACTER: Single character.
             fixedValue (str, optional): Fixed value of the parameter.
 
+        Returns:
+            int: Index of the new parameter, which the set methods accept in place of the name.
+
         This method adds a parameter definition to the SDDS object.
         """
         self.parameterName.append(name)
@@ -575,6 +699,7 @@ class SDDS:
             [symbol, units, description, formatString, type, fixedValue]
         )
         self.parameterData.append([])
+        return len(self.parameterName) - 1
 
     def defineSimpleParameter(self, name, type):
         """
@@ -595,11 +720,42 @@ class SDDS:
                 - SDDS_STRING: String (textual data).
                 - SDDS_CHARACTER: Single character.
 
+        Returns:
+            int: Index of the new parameter, which the set methods accept in place of the name.
+
         This method adds a parameter definition with default attributes.
         """
         self.parameterName.append(name)
         self.parameterDefinition.append(["", "", "", "", type, ""])
         self.parameterData.append([])
+        return len(self.parameterName) - 1
+
+    def defineSimpleParameters(self, names, types):
+        """
+        Defines several simple parameters with a single call.
+
+        Args:
+            names (list): Parameter names.
+            types (list): Data type of each parameter, as accepted by defineSimpleParameter.
+
+        Returns:
+            range: Indices of the new parameters, in the order of `names`.
+
+        Raises:
+            ValueError: If the names and types differ in length.
+
+        This method is equivalent to calling defineSimpleParameter for each name and type,
+        but extends the definition lists once instead of once per parameter.
+        """
+        first = len(self.parameterName)
+        names = list(names)
+        types = list(types)
+        if len(names) != len(types):
+            raise ValueError("Unequal number of parameter names and types")
+        self.parameterName.extend(names)
+        self.parameterDefinition.extend([["", "", "", "", type, ""] for type in types])
+        self.parameterData.extend([[] for _ in names])
+        return range(first, len(self.parameterName))
 
     def defineArray(self, name, symbol="", units="", description="", formatString="", group_name="", type=SDDS_DOUBLE, fieldLength=0, dimensions=1):
         """
@@ -627,6 +783,9 @@ class SDDS:
             fieldLength (int, optional): Field length for the array.
             dimensions (int, optional): Number of dimensions of the array. Defaults to 1
 
+        Returns:
+            int: Index of the new array, which the set methods accept in place of the name.
+
         This method adds an array definition to the SDDS object.
         """
         self.arrayName.append(name)
@@ -635,6 +794,7 @@ class SDDS:
         )
         self.arrayData.append([])
         self.arrayDimensions.append([])
+        return len(self.arrayName) - 1
 
     def defineSimpleArray(self, name, type, dimensions):
         """
@@ -656,12 +816,46 @@ class SDDS:
                 - SDDS_CHARACTER: Single character.
             dimensions (int): Number of dimensions of the array.
 
+        Returns:
+            int: Index of the new array, which the set methods accept in place of the name.
+
         This method adds an array definition with default attributes.
         """
         self.arrayName.append(name)
         self.arrayDefinition.append(["", "", "", "", "", type, 0, dimensions])
         self.arrayData.append([])
         self.arrayDimensions.append([])
+        return len(self.arrayName) - 1
+
+    def defineSimpleArrays(self, names, types, dimensions):
+        """
+        Defines several simple arrays with a single call.
+
+        Args:
+            names (list): Array names.
+            types (list): Data type of each array, as accepted by defineSimpleArray.
+            dimensions (list): Number of dimensions of each array.
+
+        Returns:
+            range: Indices of the new arrays, in the order of `names`.
+
+        Raises:
+            ValueError: If the names, types, and dimensions differ in length.
+
+        This method is equivalent to calling defineSimpleArray for each name, type, and
+        dimension count, but extends the definition lists once instead of once per array.
+        """
+        first = len(self.arrayName)
+        names = list(names)
+        types = list(types)
+        dimensions = list(dimensions)
+        if not len(names) == len(types) == len(dimensions):
+            raise ValueError("Unequal number of array names, types, and dimensions")
+        self.arrayName.extend(names)
+        self.arrayDefinition.extend([["", "", "", "", "", type, 0, dims] for type, dims in zip(types, dimensions)])
+        self.arrayData.extend([[] for _ in names])
+        self.arrayDimensions.extend([[] for _ in names])
+        return range(first, len(self.arrayName))
 
     def defineColumn(self, name, symbol="", units="", description="", formatString="", type=SDDS_DOUBLE, fieldLength=0):
         """
@@ -687,6 +881,9 @@ class SDDS:
                 - SDDS_CHARACTER: Single character.
             fieldLength (int, optional): Field length for the column.
 
+        Returns:
+            int: Index of the new column, which the set methods accept in place of the name.
+
         This method adds a column definition to the SDDS object.
         """
         self.columnName.append(name)
@@ -694,6 +891,7 @@ class SDDS:
             [symbol, units, description, formatString, type, fieldLength]
         )
         self.columnData.append([])
+        return len(self.columnName) - 1
 
     def defineSimpleColumn(self, name, type):
         """
@@ -714,11 +912,42 @@ class SDDS:
                 - SDDS_STRING: String (textual data).
                 - SDDS_CHARACTER: Single character.
 
+        Returns:
+            int: Index of the new column, which the set methods accept in place of the name.
+
         This method adds a column definition with default attributes.
         """
         self.columnName.append(name)
         self.columnDefinition.append(["", "", "", "", type, 0])
         self.columnData.append([])
+        return len(self.columnName) - 1
+
+    def defineSimpleColumns(self, names, types):
+        """
+        Defines several simple columns with a single call.
+
+        Args:
+            names (list): Column names.
+            types (list): Data type of each column, as accepted by defineSimpleColumn.
+
+        Returns:
+            range: Indices of the new columns, in the order of `names`.
+
+        Raises:
+            ValueError: If the names and types differ in length.
+
+        This method is equivalent to calling defineSimpleColumn for each name and type,
+        but extends the definition lists once instead of once per column.
+        """
+        first = len(self.columnName)
+        names = list(names)
+        types = list(types)
+        if len(names) != len(types):
+            raise ValueError("Unequal number of column names and types")
+        self.columnName.extend(names)
+        self.columnDefinition.extend([["", "", "", "", type, 0] for type in types])
+        self.columnData.extend([[] for _ in names])
+        return range(first, len(self.columnName))
 
     def setParameterValueList(self, name, valueList):
         """
@@ -733,9 +962,9 @@ class SDDS:
 
         This method assigns a list of values to a parameter across pages.
         """
-        numberOfParameters = len(self.parameterName)
-        if name in self.parameterName:
-            self.parameterData[self.parameterName.index(name)] = valueList
+        i = _findIndex(self.parameterName, self._parameterIndex, name)
+        if i is not None:
+            self.parameterData[i] = valueList
         else:
             msg = "Invalid parameter name " + name
             raise Exception(msg)
@@ -754,9 +983,9 @@ class SDDS:
             Exception: If the parameter name is invalid.
 
         """
-        numberOfParameters = len(self.parameterName)
-        if name in self.parameterName:
-            return(self.parameterData[self.parameterName.index(name)])
+        i = _findIndex(self.parameterName, self._parameterIndex, name)
+        if i is not None:
+            return(self.parameterData[i])
         else:
             msg = "Invalid parameter name " + name
             raise Exception(msg)
@@ -766,7 +995,7 @@ class SDDS:
         Sets a single parameter value at a specific page.
 
         Args:
-            name (str): Parameter name.
+            name (str or int): Parameter name, or the index returned when it was defined.
             value: Parameter value.
             page (int, optional): Page number (1-based index, defaults to 1).
 
@@ -776,19 +1005,14 @@ class SDDS:
         This method sets the parameter value at the specified page.
         """
         page = page - 1
-        numberOfParameters = len(self.parameterName)
-        if name in self.parameterName:
-            i = self.parameterName.index(name)
-            if len(self.parameterData[i]) == page:
-                self.parameterData[i][page:] = [value]
-            elif len(self.parameterData[i]) < page or page < 0:
-                msg = "Invalid page " + str(page + 1)
-                raise Exception(msg)
-            else:
-                self.parameterData[i][page] = value
+        if isinstance(name, int) and 0 <= name < len(self.parameterName):
+            i = name
         else:
-            msg = "Invalid parameter name " + name
+            i = _findIndex(self.parameterName, self._parameterIndex, name)
+        if i is None:
+            msg = "Invalid parameter name " + str(name)
             raise Exception(msg)
+        _setCell(self.parameterData[i], page, value)
 
     def getParameterValue(self, name, page=1):
         """
@@ -805,16 +1029,9 @@ class SDDS:
             Exception: If the parameter name or page is invalid.
         """
         page = page - 1
-        numberOfParameters = len(self.parameterName)
-        if name in self.parameterName:
-            i = self.parameterName.index(name)
-            if len(self.parameterData[i]) == page:
-                return(self.parameterData[i][page:])
-            elif len(self.parameterData[i]) < page or page < 0:
-                msg = "Invalid page " + str(page + 1)
-                raise Exception(msg)
-            else:
-                return(self.parameterData[i][page])
+        i = _findIndex(self.parameterName, self._parameterIndex, name)
+        if i is not None:
+            return(_getCell(self.parameterData[i], page))
         else:
             msg = "Invalid parameter name " + name
             raise Exception(msg)
@@ -833,9 +1050,8 @@ class SDDS:
 
         This method assigns values and dimensions to an array across pages.
         """
-        numberOfArrays = len(self.arrayName)
-        if name in self.arrayName:
-            i = self.arrayName.index(name)
+        i = _findIndex(self.arrayName, self._arrayIndex, name)
+        if i is not None:
             self.arrayDimensions[i] = dimensionList
             self.arrayData[i] = valueList
         else:
@@ -855,9 +1071,9 @@ class SDDS:
         Raises:
             Exception: If the array name is invalid.
         """
-        numberOfArrays = len(self.arrayName)
-        if name in self.arrayName:
-            return(self.arrayData[self.arrayName.index(name)])
+        i = _findIndex(self.arrayName, self._arrayIndex, name)
+        if i is not None:
+            return(self.arrayData[i])
         else:
             msg = "Invalid array name " + name
             raise Exception(msg)
@@ -875,9 +1091,9 @@ class SDDS:
         Raises:
             Exception: If the array name is invalid.
         """
-        numberOfArrays = len(self.arrayName)
-        if name in self.arrayName:
-            return(self.arrayDimensions[self.arrayName.index(name)])
+        i = _findIndex(self.arrayName, self._arrayIndex, name)
+        if i is not None:
+            return(self.arrayDimensions[i])
         else:
             msg = "Invalid array name " + name
             raise Exception(msg)
@@ -887,7 +1103,7 @@ class SDDS:
         Sets a single array value and dimension at a specific page.
 
         Args:
-            name (str): Array name.
+            name (str or int): Array name, or the index returned when it was defined.
             valueList (list): Array values.
             dimensionList (list): Array dimensions.
             page (int, optional): Page number (1-based index, defaults to 1).
@@ -898,21 +1114,15 @@ class SDDS:
         This method sets the array values and dimensions at the specified page.
         """
         page = page - 1
-        numberOfArrays = len(self.arrayName)
-        if name in self.arrayName:
-            i = self.arrayName.index(name)
-            if len(self.arrayData[i]) == page:
-                self.arrayData[i][page:] = [valueList]
-                self.arrayDimensions[i][page:] = [dimensionList]
-            elif len(self.arrayData[i]) < page or page < 0:
-                msg = "Invalid page " + str(page + 1)
-                raise Exception(msg)
-            else:
-                self.arrayData[i][page] = valueList
-                self.arrayDimensions[i][page] = dimensionList
+        if isinstance(name, int) and 0 <= name < len(self.arrayName):
+            i = name
         else:
-            msg = "Invalid array name " + name
+            i = _findIndex(self.arrayName, self._arrayIndex, name)
+        if i is None:
+            msg = "Invalid array name " + str(name)
             raise Exception(msg)
+        _setCell(self.arrayData[i], page, valueList)
+        _setCell(self.arrayDimensions[i], page, dimensionList)
 
     def getArrayValueList(self, name, page=1):
         """
@@ -929,16 +1139,9 @@ class SDDS:
             Exception: If the array name or page is invalid.
         """
         page = page - 1
-        numberOfArrays = len(self.arrayName)
-        if name in self.arrayName:
-            i = self.arrayName.index(name)
-            if len(self.arrayData[i]) == page:
-                return(self.arrayData[i][page:])
-            elif len(self.arrayData[i]) < page or page < 0:
-                msg = "Invalid page " + str(page + 1)
-                raise Exception(msg)
-            else:
-                return(self.arrayData[i][page])
+        i = _findIndex(self.arrayName, self._arrayIndex, name)
+        if i is not None:
+            return(_getCell(self.arrayData[i], page))
         else:
             msg = "Invalid array name " + name
             raise Exception(msg)
@@ -958,16 +1161,9 @@ class SDDS:
             Exception: If the array name or page is invalid.
         """
         page = page - 1
-        numberOfArrays = len(self.arrayName)
-        if name in self.arrayName:
-            i = self.arrayName.index(name)
-            if len(self.arrayData[i]) == page:
-                return(self.arrayDimensions[i][page:])
-            elif len(self.arrayData[i]) < page or page < 0:
-                msg = "Invalid page " + str(page + 1)
-                raise Exception(msg)
-            else:
-                return(self.arrayDimensions[i][page])
+        i = _findIndex(self.arrayName, self._arrayIndex, name)
+        if i is not None:
+            return(_getCell(self.arrayDimensions[i], page))
         else:
             msg = "Invalid array name " + name
             raise Exception(msg)
@@ -985,9 +1181,9 @@ class SDDS:
 
         This method assigns a list of values to a column across pages.
         """
-        numberOfColumns = len(self.columnName)
-        if name in self.columnName:
-            self.columnData[self.columnName.index(name)] = valueList
+        i = _findIndex(self.columnName, self._columnIndex, name)
+        if i is not None:
+            self.columnData[i] = valueList
         else:
             msg = "Invalid column name " + name
             raise Exception(msg)
@@ -1005,40 +1201,43 @@ class SDDS:
         Raises:
             Exception: If the column name is invalid.
         """
-        numberOfColumns = len(self.columnName)
-        if name in self.columnName:
-            return(self.columnData[self.columnName.index(name)])
+        i = _findIndex(self.columnName, self._columnIndex, name)
+        if i is not None:
+            return(self.columnData[i])
         else:
             msg = "Invalid column name " + name
             raise Exception(msg)
 
-    def setColumnValueList(self, name, valueList, page=1):
+    def setColumnValueList(self, name, valueList, page=1, pack=False):
         """
         Sets a single column value list at a specific page.
 
         Args:
-            name (str): Column name.
+            name (str or int): Column name, or the index returned when it was defined.
             valueList (list): Column values.
             page (int, optional): Page number (1-based index, defaults to 1).
+            pack (bool, optional): Store the values of a numeric column as an `array.array`
+                of its SDDS type, as packColumnData does (defaults to False).
 
         Raises:
             Exception: If the column name or page is invalid.
+            OverflowError, TypeError: If pack is set and a value does not fit the column's data type.
 
         This method sets the column values at the specified page.
         """
         page = page - 1
-        if name in self.columnName:
-            i = self.columnName.index(name)
-            if len(self.columnData[i]) == page:
-                self.columnData[i][page:] = [valueList]
-            elif len(self.columnData[i]) < page or page < 0:
-                msg = "Invalid page " + str(page + 1)
-                raise Exception(msg)
-            else:
-                self.columnData[i][page] = valueList
+        if isinstance(name, int) and 0 <= name < len(self.columnName):
+            i = name
         else:
-            msg = "Invalid column name " + name
+            i = _findIndex(self.columnName, self._columnIndex, name)
+        if i is None:
+            msg = "Invalid column name " + str(name)
             raise Exception(msg)
+        if pack:
+            typecode = self._ARRAY_TYPECODES[self.columnDefinition[i][4]]
+            if typecode is not None and not (isinstance(valueList, array.array) and valueList.typecode == typecode):
+                valueList = array.array(typecode, valueList)
+        _setCell(self.columnData[i], page, valueList)
 
     def getColumnValueList(self, name, page=1):
         """
@@ -1055,16 +1254,9 @@ class SDDS:
             Exception: If the column name or page is invalid.
         """
         page = page - 1
-        numberOfColumns = len(self.columnName)
-        if name in self.columnName:
-            i = self.columnName.index(name)
-            if len(self.columnData[i]) == page:
-                return(self.columnData[i][page:])
-            elif len(self.columnData[i]) < page or page < 0:
-                msg = "Invalid page " + str(page + 1)
-                raise Exception(msg)
-            else:
-                return(self.columnData[i][page])
+        i = _findIndex(self.columnName, self._columnIndex, name)
+        if i is not None:
+            return(_getCell(self.columnData[i], page))
         else:
             msg = "Invalid column name " + name
             raise Exception(msg)
@@ -1074,7 +1266,7 @@ class SDDS:
         Sets a single column value at a specific page and row.
 
         Args:
-            name (str): Column name.
+            name (str or int): Column name, or the index returned when it was defined.
             value: Column value.
             page (int, optional): Page number (1-based index, defaults to 1).
             row (int, optional): Row number (1-based index, defaults to 1).
@@ -1086,29 +1278,139 @@ class SDDS:
         """
         page = page - 1
         row = row - 1
-        numberOfColumns = len(self.columnName)
-        if name in self.columnName:
-            i = self.columnName.index(name)
-            if len(self.columnData[i]) == page:
-                if row == 0:
-                    self.columnData[i][page:] = [[value]]
-                else:
-                    msg = "Invalid row " + str(row + 1)
-                    raise Exception(msg)
-            elif len(self.columnData[i]) < page or page < 0:
+        if isinstance(name, int) and 0 <= name < len(self.columnName):
+            i = name
+        else:
+            i = _findIndex(self.columnName, self._columnIndex, name)
+        if i is None:
+            msg = "Invalid column name " + str(name)
+            raise Exception(msg)
+        pages = self.columnData[i]
+        n = len(pages)
+        if 0 <= page < n:
+            _setCell(pages[page], row, value, "row")
+        elif page == n and row == 0:
+            pages.append([value])
+        elif page == n:
+            msg = "Invalid row " + str(row + 1)
+            raise Exception(msg)
+        else:
+            msg = "Invalid page " + str(page + 1)
+            raise Exception(msg)
+
+    def setPageRowCount(self, page, rows):
+        """
+        Sets the number of rows of every column at a specific page.
+
+        Args:
+            page (int): Page number (1-based index). May be one past the last page to add a page.
+            rows (int): Number of rows.
+
+        Raises:
+            Exception: If the page or the row count is invalid.
+
+        New rows are filled with zero, an empty string, or a null character, depending on
+        the column data type, and extra rows are removed. Calling this before filling a
+        page row by row with setColumnValue or columnSetter lets every value be assigned
+        in place instead of growing the page one row at a time.
+        """
+        page = page - 1
+        if rows < 0:
+            msg = "Invalid row count " + str(rows)
+            raise Exception(msg)
+        for pages in self.columnData:
+            if page < 0 or page > len(pages):
                 msg = "Invalid page " + str(page + 1)
                 raise Exception(msg)
+        zeros = self._ZERO_VALUES
+        for definition, pages in zip(self.columnDefinition, self.columnData):
+            if page == len(pages):
+                pages.append([])
+            values = pages[page]
+            n = len(values)
+            if n < rows:
+                values.extend([zeros[definition[4]]] * (rows - n))
             else:
-                if len(self.columnData[i][page]) == row:
-                    self.columnData[i][page][row:] = [value]
-                elif len(self.columnData[i][page]) < row or row < 0:
-                    msg = "Invalid row " + str(row + 1)
-                    raise Exception(msg)
-                else:
-                    self.columnData[i][page][row] = value
-        else:
-            msg = "Invalid column name " + name
-            raise Exception(msg)
+                del values[rows:]
+
+    def setPage(self, page, parameters=None, columns=None, arrays=None):
+        """
+        Sets the parameter, column, and array values of a page with a single call.
+
+        Args:
+            page (int): Page number (1-based index).
+            parameters (dict, optional): Parameter values keyed by parameter name.
+            columns (dict, optional): Column value lists keyed by column name.
+            arrays (dict, optional): (valueList, dimensionList) tuples keyed by array name.
+
+        Raises:
+            Exception: If a name or the page is invalid.
+
+        This method is equivalent to calling setParameterValue, setColumnValueList,
+        and setArrayValueList for every entry of the given dictionaries.
+        """
+        if parameters:
+            for name, value in parameters.items():
+                self.setParameterValue(name, value, page)
+        if columns:
+            for name, valueList in columns.items():
+                self.setColumnValueList(name, valueList, page)
+        if arrays:
+            for name, (valueList, dimensionList) in arrays.items():
+                self.setArrayValueList(name, valueList, dimensionList, page)
+
+    def packColumnData(self):
+        """
+        Converts the value lists of the numeric columns to typed arrays.
+
+        Each page of a numeric column is stored as an `array.array` of its SDDS type
+        instead of a list of Python numbers, which uses several times less memory for
+        large row counts. String and character columns, and long double columns, are
+        left as lists. The packed pages support indexing, iteration, and appends, and
+        are written by save without converting each value.
+
+        Raises:
+            OverflowError, TypeError: If a value does not fit the column's data type.
+        """
+        typecodes = self._ARRAY_TYPECODES
+        for definition, pages in zip(self.columnDefinition, self.columnData):
+            typecode = typecodes[definition[4]]
+            if typecode is not None:
+                pages[:] = [array.array(typecode, values) for values in pages]
+
+    def packArrayData(self):
+        """
+        Converts the value lists of the numeric arrays to typed arrays.
+
+        Like packColumnData, each page of a numeric array is stored as an `array.array`
+        of its SDDS type in row-major order, and is written by save without converting
+        each value. String, character, and long double arrays are left as lists.
+
+        Raises:
+            OverflowError, TypeError: If a value does not fit the array's data type.
+        """
+        typecodes = self._ARRAY_TYPECODES
+        for definition, pages in zip(self.arrayDefinition, self.arrayData):
+            typecode = typecodes[definition[5]]
+            if typecode is not None:
+                pages[:] = [array.array(typecode, values) for values in pages]
+
+    def packParameterData(self):
+        """
+        Converts the per-page value lists of the numeric parameters to typed arrays.
+
+        Each numeric parameter keeps its values for all pages in one `array.array` of its
+        SDDS type, which is much smaller than a list of Python numbers for files with many
+        pages. String, character, and long double parameters are left as lists.
+
+        Raises:
+            OverflowError, TypeError: If a value does not fit the parameter's data type.
+        """
+        typecodes = self._ARRAY_TYPECODES
+        for i, definition in enumerate(self.parameterDefinition):
+            typecode = typecodes[definition[4]]
+            if typecode is not None:
+                self.parameterData[i] = array.array(typecode, self.parameterData[i])
 
     def getColumnValue(self, name, page=1, row=1):
         """
@@ -1127,30 +1429,154 @@ class SDDS:
         """
         page = page - 1
         row = row - 1
-        numberOfColumns = len(self.columnName)
-        if name in self.columnName:
-            i = self.columnName.index(name)
-            if len(self.columnData[i]) == page:
-                if row == 0:
-                    return(self.columnData[i][page:])
-                else:
-                    msg = "Invalid row " + str(row + 1)
-                    raise Exception(msg)
-            elif len(self.columnData[i]) < page or page < 0:
-                msg = "Invalid page " + str(page + 1)
+        i = _findIndex(self.columnName, self._columnIndex, name)
+        if i is not None:
+            pages = self.columnData[i]
+            n = len(pages)
+            if 0 <= page < n:
+                return(_getCell(pages[page], row, "row"))
+            elif page == n and row == 0:
+                return(pages[page:])
+            elif page == n:
+                msg = "Invalid row " + str(row + 1)
                 raise Exception(msg)
             else:
-                if len(self.columnData[i][page]) == row:
-                    return(self.columnData[i][page][row:])
-                elif len(self.columnData[i][page]) < row or row < 0:
-                    msg = "Invalid row " + str(row + 1)
-                    raise Exception(msg)
-                else:
-                    return(self.columnData[i][page][row])
+                msg = "Invalid page " + str(page + 1)
+                raise Exception(msg)
         else:
             msg = "Invalid column name " + name
             raise Exception(msg)
 
+    def columnSetter(self, name):
+        """
+        Returns a function that sets values of a single column.
+
+        Args:
+            name (str or int): Column name, or the index returned when it was defined.
+
+        Returns:
+            function: f(page, row, value), equivalent to setColumnValue(name, value, page, row).
+
+        Raises:
+            Exception: If the column name is invalid.
+
+        The column index is resolved once here, so loops that set many values of one
+        column skip the name lookup. Values inside the existing pages and rows are
+        assigned directly; anything else goes through setColumnValue.
+        """
+        if isinstance(name, int) and 0 <= name < len(self.columnName):
+            i = name
+        else:
+            i = _findIndex(self.columnName, self._columnIndex, name)
+        if i is None:
+            msg = "Invalid column name " + str(name)
+            raise Exception(msg)
+
+        def setter(page, row, value):
+            if page > 0 and row > 0:
+                try:
+                    self.columnData[i][page - 1][row - 1] = value
+                    return
+                except IndexError:
+                    pass
+            self.setColumnValue(i, value, page, row)
+
+        return setter
+
+    def columnGetter(self, name):
+        """
+        Returns a function that gets values of a single column.
+
+        Args:
+            name (str or int): Column name, or the index returned when it was defined.
+
+        Returns:
+            function: f(page, row), equivalent to getColumnValue(name, page, row).
+
+        Raises:
+            Exception: If the column name is invalid.
+        """
+        if isinstance(name, int) and 0 <= name < len(self.columnName):
+            i = name
+        else:
+            i = _findIndex(self.columnName, self._columnIndex, name)
+        if i is None:
+            msg = "Invalid column name " + str(name)
+            raise Exception(msg)
+
+        def getter(page, row):
+            if page > 0 and row > 0:
+                try:
+                    return self.columnData[i][page - 1][row - 1]
+                except IndexError:
+                    pass
+            return self.getColumnValue(self.columnName[i], page, row)
+
+        return getter
+
+    def parameterSetter(self, name):
+        """
+        Returns a function that sets values of a single parameter.
+
+        Args:
+            name (str or int): Parameter name, or the index returned when it was defined.
+
+        Returns:
+            function: f(page, value), equivalent to setParameterValue(name, value, page).
+
+        Raises:
+            Exception: If the parameter name is invalid.
+        """
+        if isinstance(name, int) and 0 <= name < len(self.parameterName):
+            i = name
+        else:
+            i = _findIndex(self.parameterName, self._parameterIndex, name)
+        if i is None:
+            msg = "Invalid parameter name " + str(name)
+            raise Exception(msg)
+
+        def setter(page, value):
+            if page > 0:
+                try:
+                    self.parameterData[i][page - 1] = value
+                    return
+                except IndexError:
+                    pass
+            self.setParameterValue(i, value, page)
+
+        return setter
+
+    def parameterGetter(self, name):
+        """
+        Returns a function that gets values of a single parameter.
+
+        Args:
+            name (str or int): Parameter name, or the index returned when it was defined.
+
+        Returns:
+            function: f(page), equivalent to getParameterValue(name, page).
+
+        Raises:
+            Exception: If the parameter name is invalid.
+        """
+        if isinstance(name, int) and 0 <= name < len(self.parameterName):
+            i = name
+        else:
+            i = _findIndex(self.parameterName, self._parameterIndex, name)
+        if i is None:
+            msg = "Invalid parameter name " + str(name)
+            raise Exception(msg)
+
+        def getter(page):
+            if page > 0:
+                try:
+                    return self.parameterData[i][page - 1]
+                except IndexError:
+                    pass
+            return self.getParameterValue(self.parameterName[i], page)
+
+        return getter
+
     def getParameterCount(self):
         """
         Retrieves the number of parameters.
@@ -1205,6 +1631,33 @@ class SDDS:
         """
         return(self.columnName)
 
+    def getParameterDatatypes(self):
+        """
+        Retrieves the data types of all parameters.
+
+        Returns:
+            list: Numbers representing the data types, in the order of getParameterNames.
+        """
+        return([definition[4] for definition in self.parameterDefinition])
+
+    def getArrayDatatypes(self):
+        """
+        Retrieves the data types of all arrays.
+
+        Returns:
+            list: Numbers representing the data types, in the order of getArrayNames.
+        """
+        return([definition[5] for definition in self.arrayDefinition])
+
+    def getColumnDatatypes(self):
+        """
+        Retrieves the data types of all columns.
+
+        Returns:
+            list: Numbers representing the data types, in the order of getColumnNames.
+        """
+        return([definition[4] for definition in self.columnDefinition])
+
     def getParameterDatatype(self, name):
         """
         Retrieves the data type of a parameter.
@@ -1215,8 +1668,9 @@ class SDDS:
         Returns:
             int: Number representing the data type of the parameter.
         """
-        if name in self.parameterName:
-            return(self.parameterDefinition[self.parameterName.index(name)][4])
+        i = _findIndex(self.parameterName, self._parameterIndex, name)
+        if i is not None:
+            return(self.parameterDefinition[i][4])
         else:
             msg = "Invalid parameter name " + name
             raise Exception(msg)
@@ -1231,8 +1685,9 @@ class SDDS:
         Returns:
             int: Number representing the data type of the array.
         """
-        if name in self.arrayName:
-            return(self.arrayDefinition[self.arrayName.index(name)][5])
+        i = _findIndex(self.arrayName, self._arrayIndex, name)
+        if i is not None:
+            return(self.arrayDefinition[i][5])
         else:
             msg = "Invalid array name " + name
             raise Exception(msg)
@@ -1247,8 +1702,9 @@ class SDDS:
         Returns:
             int: Number representing the data type of the column.
         """
-        if name in self.columnName:
-            return(self.columnDefinition[self.columnName.index(name)][4])
+        i = _findIndex(self.columnName, self._columnIndex, name)
+        if i is not None:
+            return(self.columnDefinition[i][4])
         else:
             msg = "Invalid column name " + name
             raise Exception(msg)
@@ -1263,29 +1719,31 @@ class SDDS:
         Returns:
             str: Units of the parameter.
         """
-        if name in self.parameterName:
-            return(self.parameterDefinition[self.parameterName.index(name)][1])
+        i = _findIndex(self.parameterName, self._parameterIndex, name)
+        if i is not None:
+            return(self.parameterDefinition[i][1])
         else:
             msg = "Invalid parameter name " + name
             raise Exception(msg)
 
-    def getArrayDatatype(self, name):
+    def getArrayUnits(self, name):
         """
-        Retrieves the units of a array.
-    
+        Retrieves the units of an array.
+
         Args:
             name (str): Array name.
         
         Returns:
             str: Units of the array.
         """
-        if name in self.arrayName:
-            return(self.arrayDefinition[self.arrayName.index(name)][1])
+        i = _findIndex(self.arrayName, self._arrayIndex, name)
+        if i is not None:
+            return(self.arrayDefinition[i][1])
         else:
             msg = "Invalid array name " + name
             raise Exception(msg)
-    
-    def getColumnDatatype(self, name):
+
+    def getColumnUnits(self, name):
         """
         Retrieves the units of a column.
 
@@ -1295,8 +1753,9 @@ class SDDS:
         Returns:
             str: Units of the column.
         """
-        if name in self.columnName:
-            return(self.columnDefinition[self.columnName.index(name)][1])
+        i = _findIndex(self.columnName, self._columnIndex, name)
+        if i is not None:
+            return(self.columnDefinition[i][1])
         else:
             msg = "Invalid column name " + name
             raise Exception(msg)
@@ -1343,20 +1802,81 @@ SDDS_BINARY = SDDS.SDDS_BINARY
 SDDS_ASCII = SDDS.SDDS_ASCII
 SDDS_FLUSH_TABLE = SDDS.SDDS_FLUSH_TABLE
 
-def load(input_file) -> SDDS:
+@functools.lru_cache(maxsize=16)
+def _loadState(path, mtime_ns, size):
+    """
+    Reads an SDDS file for load(cache=True) and returns its description, definitions, and data.
+
+    The modification time and size are only part of the cache key, so a file that has
+    changed since it was cached is read again.
+    """
+    sdds_obj = SDDS()
+    sdds_obj.load(path)
+    return (
+        sdds_obj.description.text,
+        sdds_obj.description.contents,
+        sdds_obj.parameterName,
+        sdds_obj.arrayName,
+        sdds_obj.columnName,
+        sdds_obj.parameterDefinition,
+        sdds_obj.arrayDefinition,
+        sdds_obj.columnDefinition,
+        sdds_obj.parameterData,
+        sdds_obj.arrayData,
+        sdds_obj.arrayDimensions,
+        sdds_obj.columnData,
+        sdds_obj.mode,
+        sdds_obj.loaded_pages,
+    )
+
+def clearLoadCache():
+    """
+    Discards the files kept by load(cache=True).
+    """
+    _loadState.cache_clear()
+
+def load(input_file, cache=False) -> SDDS:
     """
     Loads an SDDS file into the SDDS object.
 
     Args:
         input_file (str): The input SDDS filename to load.
+        cache (bool, optional): Keep the file's contents in memory and reuse them while the
+                                file's modification time and size are unchanged (defaults to False).
 
     Raises:
         Exception: If unable to read the SDDS data.
 
     This method reads the SDDS file specified by `input`, and populates the object's data structures
-    with the parameters, arrays, columns, and their respective data.
+    with the parameters, arrays, columns, and their respective data. With `cache`, the 16 most
+    recently loaded files are kept, and every call returns a new SDDS object with its own copy of
+    the data, so changing it does not affect later loads. Use clearLoadCache to release them.
     """
 
+    if cache:
+        try:
+            st = os.stat(input_file)
+            (text, contents, parameterName, arrayName, columnName, parameterDefinition, arrayDefinition,
+             columnDefinition, parameterData, arrayData, arrayDimensions, columnData, mode,
+             loaded_pages) = _loadState(os.path.abspath(input_file), st.st_mtime_ns, st.st_size)
+        except Exception as e:
+            raise ValueError(f"Failed to load the SDDS file: {e}")
+        sdds_obj = SDDS()
+        sdds_obj.description = _Description(text, contents)
+        sdds_obj.parameterName = list(parameterName)
+        sdds_obj.arrayName = list(arrayName)
+        sdds_obj.columnName = list(columnName)
+        sdds_obj.parameterDefinition = [list(definition) for definition in parameterDefinition]
+        sdds_obj.arrayDefinition = [list(definition) for definition in arrayDefinition]
+        sdds_obj.columnDefinition = [list(definition) for definition in columnDefinition]
+        sdds_obj.parameterData = [list(values) for values in parameterData]
+        sdds_obj.arrayData = [[list(values) for values in pages] for pages in arrayData]
+        sdds_obj.arrayDimensions = [[list(dimensions) for dimensions in pages] for pages in arrayDimensions]
+        sdds_obj.columnData = [[list(values) for values in pages] for pages in columnData]
+        sdds_obj.mode = mode
+        sdds_obj.loaded_pages = loaded_pages
+        return sdds_obj
+
     # Initialize an SDDS object
     sdds_obj = SDDS()
 
@@ -1436,6 +1956,39 @@ def save(sdds_obj : SDDS, output_file):
     except Exception as e:
         raise ValueError(f"Failed to load the SDDS file: {e}")
 
+# String representations of the SDDS data types, keyed by numeric type code
+_DATA_TYPE_STRINGS = {
+    1: "SDDS_LONGDOUBLE",
+    2: "SDDS_DOUBLE",
+    3: "SDDS_FLOAT",
+    4: "SDDS_LONG64",
+    5: "SDDS_ULONG64",
+    6: "SDDS_LONG",
+    7: "SDDS_ULONG",
+    8: "SDDS_SHORT",
+    9: "SDDS_USHORT",
+    10: "SDDS_STRING",
+    11: "SDDS_CHARACTER",
+}
+
+# Short string representations of the SDDS data types, keyed by numeric type code
+_DATA_TYPE_SHORT_STRINGS = {
+    1: "longdouble",
+    2: "double",
+    3: "float",
+    4: "long64",
+    5: "ulong64",
+    6: "long",
+    7: "ulong",
+    8: "short",
+    9: "ushort",
+    10: "string",
+    11: "character",
+}
+
+# Numeric SDDS data type codes keyed by their short string representations
+_SHORT_STRING_DATA_TYPES = {name: code for code, name in _DATA_TYPE_SHORT_STRINGS.items()}
+
 def sdds_data_type_to_string(data_type_code):
     """
     Converts a numeric SDDS data type code to its string representation.
@@ -1446,21 +1999,7 @@ def sdds_data_type_to_string(data_type_code):
     Returns:
         str: String representation of the SDDS data type.
     """
-    # Mapping of SDDS numeric data type codes to string representations
-    data_type_map = {
-        1: "SDDS_LONGDOUBLE",
-        2: "SDDS_DOUBLE",
-        3: "SDDS_FLOAT",
-        4: "SDDS_LONG64",
-        5: "SDDS_ULONG64",
-        6: "SDDS_LONG",
-        7: "SDDS_ULONG",
-        8: "SDDS_SHORT",
-        9: "SDDS_USHORT",
-        10: "SDDS_STRING",
-        11: "SDDS_CHARACTER",
-    }
-    return data_type_map.get(data_type_code, "Unknown Data Type")
+    return _DATA_TYPE_STRINGS.get(data_type_code, "Unknown Data Type")
 
 def sdds_data_type_to_short_string(data_type_code):
     """
@@ -1472,21 +2011,7 @@ def sdds_data_type_to_short_string(data_type_code):
     Returns:
         str: String representation of the SDDS data type.
     """
-    # Mapping of SDDS numeric data type codes to string representations
-    data_type_map = {
-        1: "longdouble",
-        2: "double",
-        3: "float",
-        4: "long64",
-        5: "ulong64",
-        6: "long",
-        7: "ulong",
-        8: "short",
-        9: "ushort",
-        10: "string",
-        11: "character",
-    }
-    return data_type_map.get(data_type_code, "Unknown Data Type")
+    return _DATA_TYPE_SHORT_STRINGS.get(data_type_code, "Unknown Data Type")
 
 def sdds_short_string_to_data_type(data_type_code):
     """
@@ -1498,21 +2023,7 @@ def sdds_short_string_to_data_type(data_type_code):
     Returns:
         int: Numeric code of the SDDS data type.
     """
-    # Mapping of SDDS numeric data type codes to string representations
-    data_type_map = {
-        "longdouble": 1,
-        "double": 2,
-        "float": 3,
-        "long64": 4,
-        "ulong64": 5,
-        "long": 6,
-        "ulong": 7,
-        "short": 8,
-        "ushort": 9,
-        "string": 10,
-        "character": 11,
-    }
-    return data_type_map.get(data_type_code, "Unknown Data Type")
+    return _SHORT_STRING_DATA_TYPES.get(data_type_code, "Unknown Data Type")
 
 def demo1(output):
     """
@@ -1598,13 +2109,9 @@ def demo2(output):
     x.setDescription("text", "contents")
     names = ["Short", "Long", "Float", "Double", "String", "Character"]
     types = [x.SDDS_SHORT, x.SDDS_LONG, x.SDDS_FLOAT, x.SDDS_DOUBLE, x.SDDS_STRING, x.SDDS_CHARACTER]
-    for i in range(6):
-        x.defineSimpleParameter(names[i] + "P", types[i])
-        if types[i] == x.SDDS_FLOAT:
-            x.defineSimpleArray(names[i] + "A", types[i], 2)
-        else:
-            x.defineSimpleArray(names[i] + "A", types[i], 1)
-        x.defineSimpleColumn(names[i] + "C", types[i])
+    x.defineSimpleParameters([name + "P" for name in names], types)
+    x.defineSimpleArrays([name + "A" for name in names], types, [2 if type == x.SDDS_FLOAT else 1 for type in types])
+    x.defineSimpleColumns([name + "C" for name in names], types)
     parameterData = [[1, 6], [2, 7], [3.3, 8.8], [4.4, 9.8], ["five", "ten"], ["a", "b"]]
     for i in range(6):
         x.setParameterValueList(names[i] + "P", parameterData[i])
@@ -1641,6 +2148,12 @@ def demo2(output):
     x.save(output)
 
 
+# Definitions of the files written by demo3 and demo4, and appended to by demo5 and demo6,
+# as the name, units, type (and dimension) lists taken by the sddsdata DefineSimple* functions
+_DEMO_PARAMETERS = (["ParameterA"], ["mm"], [SDDS_DOUBLE])
+_DEMO_ARRAYS = (["ArrayA", "ArrayB"], ["DegC", "DegC"], [SDDS_DOUBLE, SDDS_DOUBLE], [1, 2])
+_DEMO_COLUMNS = (["ColumnA", "ColumnB"], ["Volts", "Amps"], [SDDS_DOUBLE, SDDS_DOUBLE])
+
 def demo3(output):
     """
     Demonstrates how to save a demo SDDS file using `sddsdata` commands directly.
@@ -1656,39 +2169,40 @@ def demo3(output):
         # Open SDDS output file
         if sddsdata.InitializeOutput(x.index, x.SDDS_BINARY, 1, "", "", output) != 1:
             raise ValueError("Failed to initialize SDDS output.")
+        # Use a 64 kB output buffer so the header and the page below reach the file in one write.
+        # This must be done before anything is written.
+        if sddsdata.SetOutputBufferSize(x.index, 1 << 16) != 1:
+            raise ValueError("Failed to set the output buffer size.")
         # Setting column_major to true. Only use this if you are going to write whole columns and not one row at a time.
         sddsdata.SetColumnMajorOrder(x.index)
-        # Define parameters
-        if sddsdata.DefineSimpleParameter(x.index, "ParameterA", "mm", x.SDDS_DOUBLE) != 1:
-            raise ValueError("Failed to define parameter.")
-        # Define arrays
-        if sddsdata.DefineSimpleArray(x.index, "ArrayA", "DegC", x.SDDS_DOUBLE, 1) != 1:
-            raise ValueError("Failed to define array.")
-        if sddsdata.DefineSimpleArray(x.index, "ArrayB", "DegC", x.SDDS_DOUBLE, 2) != 1:
-            raise ValueError("Failed to define array.")
-        # Define columns
-        if sddsdata.DefineSimpleColumn(x.index, "ColumnA", "Volts", x.SDDS_DOUBLE) != 1:
-            raise ValueError("Failed to define column.")
-        if sddsdata.DefineSimpleColumn(x.index, "ColumnB", "Amps", x.SDDS_DOUBLE) != 1:
-            raise ValueError("Failed to define column.")
+        # Define the parameters, arrays, and columns with one call for each
+        if sddsdata.DefineSimpleParameters(x.index, *_DEMO_PARAMETERS) != 1:
+            raise ValueError("Failed to define parameters.")
+        if sddsdata.DefineSimpleArrays(x.index, *_DEMO_ARRAYS) != 1:
+            raise ValueError("Failed to define arrays.")
+        if sddsdata.DefineSimpleColumns(x.index, *_DEMO_COLUMNS) != 1:
+            raise ValueError("Failed to define columns.")
         # Write SDDS header
         if sddsdata.WriteLayout(x.index) != 1:
             raise ValueError("Failed to write SDDS layout.")
-        # Start SDDS page. Allocate 100 rows.
-        if sddsdata.StartPage(x.index, 100) != 1:
+        # Column values, also as typed arrays
+        columnA = array.array("d", [1, 2, 3])
+        columnB = array.array("d", [1, 2, 3])
+        # Start SDDS page. Allocate exactly the rows of the columns.
+        if sddsdata.StartPage(x.index, len(columnA)) != 1:
             raise ValueError("Failed to start SDDS page.")
         # Set parameter values
         if sddsdata.SetParameter(x.index, "ParameterA", 1.1) != 1:
             raise ValueError("Failed to set parameter value.")
-        # Set array values
-        if sddsdata.SetArray(x.index, "ArrayA", [1, 2, 3], [3]) != 1:
+        # Set array values. Typed arrays of the array's data type are copied without converting each value.
+        if sddsdata.SetArray(x.index, "ArrayA", array.array("d", [1, 2, 3]), [3]) != 1:
             raise ValueError("Failed to set array value.")
-        if sddsdata.SetArray(x.index, "ArrayB", [1, 2, 3, 4, 5, 6], [2, 3]) != 1:
+        if sddsdata.SetArray(x.index, "ArrayB", array.array("d", [1, 2, 3, 4, 5, 6]), [2, 3]) != 1:
             raise ValueError("Failed to set array value.")
         # Set column values
-        if sddsdata.SetColumn(x.index, "ColumnA", [1, 2, 3]) != 1:
+        if sddsdata.SetColumn(x.index, "ColumnA", columnA) != 1:
             raise ValueError("Failed to set column value.")
-        if sddsdata.SetColumn(x.index, "ColumnB", [1, 2, 3]) != 1:
+        if sddsdata.SetColumn(x.index, "ColumnB", columnB) != 1:
             raise ValueError("Failed to set column value.")
         # Write page to disk
         if sddsdata.WritePage(x.index) != 1:
@@ -1710,6 +2224,9 @@ def demo4(output):
         output (str): The output SDDS filename to save the demo data.
 
     This function shows how to write data to an SDDS file one row at a time, useful for logging applications.
+    Logged rows are collected in one list per column, and each column is set with a single SetColumn
+    call before the page is flushed, rather than calling SetRowValues for every row. The rows are
+    flushed every 16 rows or every second, whichever comes first, and once more before closing.
     """
     x = SDDS()
 
@@ -1720,24 +2237,24 @@ def demo4(output):
         # Turning on fsync mode and fixed rows count mode. These are useful for loggers.
         sddsdata.EnableFSync(x.index)
         sddsdata.SetFixedRowCountMode(x.index)
-        # Define parameters
-        if sddsdata.DefineSimpleParameter(x.index, "ParameterA", "mm", x.SDDS_DOUBLE) != 1:
-            raise ValueError("Failed to define parameter.")
-        # Define arrays
-        if sddsdata.DefineSimpleArray(x.index, "ArrayA", "DegC", x.SDDS_DOUBLE, 1) != 1:
-            raise ValueError("Failed to define array.")
-        if sddsdata.DefineSimpleArray(x.index, "ArrayB", "DegC", x.SDDS_DOUBLE, 2) != 1:
-            raise ValueError("Failed to define array.")
-        # Define columns
-        if sddsdata.DefineSimpleColumn(x.index, "ColumnA", "Volts", x.SDDS_DOUBLE) != 1:
-            raise ValueError("Failed to define column.")
-        if sddsdata.DefineSimpleColumn(x.index, "ColumnB", "Amps", x.SDDS_DOUBLE) != 1:
-            raise ValueError("Failed to define column.")
+        # Define the parameters, arrays, and columns with one call for each
+        if sddsdata.DefineSimpleParameters(x.index, *_DEMO_PARAMETERS) != 1:
+            raise ValueError("Failed to define parameters.")
+        if sddsdata.DefineSimpleArrays(x.index, *_DEMO_ARRAYS) != 1:
+            raise ValueError("Failed to define arrays.")
+        if sddsdata.DefineSimpleColumns(x.index, *_DEMO_COLUMNS) != 1:
+            raise ValueError("Failed to define columns.")
         # Write SDDS header
         if sddsdata.WriteLayout(x.index) != 1:
             raise ValueError("Failed to write SDDS layout.")
-        # Start SDDS page, allocate 2 rows.
-        if sddsdata.StartPage(x.index, 2) != 1:
+        # Rows are flushed to the file when this many rows are waiting, or when this many seconds
+        # have passed since the last flush. Every flush is followed by an fsync, so flushing less
+        # often gives a higher write throughput, at the cost of losing more rows if the logger
+        # stops before the next flush.
+        flushRows = 16
+        flushSeconds = 1.0
+        # Start SDDS page, allocate the rows held between flushes.
+        if sddsdata.StartPage(x.index, flushRows) != 1:
             raise ValueError("Failed to start SDDS page.")
         # Set parameter values
         if sddsdata.SetParameter(x.index, "ParameterA", 1.1) != 1:
@@ -1747,20 +2264,33 @@ def demo4(output):
             raise ValueError("Failed to set array value.")
         if sddsdata.SetArray(x.index, "ArrayB", [1, 2, 3, 4, 5, 6], [2, 3]) != 1:
             raise ValueError("Failed to set array value.")
-        # Set all columns, one row at a time
-        if sddsdata.SetRowValues(x.index, 0, ["ColumnA", 1, "ColumnB", 1]) != 1:
-            raise ValueError("Failed to set row values.")
-        if sddsdata.SetRowValues(x.index, 1, ["ColumnA", 2, "ColumnB", 2]) != 1:
-            raise ValueError("Failed to set row values.")
-        # Update page because we reached the row allocation limit set in the StartPage command
-        if sddsdata.UpdatePage(x.index, x.SDDS_FLUSH_TABLE) != 1:
-            raise ValueError("Failed to update SDDS page.")
-        # Set more rows
-        if sddsdata.SetRowValues(x.index, 2, ["ColumnA", 3, "ColumnB", 3]) != 1:
-            raise ValueError("Failed to set row values.")
-        # Update page
-        if sddsdata.UpdatePage(x.index, x.SDDS_FLUSH_TABLE) != 1:
-            raise ValueError("Failed to update SDDS page.")
+
+        columnA = []
+        columnB = []
+
+        def flush():
+            # Set each column with a single call and write the rows. The flushed rows
+            # are no longer held in memory, so the lists start over.
+            if sddsdata.SetColumn(x.index, "ColumnA", columnA) != 1:
+                raise ValueError("Failed to set column values.")
+            if sddsdata.SetColumn(x.index, "ColumnB", columnB) != 1:
+                raise ValueError("Failed to set column values.")
+            if sddsdata.UpdatePage(x.index, x.SDDS_FLUSH_TABLE) != 1:
+                raise ValueError("Failed to update SDDS page.")
+            columnA.clear()
+            columnB.clear()
+
+        # Log rows into one list per column
+        lastFlush = time.monotonic()
+        for a, b in ((1, 1), (2, 2), (3, 3)):
+            columnA.append(a)
+            columnB.append(b)
+            if len(columnA) == flushRows or time.monotonic() - lastFlush >= flushSeconds:
+                flush()
+                lastFlush = time.monotonic()
+        # Flush the remaining rows before closing the file
+        if columnA:
+            flush()
         # Close SDDS output file
         if sddsdata.Terminate(x.index) != 1:
             raise ValueError("Failed to terminate SDDS output.")
@@ -1786,13 +2316,11 @@ def demo5(output):
         rows = sddsdata.InitializeAppendToPage(x.index, output, 100)
         if rows == 0:
             raise ValueError("Failed to initialize appending to SDDS page.")
-        # Set all columns, one row at a time
-        if sddsdata.SetRowValues(x.index, rows, ["ColumnA", 4, "ColumnB", 4]) != 1:
-            raise ValueError("Failed to set row values.")
-        if sddsdata.SetRowValues(x.index, rows + 1, ["ColumnA", 5, "ColumnB", 5]) != 1:
-            raise ValueError("Failed to set row values.")
-        if sddsdata.SetRowValues(x.index, rows + 2, ["ColumnA", 6, "ColumnB", 6]) != 1:
-            raise ValueError("Failed to set row values.")
+        # Set all columns, one row at a time. SetRow takes the values in column order,
+        # so no column names are passed or looked up for each row.
+        for i, values in enumerate(((4, 4), (5, 5), (6, 6))):
+            if sddsdata.SetRow(x.index, rows + i, values) != 1:
+                raise ValueError("Failed to set row values.")
         # Update page
         if sddsdata.UpdatePage(x.index, x.SDDS_FLUSH_TABLE) != 1:
             raise ValueError("Failed to update SDDS page.")
@@ -1820,24 +2348,28 @@ def demo6(output):
         # Open SDDS output file
         if sddsdata.InitializeAppend(x.index, output) != 1:
             raise ValueError("Failed to initialize appending to SDDS file.")
-        # Allocate rows
-        if sddsdata.StartPage(x.index, 100) != 1:
+        # Collect the rows in one typed array per column
+        columnA = array.array("d")
+        columnB = array.array("d")
+        for a, b in ((7, 7), (8, 8), (9, 9)):
+            columnA.append(a)
+            columnB.append(b)
+        # Allocate exactly the collected rows
+        if sddsdata.StartPage(x.index, len(columnA)) != 1:
             raise ValueError("Failed to start SDDS page.")
         # Set parameter values
         if sddsdata.SetParameter(x.index, "ParameterA", 1.1) != 1:
             raise ValueError("Failed to set parameter value.")
-        # Set array values
-        if sddsdata.SetArray(x.index, "ArrayA", [1, 2, 3], [3]) != 1:
+        # Set array values. Typed arrays of the array's data type are copied without converting each value.
+        if sddsdata.SetArray(x.index, "ArrayA", array.array("d", [1, 2, 3]), [3]) != 1:
             raise ValueError("Failed to set array value.")
-        if sddsdata.SetArray(x.index, "ArrayB", [1, 2, 3, 4, 5, 6], [2, 3]) != 1:
+        if sddsdata.SetArray(x.index, "ArrayB", array.array("d", [1, 2, 3, 4, 5, 6]), [2, 3]) != 1:
             raise ValueError("Failed to set array value.")
-        # Set all columns, one row at a time
-        if sddsdata.SetRowValues(x.index, 0, ["ColumnA", 7, "ColumnB", 7]) != 1:
-            raise ValueError("Failed to set row values.")
-        if sddsdata.SetRowValues(x.index, 1, ["ColumnA", 8, "ColumnB", 8]) != 1:
-            raise ValueError("Failed to set row values.")
-        if sddsdata.SetRowValues(x.index, 2, ["ColumnA", 9, "ColumnB", 9]) != 1:
-            raise ValueError("Failed to set row values.")
+        # Set each column with a single call
+        if sddsdata.SetColumn(x.index, "ColumnA", columnA) != 1:
+            raise ValueError("Failed to set column values.")
+        if sddsdata.SetColumn(x.index, "ColumnB", columnB) != 1:
+            raise ValueError("Failed to set column values.")
         # Write page
         if sddsdata.WritePage(x.index) != 1:
             raise ValueError("Failed to write SDDS page.")
@@ -1849,10 +2381,28 @@ def demo6(output):
         sddsdata.PrintErrors(x.SDDS_VERBOSE_PrintErrors)
         raise
 
+def _withSlots(cls):
+    """
+    Returns a copy of a dataclass that stores its fields in __slots__.
+
+    Slotted instances have no per-instance __dict__, so the many definitions of a large
+    file take less memory and their fields are read directly. This is what
+    dataclass(slots=True) does on Python 3.10 and newer.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names + ("__weakref__",)
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
 @dataclass
 class Description:
     text: Optional[str] = None
     contents: Optional[str] = None
+@_withSlots
 @dataclass
 class Parameter:
     name: str
@@ -1862,6 +2412,7 @@ class Parameter:
     description: Optional[Any] = None
     format_string: Optional[Any] = None
     fixed_value: Optional[str] = None
+@_withSlots
 @dataclass
 class Array:
     name: str
@@ -1873,6 +2424,7 @@ class Array:
     group_name: Optional[Any] = None
     field_length: Optional[Any] = None
     dimensions: Optional[Any] = None
+@_withSlots
 @dataclass
 class Column:
     name: str
@@ -1882,15 +2434,74 @@ class Column:
     description: Optional[Any] = None
     format_string: Optional[Any] = None
     field_length: Optional[Any] = None
+@dataclass
 class SddsFile:
-    def __init__(self):
-        self.pages = 0
-        self.binary = False
-        self.definitions = {}
-        self.values = {}
-        self.array_dims = {}
-
-def read(input_file) -> SddsFile:
+    pages: int = 0
+    binary: bool = False
+    description: Optional[Description] = None
+    definitions: dict = field(default_factory=dict)
+    values: dict = field(default_factory=dict)
+    array_dims: dict = field(default_factory=dict)
+
+def _toSddsFile(sdds_obj) -> SddsFile:
+    """
+    Builds the SddsFile returned by read() from the data loaded into an SDDS object.
+
+    The values of the SddsFile refer to the object's data lists; they are not copied.
+    """
+    # Initialize the output dictionary
+    sdds_data = SddsFile()
+
+    # Store the data mode (ascii or binary)
+    if sdds_obj.mode == SDDS.SDDS_BINARY:
+        sdds_data.binary = True
+    else:
+        sdds_data.binary = False
+
+    # Store description data
+    text, contents = sdds_obj.description
+    # SDDS metadata strings are either empty or meaningful, so "or None" maps only "" to None
+    text = text or None
+    contents = contents or None
+    description_instance = Description(text=text, contents=contents)
+    sdds_data.description = description_instance
+
+    # Store number of pages
+    sdds_data.pages = sdds_obj.loaded_pages
+
+    # Store parameter data
+    definitions = sdds_data.definitions
+    values = sdds_data.values
+    for name, definition, data in zip(sdds_obj.parameterName, sdds_obj.parameterDefinition, sdds_obj.parameterData):
+        symbol, units, description, formatString, datatype, fixedValue = definition
+        definitions[name] = Parameter(name=name, type=sdds_data_type_to_short_string(datatype), symbol=symbol or None,
+                                      units=units or None, description=description or None,
+                                      format_string=formatString or None, fixed_value=fixedValue or None)
+        values[name] = data
+
+    # Store array data
+    array_dims = sdds_data.array_dims
+    for name, definition, data, dims in zip(sdds_obj.arrayName, sdds_obj.arrayDefinition, sdds_obj.arrayData, sdds_obj.arrayDimensions):
+        symbol, units, description, formatString, group_name, datatype, fieldLength, dimensions = definition
+        definitions[name] = Array(name=name, type=sdds_data_type_to_short_string(datatype), symbol=symbol or None,
+                                  units=units or None, description=description or None,
+                                  format_string=formatString or None, group_name=group_name or None,
+                                  field_length=fieldLength or None, dimensions=dimensions if dimensions != '' else None)
+        values[name] = data
+        array_dims[name] = dims
+
+    # Store column data
+    for name, definition, data in zip(sdds_obj.columnName, sdds_obj.columnDefinition, sdds_obj.columnData):
+        symbol, units, description, formatString, datatype, fieldLength = definition
+        definitions[name] = Column(name=name, type=sdds_data_type_to_short_string(datatype), symbol=symbol or None,
+                                   units=units or None, description=description or None,
+                                   format_string=formatString or None, field_length=fieldLength or None)
+        values[name] = data
+
+    # Return the dictionary
+    return sdds_data
+
+def read(input_file, pack=False) -> SddsFile:
     """
     Mostly backward compatible with the PyLHC sdds module read() function.
     Unlike the PyLHC version, this function reads all the SDDS pages and works with column data.
@@ -1898,6 +2509,10 @@ def read(input_file) -> SddsFile:
 
     Args:
         input_file (str): The input SDDS file to be read.
+        pack (bool, optional): Return the pages of numeric arrays and columns as `array.array`
+                               objects instead of lists, as packColumnData and packArrayData do.
+                               They use less memory and are written by write() without
+                               converting each value (defaults to False).
 
     Returns:
         dict: A dictionary with parameters, arrays, and columns data.
@@ -1909,8 +2524,10 @@ def read(input_file) -> SddsFile:
                   "values":      {parameter_name: {[Page1Value, Page2Value, ...]},
                                  {array_name:     {[Page1List, Page2List, ...]},
                                  {column_name:    {[Page1List, Page2List, ...]},
-                  "values":      {array_name:     {[page1DimList, Page2DimList, ...]}
+                  "array_dims":  {array_name:     {[page1DimList, Page2DimList, ...]}
               }
+              Each page of an array is a flat list of all its elements in row-major order,
+              whatever the number of dimensions; the page's dimension list gives its shape.
     """
     # Initialize an SDDS object
     sdds_obj = SDDS()
@@ -1920,72 +2537,95 @@ def read(input_file) -> SddsFile:
         sdds_obj.load(input_file)
     except Exception as e:
         raise ValueError(f"Failed to load the SDDS file: {e}")
+    if pack:
+        sdds_obj.packArrayData()
+        sdds_obj.packColumnData()
 
-    # Initialize the output dictionary
-    sdds_data = SddsFile()
+    return _toSddsFile(sdds_obj)
 
-    # Store the data mode (ascii or binary)
-    if sdds_obj.mode == SDDS.SDDS_BINARY:
-        sdds_data.binary = True
-    else:
-        sdds_data.binary = False
+def readPages(input_file, pack=False):
+    """
+    Reads an SDDS file one page at a time, like read() but without holding the whole file in memory.
 
-    # Store description data
-    text = sdds_obj.description[0] if sdds_obj.description[0] != "" else None
-    contents = sdds_obj.description[1] if sdds_obj.description[1] != "" else None
-    description_instance = Description(text=text, contents=contents)
-    sdds_data.description = description_instance
+    Args:
+        input_file (str): The input SDDS file to be read.
+        pack (bool, optional): Return numeric array and column pages as `array.array` objects,
+                               as read() does (defaults to False).
 
-    # Store number of pages
-    sdds_data.pages = sdds_obj.loaded_pages
+    Yields:
+        SddsFile: One SddsFile per page, with `pages` set to 1 and the values of that page only.
 
-    # Store parameter data
-    if sdds_obj.parameterName:
-        for i, definition in enumerate(sdds_obj.parameterDefinition):
-            name = sdds_obj.parameterName[i]
-            symbol = definition[0] if definition[0] != '' else None
-            units = definition[1] if definition[1] != '' else None
-            description = definition[2] if definition[2] != '' else None
-            formatString = definition[3] if definition[3] != '' else None
-            datatype = sdds_data_type_to_short_string(definition[4])
-            fixedValue = definition[5] if definition[5] != '' else None
-            parameter_instance = Parameter(name=name, type=datatype, symbol=symbol, units=units, description=description, format_string=formatString, fixed_value=fixedValue)
-            sdds_data.definitions.update({name: parameter_instance})
-            sdds_data.values.update({name: sdds_obj.parameterData[i]})
+    Raises:
+        ValueError: If unable to read the SDDS data.
 
-    # Store array data
-    if sdds_obj.arrayName:
-        for i, definition in enumerate(sdds_obj.arrayDefinition):
-            name = sdds_obj.arrayName[i]
-            symbol = definition[0] if definition[0] != '' else None
-            units = definition[1] if definition[1] != '' else None
-            description = definition[2] if definition[2] != '' else None
-            formatString = definition[3] if definition[3] != '' else None
-            group_name = definition[4] if definition[4] != '' else None
-            datatype = sdds_data_type_to_short_string(definition[5])
-            fieldLength = definition[6] if definition[6] != 0 else None
-            dimensions = definition[7] if definition[7] != '' else None
-            array_instance = Array(name=name, type=datatype, symbol=symbol, units=units, description=description, format_string=formatString, group_name=group_name, field_length=fieldLength, dimensions=dimensions)
-            sdds_data.definitions.update({name: array_instance})
-            sdds_data.values.update({name: sdds_obj.arrayData[i]})
-            sdds_data.array_dims.update({name: sdds_obj.arrayDimensions[i]})
+    Example:
+        for page in sdds.readPages("input.sdds"):
+            print(page.values["x"][0])
+    """
+    # Initialize an SDDS object
+    sdds_obj = SDDS()
 
-    # Store column data
-    if sdds_obj.columnName:
-        for i, definition in enumerate(sdds_obj.columnDefinition):
-            name = sdds_obj.columnName[i]
-            symbol = definition[0] if definition[0] != '' else None
-            units = definition[1] if definition[1] != '' else None
-            description = definition[2] if definition[2] != '' else None
-            formatString = definition[3] if definition[3] != '' else None
-            datatype = sdds_data_type_to_short_string(definition[4])
-            fieldLength = definition[5] if definition[5] != 0 else None
-            column_instance = Column(name=name, type=datatype, symbol=symbol, units=units, description=description, format_string=formatString, field_length=fieldLength)
-            sdds_data.definitions.update({name: column_instance})
-            sdds_data.values.update({name: sdds_obj.columnData[i]})
+    try:
+        for _ in sdds_obj.iterPages(input_file):
+            if pack:
+                sdds_obj.packArrayData()
+                sdds_obj.packColumnData()
+            sdds_data = _toSddsFile(sdds_obj)
+            sdds_data.pages = 1
+            yield sdds_data
+    except Exception as e:
+        raise ValueError(f"Failed to load the SDDS file: {e}")
 
-    # Return the dictionary
-    return sdds_data
+def _writeParameter(sdds_obj, name, parameter_instance, values, array_dims):
+    """
+    Defines a parameter of an SddsFile in an SDDS object and sets its values, for write().
+
+    Missing metadata strings are None or "", so "or" replaces both with "". Fixed values,
+    field lengths, and dimensions are compared with None because 0 is a valid value.
+    """
+    symbol = parameter_instance.symbol or ""
+    units = parameter_instance.units or ""
+    description = parameter_instance.description or ""
+    formatString = parameter_instance.format_string or ""
+    datatype = sdds_short_string_to_data_type(parameter_instance.type)
+    fixedValue = parameter_instance.fixed_value if parameter_instance.fixed_value != None else ""
+    sdds_obj.defineParameter(name, symbol=symbol, units=units, description=description,
+                             formatString=formatString, type=datatype, fixedValue=fixedValue)
+    sdds_obj.setParameterValueList(name, values)
+
+def _writeArray(sdds_obj, name, array_instance, values, array_dims):
+    """
+    Defines an array of an SddsFile in an SDDS object and sets its values and dimensions, for write().
+    """
+    symbol = array_instance.symbol or ""
+    units = array_instance.units or ""
+    description = array_instance.description or ""
+    formatString = array_instance.format_string or ""
+    group_name = array_instance.group_name or ""
+    datatype = sdds_short_string_to_data_type(array_instance.type)
+    fieldLength = array_instance.field_length if array_instance.field_length != None else 0
+    dimensions = array_instance.dimensions if array_instance.dimensions != None else 1
+    sdds_obj.defineArray(name, symbol=symbol, units=units, description=description,
+                         formatString=formatString, group_name=group_name, type=datatype,
+                         fieldLength=fieldLength, dimensions=dimensions)
+    sdds_obj.setArrayValueLists(name, values, array_dims[name])
+
+def _writeColumn(sdds_obj, name, column_instance, values, array_dims):
+    """
+    Defines a column of an SddsFile in an SDDS object and sets its values, for write().
+    """
+    symbol = column_instance.symbol or ""
+    units = column_instance.units or ""
+    description = column_instance.description or ""
+    formatString = column_instance.format_string or ""
+    datatype = sdds_short_string_to_data_type(column_instance.type)
+    fieldLength = column_instance.field_length if column_instance.field_length != None else 0
+    sdds_obj.defineColumn(name, symbol=symbol, units=units, description=description,
+                          formatString=formatString, type=datatype, fieldLength=fieldLength)
+    sdds_obj.setColumnValueLists(name, values)
+
+# write() handler of each definition class, looked up by the exact type of a definition
+_WRITERS = {Parameter: _writeParameter, Array: _writeArray, Column: _writeColumn}
 
 def write(sdds_file: SddsFile, output_file):
     """
@@ -1999,59 +2639,33 @@ def write(sdds_file: SddsFile, output_file):
     # Initialize an SDDS object
     sdds_obj = SDDS()
 
-    # Set the data mode (ascii or binary)
-    if hasattr(sdds_file, 'binary'):
-        if sdds_file.binary:
-            sdds_obj.mode = SDDS.SDDS_BINARY
-        else:
-            sdds_obj.mode = SDDS.SDDS_ASCII
+    # Set the data mode (ascii or binary). Objects from the PyLHC module have no binary attribute.
+    if getattr(sdds_file, 'binary', False):
+        sdds_obj.mode = SDDS.SDDS_BINARY
+    else:
+        sdds_obj.mode = SDDS.SDDS_ASCII
 
     # Set description data
-    if hasattr(sdds_file, 'description'):
-        text = sdds_file.description.text if sdds_file.description.text != None else ''
-        contents = sdds_file.description.contents if sdds_file.description.contents != None else ''
+    description = getattr(sdds_file, 'description', None)
+    if description is not None:
+        text = description.text or ''
+        contents = description.contents or ''
         sdds_obj.setDescription(text, contents)
-    
-    for name in sdds_file.definitions:
-        if isinstance(sdds_file.definitions[name], Parameter):
-            # Set parameter data
-            parameter_instance = sdds_file.definitions[name]
-            symbol = parameter_instance.symbol if parameter_instance.symbol != None else ""
-            units = parameter_instance.units if parameter_instance.units != None else ""
-            description = parameter_instance.description if parameter_instance.description != None else ""
-            formatString = parameter_instance.format_string if parameter_instance.format_string != None else ""
-            datatype = sdds_short_string_to_data_type(parameter_instance.type)
-            fixedValue = parameter_instance.fixed_value if parameter_instance.fixed_value != None else ""
-            sdds_obj.defineParameter(name, symbol=symbol, units=units, description=description,
-                                     formatString=formatString, type=datatype, fixedValue=fixedValue)
-            sdds_obj.setParameterValueList(name, sdds_file.values[name])
-        elif isinstance(sdds_file.definitions[name], Array):
-            # Set array data
-            array_instance = sdds_file.definitions[name]
-            symbol = array_instance.symbol if array_instance.symbol != None else ""
-            units = array_instance.units if array_instance.units != None else ""
-            description = array_instance.description if array_instance.description != None else ""
-            formatString = array_instance.format_string if array_instance.format_string != None else ""
-            group_name = array_instance.group_name if array_instance.group_name != None else ""
-            datatype = sdds_short_string_to_data_type(array_instance.type)
-            fieldLength = array_instance.field_length if array_instance.field_length != None else 0
-            dimensions = array_instance.dimensions if array_instance.dimensions != None else 1
-            sdds_obj.defineArray(name, symbol=symbol, units=units, description=description,
-                                 formatString=formatString, group_name=group_name, type=datatype,
-                                 fieldLength=fieldLength, dimensions=dimensions)
-            sdds_obj.setArrayValueLists(name, sdds_file.values[name], sdds_file.array_dims[name])
-        elif isinstance(sdds_file.definitions[name], Column):
-            # Set column data
-            column_instance = sdds_file.definitions[name]
-            symbol = column_instance.symbol if column_instance.symbol != None else ""
-            units = column_instance.units if column_instance.units != None else ""
-            description = column_instance.description if column_instance.description != None else ""
-            formatString = column_instance.format_string if column_instance.format_string != None else ""
-            datatype = sdds_short_string_to_data_type(column_instance.type)
-            fieldLength = column_instance.field_length if column_instance.field_length != None else 0
-            sdds_obj.defineColumn(name, symbol=symbol, units=units, description=description,
-                                  formatString=formatString, type=datatype, fieldLength=fieldLength)
-            sdds_obj.setColumnValueLists(name, sdds_file.values[name])
+
+    # Look up the value and dimension dictionaries once. Objects from the PyLHC module have no array_dims.
+    values = sdds_file.values
+    array_dims = getattr(sdds_file, 'array_dims', {})
+    for name, definition in sdds_file.definitions.items():
+        writer = _WRITERS.get(type(definition))
+        if writer is None:
+            # Subclasses of Parameter, Array, and Column
+            for cls, w in _WRITERS.items():
+                if isinstance(definition, cls):
+                    writer = w
+                    break
+            else:
+                continue
+        writer(sdds_obj, name, definition, values[name], array_dims)
 
     # Set the data to the output file
     sdds_obj.save(output_file)
@@ -7,6 +7,9 @@
  */
 #include <Python.h>
 #include "SDDS.h"
+#if !defined(_WIN32)
+#include <fcntl.h>
+#endif
 
 #if PY_MAJOR_VERSION >= 3
 #define IS_PY3K
@@ -32,7 +35,57 @@
  * This array maintains a collection of SDDS_DATASET structures
  * that correspond to files being managed by the SDDS library.
  */
-SDDS_DATASET dataset_f[20];
+#define SDDSDATA_DATASETS 20
+SDDS_DATASET dataset_f[SDDSDATA_DATASETS];
+
+/**
+ * @brief Output buffers installed with SetOutputBufferSize, one per dataset.
+ *
+ * They must stay allocated until the dataset's file is closed by Terminate.
+ */
+static char *outputBuffer_f[SDDSDATA_DATASETS];
+
+/**
+ * @brief Checks that a dataset index refers to an entry of dataset_f.
+ *
+ * @param fileIndex Index of the dataset file.
+ *
+ * @return long 1 if the index is valid, otherwise 0 with an SDDS error recorded.
+ */
+static long sddsdata_CheckIndex(long fileIndex)
+{
+  if ((fileIndex < 0) || (fileIndex >= SDDSDATA_DATASETS)) {
+    SDDS_SetError("Dataset index out of range (sddsdata)");
+    return 0;
+  }
+  return 1;
+}
+
+/**
+ * @brief Returns the first character of a Python string.
+ *
+ * ASCII strings are read straight from their character data, which skips
+ * the UTF-8 conversion for the common one character case.
+ *
+ * @param v Python string.
+ * 
+ * @return char The first character, or 0 if the string is empty or invalid.
+ */
+static char sddsdata_CharacterValue( PyObject *v )
+{
+  char *s;
+#ifdef IS_PY3K
+  if (PyUnicode_Check(v) && PyUnicode_IS_COMPACT_ASCII(v)) {
+    if (PyUnicode_GET_LENGTH(v) == 0)
+      return 0;
+    return (char)PyUnicode_1BYTE_DATA(v)[0];
+  }
+#endif
+  s = (char*)PyString_AsString(v);
+  if (s == NULL)
+    return 0;
+  return s[0];
+}
 
 /**
  * @brief Initializes an SDDS dataset for input from a file.
@@ -50,10 +103,18 @@ static PyObject* sddsdata_InitializeInput( PyObject* self, PyObject* args )
 {
   long fileIndex;
   char *filename;
+  long result;
   if (!PyArg_ParseTuple(args, "ls", &fileIndex, &filename)) {
     return 0;
   }
-  return PyLong_FromLong(SDDS_InitializeInput(&dataset_f[fileIndex], filename));
+  result = SDDS_InitializeInput(&dataset_f[fileIndex], filename);
+#if defined(POSIX_FADV_SEQUENTIAL)
+  /* Pages are read front to back, so let the kernel read ahead more aggressively.
+     Compressed input has no plain FILE, and stdin may be a pipe, so both are skipped. */
+  if ((result == 1) && (dataset_f[fileIndex].layout.fp != NULL) && (dataset_f[fileIndex].layout.fp != stdin))
+    posix_fadvise(fileno(dataset_f[fileIndex].layout.fp), 0, 0, POSIX_FADV_SEQUENTIAL);
+#endif
+  return PyLong_FromLong(result);
 }
 
 /**
@@ -156,10 +217,10 @@ static PyObject* sddsdata_SetColumnMajorOrder( PyObject* self, PyObject* args )
 {
   long fileIndex;
   if (!PyArg_ParseTuple(args, "l", &fileIndex)) {
-    return Py_None;
+    return 0;
   }
   dataset_f[fileIndex].layout.data_mode.column_major = 1;
-  return Py_None;
+  Py_RETURN_NONE;
 }
 
 /**
@@ -176,10 +237,10 @@ static PyObject* sddsdata_SetFixedRowCountMode( PyObject* self, PyObject* args )
 {
   long fileIndex;
   if (!PyArg_ParseTuple(args, "l", &fileIndex)) {
-    return Py_None;
+    return 0;
   }
   SDDS_SetRowCountMode(&dataset_f[fileIndex], SDDS_FIXEDROWCOUNT);
-  return Py_None;
+  Py_RETURN_NONE;
 }
 
 /**
@@ -196,10 +257,10 @@ static PyObject* sddsdata_SetRowMajorOrder( PyObject* self, PyObject* args )
 {
   long fileIndex;
   if (!PyArg_ParseTuple(args, "l", &fileIndex)) {
-    return Py_None;
+    return 0;
   }
   dataset_f[fileIndex].layout.data_mode.column_major = 0;
-  return Py_None;
+  Py_RETURN_NONE;
 }
 
 /**
@@ -216,10 +277,10 @@ static PyObject* sddsdata_EnableFSync( PyObject* self, PyObject* args )
 {
   long fileIndex;
   if (!PyArg_ParseTuple(args, "l", &fileIndex)) {
-    return Py_None;
+    return 0;
   }
   dataset_f[fileIndex].layout.data_mode.fsync_data = 1;
-  return Py_None;
+  Py_RETURN_NONE;
 }
 
 /**
@@ -236,10 +297,10 @@ static PyObject* sddsdata_DisableFSync( PyObject* self, PyObject* args )
 {
   long fileIndex;
   if (!PyArg_ParseTuple(args, "l", &fileIndex)) {
-    return Py_None;
+    return 0;
   }
   dataset_f[fileIndex].layout.data_mode.fsync_data = 0;
-  return Py_None;
+  Py_RETURN_NONE;
 }
 
 /**
@@ -256,10 +317,55 @@ static PyObject* sddsdata_DisableFSync( PyObject* self, PyObject* args )
 static PyObject* sddsdata_Terminate( PyObject* self, PyObject* args )
 {
   long fileIndex;
+  long result;
   if (!PyArg_ParseTuple(args, "l", &fileIndex)) {
     return 0;
   }
-  return PyLong_FromLong(SDDS_Terminate(&dataset_f[fileIndex]));
+  result = SDDS_Terminate(&dataset_f[fileIndex]);
+  if (outputBuffer_f[fileIndex]) {
+    free(outputBuffer_f[fileIndex]);
+    outputBuffer_f[fileIndex] = NULL;
+  }
+  return PyLong_FromLong(result);
+}
+
+/**
+ * @brief Sets the size of the stdio buffer used for an SDDS output file.
+ * 
+ * Must be called after InitializeOutput and before WriteLayout. A larger buffer
+ * lets several pages accumulate before they reach the file.
+ * 
+ * @param self Unused pointer to the module object.
+ * @param args Python tuple containing:
+ *  - fileIndex (long): Index of the dataset in the array.
+ *  - bytes (long): Buffer size in bytes.
+ * 
+ * @return PyObject* 
+ *  - 1 on success.
+ *  - 0 on error.
+ */
+static PyObject* sddsdata_SetOutputBufferSize( PyObject* self, PyObject* args )
+{
+  long fileIndex;
+  long bytes;
+  char *buffer;
+  if (!PyArg_ParseTuple(args, "ll", &fileIndex, &bytes)) {
+    return 0;
+  }
+  if (!sddsdata_CheckIndex(fileIndex))
+    return PyLong_FromLong(0);
+  if ((bytes <= 0) || (dataset_f[fileIndex].layout.fp == NULL))
+    return PyLong_FromLong(0);
+  if ((buffer = malloc(bytes)) == NULL)
+    return PyLong_FromLong(0);
+  if (setvbuf(dataset_f[fileIndex].layout.fp, buffer, _IOFBF, bytes) != 0) {
+    free(buffer);
+    return PyLong_FromLong(0);
+  }
+  if (outputBuffer_f[fileIndex])
+    free(outputBuffer_f[fileIndex]);
+  outputBuffer_f[fileIndex] = buffer;
+  return PyLong_FromLong(1);
 }
 
 /**
@@ -277,8 +383,7 @@ static PyObject* sddsdata_Terminate( PyObject* self, PyObject* args )
 static PyObject* sddsdata_SetTerminateMode( PyObject* self, PyObject* args )
 {
   SDDS_SetTerminateMode(TERMINATE_DONT_FREE_TABLE_STRINGS+TERMINATE_DONT_FREE_ARRAY_STRINGS);
-  Py_INCREF(Py_None);
-  return Py_None;
+  Py_RETURN_NONE;
 }
 
 /**
@@ -590,6 +695,147 @@ static PyObject* sddsdata_DefineSimpleParameter( PyObject* self, PyObject* args
   return PyLong_FromLong(SDDS_DefineSimpleParameter(&dataset_f[fileIndex], name, units, type));
 }
 
+/**
+ * @brief Defines several simple parameters in an SDDS dataset with a single call.
+ *
+ * @param self Unused.
+ * @param args A tuple containing:
+ *             - fileIndex (long): Index of the dataset.
+ *             - names (list): Names of the parameters.
+ *             - units (list): Units of the parameters.
+ *             - types (list): Data types of the parameters.
+ * 
+ * @return PyObject* A Python integer (1 on success, 0 on error).
+ */
+static PyObject* sddsdata_DefineSimpleParameters( PyObject* self, PyObject* args )
+{
+  long fileIndex;
+  PyObject *names;
+  PyObject *units;
+  PyObject *types;
+  char *name, *u;
+  long type;
+  long i, n;
+  if (!PyArg_ParseTuple(args, "lOOO", &fileIndex, &names, &units, &types)) {
+    return 0;
+  }
+  if (!sddsdata_CheckIndex(fileIndex))
+    return PyLong_FromLong(0);
+  if (!PyList_Check(names) || !PyList_Check(units) || !PyList_Check(types))
+    return PyLong_FromLong(0);
+  n = (long)PyList_Size(names);
+  if ((PyList_Size(units) != n) || (PyList_Size(types) != n))
+    return PyLong_FromLong(0);
+  for (i=0;i<n;i++) {
+    name = (char*)PyString_AsString(PyList_GetItem(names, i));
+    u = (char*)PyString_AsString(PyList_GetItem(units, i));
+    type = PyLong_AsLong(PyList_GetItem(types, i));
+    if (PyErr_Occurred())
+      return NULL;
+    if (u)
+      if (strlen(u) == 0)
+        u = NULL;
+    if (SDDS_DefineSimpleParameter(&dataset_f[fileIndex], name, u, type) != 1)
+      return PyLong_FromLong(0);
+  }
+  return PyLong_FromLong(1);
+}
+
+/**
+ * @brief Defines several simple columns in an SDDS dataset with a single call.
+ *
+ * @param self Unused.
+ * @param args A tuple containing:
+ *             - fileIndex (long): Index of the dataset.
+ *             - names (list): Names of the columns.
+ *             - units (list): Units of the columns.
+ *             - types (list): Data types of the columns.
+ * 
+ * @return PyObject* A Python integer (1 on success, 0 on error).
+ */
+static PyObject* sddsdata_DefineSimpleColumns( PyObject* self, PyObject* args )
+{
+  long fileIndex;
+  PyObject *names;
+  PyObject *units;
+  PyObject *types;
+  char *name, *u;
+  long type;
+  long i, n;
+  if (!PyArg_ParseTuple(args, "lOOO", &fileIndex, &names, &units, &types)) {
+    return 0;
+  }
+  if (!sddsdata_CheckIndex(fileIndex))
+    return PyLong_FromLong(0);
+  if (!PyList_Check(names) || !PyList_Check(units) || !PyList_Check(types))
+    return PyLong_FromLong(0);
+  n = (long)PyList_Size(names);
+  if ((PyList_Size(units) != n) || (PyList_Size(types) != n))
+    return PyLong_FromLong(0);
+  for (i=0;i<n;i++) {
+    name = (char*)PyString_AsString(PyList_GetItem(names, i));
+    u = (char*)PyString_AsString(PyList_GetItem(units, i));
+    type = PyLong_AsLong(PyList_GetItem(types, i));
+    if (PyErr_Occurred())
+      return NULL;
+    if (u)
+      if (strlen(u) == 0)
+        u = NULL;
+    if (SDDS_DefineSimpleColumn(&dataset_f[fileIndex], name, u, type) != 1)
+      return PyLong_FromLong(0);
+  }
+  return PyLong_FromLong(1);
+}
+
+/**
+ * @brief Defines several simple arrays in an SDDS dataset with a single call.
+ *
+ * @param self Unused.
+ * @param args A tuple containing:
+ *             - fileIndex (long): Index of the dataset.
+ *             - names (list): Names of the arrays.
+ *             - units (list): Units of the arrays.
+ *             - types (list): Data types of the arrays.
+ *             - dimensions (list): Number of dimensions of each array.
+ * 
+ * @return PyObject* A Python integer (1 on success, 0 on error).
+ */
+static PyObject* sddsdata_DefineSimpleArrays( PyObject* self, PyObject* args )
+{
+  long fileIndex;
+  PyObject *names;
+  PyObject *units;
+  PyObject *types;
+  PyObject *dimensions;
+  char *name, *u;
+  long type, dims;
+  long i, n;
+  if (!PyArg_ParseTuple(args, "lOOOO", &fileIndex, &names, &units, &types, &dimensions)) {
+    return 0;
+  }
+  if (!sddsdata_CheckIndex(fileIndex))
+    return PyLong_FromLong(0);
+  if (!PyList_Check(names) || !PyList_Check(units) || !PyList_Check(types) || !PyList_Check(dimensions))
+    return PyLong_FromLong(0);
+  n = (long)PyList_Size(names);
+  if ((PyList_Size(units) != n) || (PyList_Size(types) != n) || (PyList_Size(dimensions) != n))
+    return PyLong_FromLong(0);
+  for (i=0;i<n;i++) {
+    name = (char*)PyString_AsString(PyList_GetItem(names, i));
+    u = (char*)PyString_AsString(PyList_GetItem(units, i));
+    type = PyLong_AsLong(PyList_GetItem(types, i));
+    dims = PyLong_AsLong(PyList_GetItem(dimensions, i));
+    if (PyErr_Occurred())
+      return NULL;
+    if (u)
+      if (strlen(u) == 0)
+        u = NULL;
+    if (SDDS_DefineArray(&dataset_f[fileIndex], name, NULL, u, NULL, NULL, type, 0, dims, NULL) == -1)
+      return PyLong_FromLong(0);
+  }
+  return PyLong_FromLong(1);
+}
+
 /**
  * @brief Writes the layout of an SDDS dataset.
  *
@@ -920,11 +1166,10 @@ static PyObject* sddsdata_DeferSavingLayout( PyObject* self, PyObject* args )
 {
   long fileIndex, mode;
   if (!PyArg_ParseTuple(args, "ll", &fileIndex, &mode)) {
-    return Py_None;
+    return 0;
   }
   SDDS_DeferSavingLayout(&dataset_f[fileIndex],mode);
-  Py_INCREF(Py_None);
-  return Py_None;
+  Py_RETURN_NONE;
 }
 
 /**
@@ -1461,8 +1706,7 @@ static PyObject* sddsdata_NumberOfErrors( PyObject* self, PyObject* args )
 static PyObject* sddsdata_ClearErrors( PyObject* self, PyObject* args ) 
 {
   SDDS_ClearErrors();
-  Py_INCREF(Py_None);
-  return Py_None;
+  Py_RETURN_NONE;
 }
 
 /**
@@ -1480,8 +1724,7 @@ static PyObject* sddsdata_SetError( PyObject* self, PyObject* args )
     return NULL;
   }
   SDDS_SetError(error_text);
-  Py_INCREF(Py_None);
-  return Py_None;
+  Py_RETURN_NONE;
 }
 
 /**
@@ -1499,8 +1742,7 @@ static PyObject* sddsdata_Bomb( PyObject* self, PyObject* args )
     return NULL;
   }
   SDDS_Bomb(message);
-  Py_INCREF(Py_None);
-  return Py_None;
+  Py_RETURN_NONE;
 }
 
 /**
@@ -1518,8 +1760,7 @@ static PyObject* sddsdata_Warning( PyObject* self, PyObject* args )
     return NULL;
   }
   SDDS_Warning(message);
-  Py_INCREF(Py_None);
-  return Py_None;
+  Py_RETURN_NONE;
 }
 
 /**
@@ -1537,8 +1778,7 @@ static PyObject* sddsdata_RegisterProgramName( PyObject* self, PyObject* args )
     return NULL;
   }
   SDDS_RegisterProgramName(name);
-  Py_INCREF(Py_None);
-  return Py_None;
+  Py_RETURN_NONE;
 }
 
 /**
@@ -1556,8 +1796,7 @@ static PyObject* sddsdata_PrintErrors( PyObject* self, PyObject* args )
     return NULL;
   }
   SDDS_PrintErrors(stderr, mode);
-  Py_INCREF(Py_None);
-  return Py_None;
+  Py_RETURN_NONE;
 }
 
 /**
@@ -2343,6 +2582,26 @@ static PyObject* sddsdata_SetAutoCheckMode( PyObject* self, PyObject* args )
   return PyLong_FromLong(SDDS_SetAutoCheckMode(newMode));
 }
 
+/**
+ * @brief Sets the I/O buffer size used for datasets opened afterwards.
+ *
+ * A larger buffer lets binary pages reach the file in fewer write calls.
+ *
+ * @param self Python object (unused).
+ * @param args Python tuple containing:
+ *        - bufferSize: New buffer size in bytes. Values below zero only query the current size.
+ * 
+ * @return PyObject*: Previous buffer size.
+ */
+static PyObject* sddsdata_SetDefaultIOBufferSize( PyObject* self, PyObject* args )
+{
+  long bufferSize;
+  if (!PyArg_ParseTuple(args, "l", &bufferSize)) {
+    return 0;
+  }
+  return PyLong_FromLong(SDDS_SetDefaultIOBufferSize((int32_t)bufferSize));
+}
+
 /**
  * @brief Retrieves a column name by its index from a dataset.
  *
@@ -2566,39 +2825,36 @@ static PyObject* sddsdata_GetParameterNames( PyObject* self, PyObject* args )
 }
 
 /**
- * @brief Sets a parameter value in a dataset by index or name.
+ * @brief Converts the result of a set helper to a status and releases it.
  *
- * @param self Python object (unused).
- * @param args Python tuple containing:
- *        - fileIndex: Index of the dataset file.
- *        - indexOrName: Index or name of the parameter.
- *        - v: Value to set.
+ * @param result Python integer returned by a set helper, or NULL.
+ * 
+ * @return long -1 if result is NULL, the SDDS status otherwise.
+ */
+static long sddsdata_ResultStatus( PyObject *result )
+{
+  long status;
+  if (result == NULL)
+    return -1;
+  status = PyLong_AsLong(result);
+  Py_DECREF(result);
+  return status;
+}
+
+/**
+ * @brief Sets the value of a parameter of a dataset by index.
+ *
+ * @param fileIndex Index of the dataset file.
+ * @param index Index of the parameter.
+ * @param v Value to set.
  * 
  * @return PyObject*:
  *         - 0 on error.
- *         - 1 on success.
+ *         - A Python integer with the SDDS_SetParameters result otherwise.
  */
-static PyObject* sddsdata_SetParameter( PyObject* self, PyObject* args )
+static PyObject* sddsdata_SetParameterValue( long fileIndex, long index, PyObject *v )
 {
-  long fileIndex;
-  PyObject *indexOrName;
-  PyObject *v;
-  long index;
   long type;
-  if (!PyArg_ParseTuple(args, "lOO", &fileIndex, &indexOrName, &v)) {
-    return 0;
-  }
-  if (PyString_Check(indexOrName)) {
-    index = SDDS_GetParameterIndex(&dataset_f[fileIndex], (char*)PyString_AsString(indexOrName));
-  } else if (PyNumber_Check(indexOrName)) {
-    if (PyInt_Check(indexOrName))
-      index = PyInt_AsLong(indexOrName);
-    else if (PyLong_Check(indexOrName))
-      index = PyLong_AsLong(indexOrName);
-    else
-      return 0;
-  } else
-    return 0;
   if ((type = SDDS_GetParameterType(&dataset_f[fileIndex], index)) == 0)
     return 0;
   switch (type) {
@@ -2632,7 +2888,7 @@ static PyObject* sddsdata_SetParameter( PyObject* self, PyObject* args )
   case SDDS_DOUBLE:
     return PyLong_FromLong(SDDS_SetParameters(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,index,PyFloat_AsDouble(v),-1));
   case SDDS_CHARACTER:
-    return PyLong_FromLong(SDDS_SetParameters(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,index,(char)(PyString_AsString(v)[0]),-1));
+    return PyLong_FromLong(SDDS_SetParameters(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,index,sddsdata_CharacterValue(v),-1));
   case SDDS_STRING:
     return PyLong_FromLong(SDDS_SetParameters(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,index,PyString_AsString(v),-1));
   }
@@ -2640,45 +2896,29 @@ static PyObject* sddsdata_SetParameter( PyObject* self, PyObject* args )
 }
 
 /**
- * @brief Sets an array value in a dataset.
+ * @brief Sets a parameter value in a dataset by index or name.
  *
  * @param self Python object (unused).
  * @param args Python tuple containing:
  *        - fileIndex: Index of the dataset file.
- *        - indexOrName: Index or name of the array.
- *        - v: Array values.
- *        - dim: Array dimensions.
+ *        - indexOrName: Index or name of the parameter.
+ *        - v: Value to set.
  * 
  * @return PyObject*:
  *         - 0 on error.
  *         - 1 on success.
  */
-static PyObject* sddsdata_SetArray( PyObject* self, PyObject* args )
+static PyObject* sddsdata_SetParameter( PyObject* self, PyObject* args )
 {
   long fileIndex;
-  long elements;
   PyObject *indexOrName;
   PyObject *v;
-  PyObject *dim;
-  long type;
-  long i;
-  void *data = NULL;
   long index;
-  long result=0;
-  PyObject *temp;
-  ARRAY_DEFINITION *arraydef;
-  char **names=NULL;
-  int32_t number;
-  int32_t dimensions;
-  int32_t *dimension=NULL;
-
-  if (!PyArg_ParseTuple(args, "lOOO", &fileIndex, &indexOrName, &v, &dim)) {
+  if (!PyArg_ParseTuple(args, "lOO", &fileIndex, &indexOrName, &v)) {
     return 0;
   }
   if (PyString_Check(indexOrName)) {
-    index = SDDS_GetArrayIndex(&dataset_f[fileIndex], (char*)PyString_AsString(indexOrName));
-    if ((arraydef = SDDS_GetArrayDefinition(&dataset_f[fileIndex],  (char*)PyString_AsString(indexOrName))) == NULL)
-      return 0;
+    index = SDDS_GetParameterIndex(&dataset_f[fileIndex], (char*)PyString_AsString(indexOrName));
   } else if (PyNumber_Check(indexOrName)) {
     if (PyInt_Check(indexOrName))
       index = PyInt_AsLong(indexOrName);
@@ -2686,15 +2926,123 @@ static PyObject* sddsdata_SetArray( PyObject* self, PyObject* args )
       index = PyLong_AsLong(indexOrName);
     else
       return 0;
-    names = SDDS_GetArrayNames(&dataset_f[fileIndex], &number);
-    if (!(names))
-      return 0;
-    if (number <= index)
-      return 0;
-    if ((arraydef = SDDS_GetArrayDefinition(&dataset_f[fileIndex], names[index])) == NULL)
-      return 0;
   } else
     return 0;
+  return sddsdata_SetParameterValue(fileIndex, index, v);
+}
+
+/**
+ * @brief Sets the values of the first parameters of a dataset in a single call.
+ *
+ * @param self Python object (unused).
+ * @param args Python tuple containing:
+ *        - fileIndex: Index of the dataset file.
+ *        - values: Sequence of values, in parameter index order.
+ * 
+ * @return PyObject*:
+ *         - 0 on error.
+ *         - 1 on success.
+ */
+static PyObject* sddsdata_SetParameters( PyObject* self, PyObject* args )
+{
+  long fileIndex;
+  PyObject *values;
+  PyObject *fast;
+  Py_ssize_t index, number;
+  long status = 1;
+  if (!PyArg_ParseTuple(args, "lO", &fileIndex, &values)) {
+    return 0;
+  }
+  if (!sddsdata_CheckIndex(fileIndex))
+    return PyLong_FromLong(0);
+  if ((fast = PySequence_Fast(values, "values must be a sequence")) == NULL)
+    return 0;
+  number = PySequence_Fast_GET_SIZE(fast);
+  if (number > SDDS_ParameterCount(&dataset_f[fileIndex])) {
+    Py_DECREF(fast);
+    return PyLong_FromLong(0);
+  }
+  for (index = 0; (status == 1) && (index < number); index++) {
+    status = sddsdata_ResultStatus(sddsdata_SetParameterValue(fileIndex, index, PySequence_Fast_GET_ITEM(fast, index)));
+  }
+  Py_DECREF(fast);
+  if (status == -1) {
+    if (PyErr_Occurred())
+      return 0;
+    status = 0;
+  }
+  return PyLong_FromLong(status);
+}
+
+/**
+ * @brief Checks whether a buffer holds native values of an SDDS numeric type.
+ *
+ * @param view Buffer obtained with PyObject_GetBuffer.
+ * @param type SDDS data type of the destination column.
+ * 
+ * @return int 1 if the buffer can be passed to SDDS directly, 0 otherwise.
+ */
+static int sddsdata_BufferMatchesType( Py_buffer *view, long type )
+{
+  const char *format = view->format ? view->format : "B";
+  if (view->itemsize != SDDS_GetTypeSize(type))
+    return 0;
+  if ((*format == '@') || (*format == '='))
+    format++;
+#if PY_LITTLE_ENDIAN
+  else if (*format == '<')
+    format++;
+#else
+  else if ((*format == '>') || (*format == '!'))
+    format++;
+#endif
+  if ((format[0] == '\0') || (format[1] != '\0'))
+    return 0;
+  switch (type) {
+  case SDDS_SHORT:
+  case SDDS_LONG:
+  case SDDS_LONG64:
+    return (strchr("hilq", format[0]) != NULL);
+  case SDDS_USHORT:
+  case SDDS_ULONG:
+  case SDDS_ULONG64:
+    return (strchr("HILQ", format[0]) != NULL);
+  case SDDS_FLOAT:
+  case SDDS_DOUBLE:
+    return (strchr("fd", format[0]) != NULL);
+  }
+  return 0;
+}
+
+/**
+ * @brief Copies a list or buffer of values into an array of a dataset.
+ *
+ * @param fileIndex Index of the dataset file.
+ * @param name Name of the array.
+ * @param v Array values. A contiguous buffer (array.array, numpy array, ...)
+ *          holding values of the array type in row-major order is also
+ *          accepted and copied without per-element conversion.
+ * @param dim Array dimensions.
+ * 
+ * @return PyObject*:
+ *         - 0 on error.
+ *         - A Python integer with the SDDS_SetArray result otherwise.
+ */
+static PyObject* sddsdata_SetArrayValues( long fileIndex, char *name, PyObject *v, PyObject *dim )
+{
+  long elements;
+  long type;
+  long i;
+  void *data = NULL;
+  long result=0;
+  PyObject *temp;
+  ARRAY_DEFINITION *arraydef;
+  int32_t dimensions;
+  int32_t *dimension=NULL;
+  Py_buffer view;
+
+  if ((arraydef = SDDS_GetArrayDefinition(&dataset_f[fileIndex], name)) == NULL)
+    return 0;
   type = arraydef->type;
   dimensions = arraydef->dimensions;
   
@@ -2708,10 +3056,34 @@ static PyObject* sddsdata_SetArray( PyObject* self, PyObject* args )
       dimension[i] = PyInt_AsLong(temp);
     else if (PyLong_Check(temp))
       dimension[i] = PyLong_AsLong(temp);
-    else
+    else {
+      free(dimension);
       return 0;
+    }
   }
 
+  if (!PyList_Check(v)) {
+    /* Buffers of the array type and size are handed to SDDS as is */
+    if (PyObject_CheckBuffer(v) && (PyObject_GetBuffer(v, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) == 0)) {
+      elements = 1;
+      for (i=0;i<dimensions;i++)
+        elements *= dimension[i];
+      if (sddsdata_BufferMatchesType(&view, type) && (view.len / view.itemsize == elements)) {
+        result = SDDS_SetArray(&dataset_f[fileIndex],name,SDDS_CONTIGUOUS_DATA,view.buf,dimension);
+        PyBuffer_Release(&view);
+        free(dimension);
+        return PyLong_FromLong(result);
+      }
+      PyBuffer_Release(&view);
+    }
+    PyErr_Clear();
+    /* Any other sequence goes through the list conversion below */
+    if ((v = PySequence_List(v)) == NULL) {
+      free(dimension);
+      return 0;
+    }
+  } else
+    Py_INCREF(v);
   elements = (long)PyList_Size(v);
   switch (type) {
   case SDDS_SHORT:
@@ -2787,7 +3159,7 @@ static PyObject* sddsdata_SetArray( PyObject* self, PyObject* args )
   case SDDS_CHARACTER:
     data = malloc(sizeof(char)*elements);
     for (i=0;i<elements;i++)
-      ((char*)data)[i] = (char)(PyString_AsString(PyList_GetItem(v, i))[0]);
+      ((char*)data)[i] = sddsdata_CharacterValue(PyList_GetItem(v, i));
     break;
   case SDDS_STRING:
     data = malloc(sizeof(char*)*elements);
@@ -2795,14 +3167,7 @@ static PyObject* sddsdata_SetArray( PyObject* self, PyObject* args )
       SDDS_CopyString(((char**)data)+i, PyString_AsString(PyList_GetItem(v, i)));
     break;
   }
-  if (PyString_Check(indexOrName)) {
-    result = SDDS_SetArray(&dataset_f[fileIndex],(char*)PyString_AsString(indexOrName),SDDS_CONTIGUOUS_DATA,data,dimension);
-  } else {
-    result = SDDS_SetArray(&dataset_f[fileIndex],names[index],SDDS_CONTIGUOUS_DATA,data,dimension);
-    for (i=0;i<number;i++)
-      free(names[i]);
-    free(names);
-  }
+  result = SDDS_SetArray(&dataset_f[fileIndex],name,SDDS_CONTIGUOUS_DATA,data,dimension);
   switch (type) {
   case SDDS_SHORT:
     free((short*)data);
@@ -2838,39 +3203,43 @@ static PyObject* sddsdata_SetArray( PyObject* self, PyObject* args )
     break;
   }
   if (dimension) free(dimension);
+  Py_DECREF(v);
   return PyLong_FromLong(result);
 }
 
 /**
- * @brief Sets a column value in a dataset.
+ * @brief Sets an array value in a dataset.
  *
  * @param self Python object (unused).
  * @param args Python tuple containing:
  *        - fileIndex: Index of the dataset file.
- *        - indexOrName: Index or name of the column.
- *        - v: List of values to set for the column.
+ *        - indexOrName: Index or name of the array.
+ *        - v: Array values. A contiguous buffer (array.array, numpy array, ...)
+ *             holding values of the array type in row-major order is also
+ *             accepted and copied without per-element conversion.
+ *        - dim: Array dimensions.
  * 
  * @return PyObject*:
  *         - 0 on error.
  *         - 1 on success.
  */
-static PyObject* sddsdata_SetColumn( PyObject* self, PyObject* args )
+static PyObject* sddsdata_SetArray( PyObject* self, PyObject* args )
 {
   long fileIndex;
-  long rows;
   PyObject *indexOrName;
   PyObject *v;
-  long type;
+  PyObject *dim;
   long i;
-  void *data = NULL;
   long index;
-  long result=0;
-  PyObject *temp;
-  if (!PyArg_ParseTuple(args, "lOO", &fileIndex, &indexOrName, &v)) {
+  char **names=NULL;
+  int32_t number;
+  PyObject *result;
+
+  if (!PyArg_ParseTuple(args, "lOOO", &fileIndex, &indexOrName, &v, &dim)) {
     return 0;
   }
   if (PyString_Check(indexOrName)) {
-    index = SDDS_GetColumnIndex(&dataset_f[fileIndex], (char*)PyString_AsString(indexOrName));
+    return sddsdata_SetArrayValues(fileIndex, (char*)PyString_AsString(indexOrName), v, dim);
   } else if (PyNumber_Check(indexOrName)) {
     if (PyInt_Check(indexOrName))
       index = PyInt_AsLong(indexOrName);
@@ -2878,10 +3247,58 @@ static PyObject* sddsdata_SetColumn( PyObject* self, PyObject* args )
       index = PyLong_AsLong(indexOrName);
     else
       return 0;
+    names = SDDS_GetArrayNames(&dataset_f[fileIndex], &number);
+    if (!(names))
+      return 0;
+    if (number <= index)
+      return 0;
+    result = sddsdata_SetArrayValues(fileIndex, names[index], v, dim);
+    for (i=0;i<number;i++)
+      free(names[i]);
+    free(names);
+    return result;
   } else
     return 0;
+}
+
+/**
+ * @brief Copies a list or buffer of values into a column of a dataset.
+ *
+ * @param fileIndex Index of the dataset file.
+ * @param index Index of the column.
+ * @param v List of values, or a contiguous buffer of the column type.
+ * 
+ * @return PyObject*:
+ *         - 0 on error.
+ *         - A Python integer with the SDDS_SetColumn result otherwise.
+ */
+static PyObject* sddsdata_SetColumnValues( long fileIndex, long index, PyObject *v )
+{
+  long rows;
+  long type;
+  long i;
+  void *data = NULL;
+  long result=0;
+  PyObject *temp;
+  Py_buffer view;
   if ((type = SDDS_GetColumnType(&dataset_f[fileIndex], index)) == 0)
     return 0;
+  if (!PyList_Check(v)) {
+    /* Buffers of the column type are handed to SDDS as is */
+    if (PyObject_CheckBuffer(v) && (PyObject_GetBuffer(v, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) == 0)) {
+      if ((view.ndim == 1) && sddsdata_BufferMatchesType(&view, type)) {
+        result = SDDS_SetColumn(&dataset_f[fileIndex],SDDS_SET_BY_INDEX,view.buf,(long)(view.len / view.itemsize),index,NULL);
+        PyBuffer_Release(&view);
+        return PyLong_FromLong(result);
+      }
+      PyBuffer_Release(&view);
+    }
+    PyErr_Clear();
+    /* Any other sequence goes through the list conversion below */
+    if ((v = PySequence_List(v)) == NULL)
+      return 0;
+  } else
+    Py_INCREF(v);
   rows = (long)PyList_Size(v);
   switch (type) {
   case SDDS_SHORT:
@@ -2957,7 +3374,7 @@ static PyObject* sddsdata_SetColumn( PyObject* self, PyObject* args )
   case SDDS_CHARACTER:
     data = malloc(sizeof(char)*rows);
     for (i=0;i<rows;i++)
-      ((char*)data)[i] = (char)(PyString_AsString(PyList_GetItem(v, i))[0]);
+      ((char*)data)[i] = sddsdata_CharacterValue(PyList_GetItem(v, i));
     break;
   case SDDS_STRING:
     data = malloc(sizeof(char*)*rows);
@@ -3000,266 +3417,475 @@ static PyObject* sddsdata_SetColumn( PyObject* self, PyObject* args )
     free((char**)data);
     break;
   }
+  Py_DECREF(v);
   return PyLong_FromLong(result);
 }
 
 /**
- * @brief Sets values for a specific row in a dataset.
+ * @brief Sets a column value in a dataset.
  *
  * @param self Python object (unused).
  * @param args Python tuple containing:
  *        - fileIndex: Index of the dataset file.
- *        - row: Row number to set values for.
- *        - v: List of column-value pairs (alternating column name and value).
+ *        - indexOrName: Index or name of the column.
+ *        - v: List of values to set for the column. Numeric columns also accept
+ *             any contiguous buffer (array.array, numpy array, ...) holding values
+ *             of the column type, which is copied without per-element conversion.
  * 
  * @return PyObject*:
  *         - 0 on error.
  *         - 1 on success.
  */
-static PyObject* sddsdata_SetRowValues( PyObject* self, PyObject* args )
+static PyObject* sddsdata_SetColumn( PyObject* self, PyObject* args )
 {
   long fileIndex;
-  long row, elements;
+  PyObject *indexOrName;
   PyObject *v;
-  long type;
-  long i;
   long index;
-  PyObject *temp;
-  if (!PyArg_ParseTuple(args, "llO", &fileIndex, &row, &v)) {
+  if (!PyArg_ParseTuple(args, "lOO", &fileIndex, &indexOrName, &v)) {
     return 0;
   }
-  elements = (long)PyList_Size(v);
-  for (i=0; i<elements; i=i+2) {
-    index = SDDS_GetColumnIndex(&dataset_f[fileIndex], (char*)PyString_AsString(PyList_GetItem(v, i)));
-    temp = PyList_GetItem(v, i+1);
-    if ((type = SDDS_GetColumnType(&dataset_f[fileIndex], index)) == 0)
+  if (PyString_Check(indexOrName)) {
+    index = SDDS_GetColumnIndex(&dataset_f[fileIndex], (char*)PyString_AsString(indexOrName));
+  } else if (PyNumber_Check(indexOrName)) {
+    if (PyInt_Check(indexOrName))
+      index = PyInt_AsLong(indexOrName);
+    else if (PyLong_Check(indexOrName))
+      index = PyLong_AsLong(indexOrName);
+    else
       return 0;
-    switch (type) {
-    case SDDS_SHORT:
-    case SDDS_USHORT:
-    case SDDS_LONG:
-      if (PyLong_Check(temp)) {
-        if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyLong_AsLong(temp),-1) == 0)
-          return 0;
-      } else {
-        if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyInt_AsLong(temp),-1) == 0)
-          return 0;
-      }
-      break;
-    case SDDS_ULONG:
-      if (PyLong_Check(temp)) {
-        if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyLong_AsUnsignedLong(temp),-1) == 0)
-          return 0;
-      } else {
-        if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyInt_AsUnsignedLong(temp),-1) == 0)
-          return 0;
-      }
-      break;
-    case SDDS_LONG64:
-      if (PyLong_Check(temp)) {
-        if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyLong_AsLongLong(temp),-1) == 0)
-          return 0;
-      } else {
-        if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyInt_AsLongLong(temp),-1) == 0)
-          return 0;
-      }
-      break;
-    case SDDS_ULONG64:
-      if (PyLong_Check(temp)) {
-        if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyLong_AsUnsignedLongLong(temp),-1) == 0)
-          return 0;
-      } else {
-        if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyInt_AsUnsignedLongLong(temp),-1) == 0)
-          return 0;
-      }
-      break;
-    case SDDS_FLOAT:
-    case SDDS_DOUBLE:
-      if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyFloat_AsDouble(temp),-1) == 0)
-          return 0;
-      break;
-    case SDDS_CHARACTER:
-      if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,(char)(PyString_AsString(temp)[0]),-1) == 0)
-          return 0;
-      break;
-    case SDDS_STRING:
-      if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyString_AsString(temp),-1) == 0)
-          return 0;
-      break;
-    }
-  }
-  return PyLong_FromLong(1);
+  } else
+    return 0;
+  return sddsdata_SetColumnValues(fileIndex, index, v);
 }
 
 /**
- * @brief Retrieves a column's data from a dataset.
+ * @brief Sets several columns of a dataset with a single call.
  *
  * @param self Python object (unused).
  * @param args Python tuple containing:
  *        - fileIndex: Index of the dataset file.
- *        - indexOrName: Index or name of the column to retrieve.
+ *        - columns: Dictionary mapping column names to the values accepted by SetColumn.
  * 
  * @return PyObject*:
- *         - NULL on error.
- *         - List of values from the column on success.
+ *         - 0 on error.
+ *         - 1 on success.
  */
-static PyObject* sddsdata_GetColumn( PyObject* self, PyObject* args )
+static PyObject* sddsdata_SetColumnsFromDict( PyObject* self, PyObject* args )
 {
   long fileIndex;
-  PyObject *indexOrName;
-  long originalType;
-  int64_t rows, i;
-  void *columnValue;
-  char *name;
-  char **data;
-  int32_t number;
-  char buffer[40];
+  PyObject *columns;
+  PyObject *key;
+  PyObject *value;
+  PyObject *result;
+  Py_ssize_t pos = 0;
   long index;
-  PyObject *v;
-  if (!PyArg_ParseTuple(args, "lO", &fileIndex, &indexOrName)) {
-    return NULL;
+  long status;
+  if (!PyArg_ParseTuple(args, "lO!", &fileIndex, &PyDict_Type, &columns)) {
+    return 0;
   }
-  if (PyString_Check(indexOrName)) {
-    index = SDDS_GetColumnIndex(&dataset_f[fileIndex], (char*)PyString_AsString(indexOrName));
-  } else if (PyNumber_Check(indexOrName)) {
-    if (PyInt_Check(indexOrName))
-      index = PyInt_AsLong(indexOrName);
-    else if (PyLong_Check(indexOrName))
-      index = PyLong_AsLong(indexOrName);
-    else
-      return NULL;
-  } else
-    return NULL;
-  
-  data = SDDS_GetColumnNames(&dataset_f[fileIndex], &number);
-  if (!(data))
-    return NULL;
-  if ((index >= 0) && (index < number)) {
-    name = data[index];
-  } else {
-    return NULL;
+  if (!sddsdata_CheckIndex(fileIndex))
+    return PyLong_FromLong(0);
+  while (PyDict_Next(columns, &pos, &key, &value)) {
+    if (!PyString_Check(key))
+      return PyLong_FromLong(0);
+    if ((index = SDDS_GetColumnIndex(&dataset_f[fileIndex], (char*)PyString_AsString(key))) < 0)
+      return PyLong_FromLong(0);
+    if ((result = sddsdata_SetColumnValues(fileIndex, index, value)) == NULL)
+      return 0;
+    status = PyLong_AsLong(result);
+    Py_DECREF(result);
+    if (status != 1)
+      return PyLong_FromLong(status);
   }
+  return PyLong_FromLong(1);
+}
 
-  rows = SDDS_RowCount(&(dataset_f[fileIndex]));
-  if (rows < 0) {
-    Py_INCREF(Py_None);
-    return Py_None;
+/**
+ * @brief Writes a sequence of pages from per-item value lists in a single call.
+ *
+ * The lists are laid out like the data of the SDDS Python class: entry i of
+ * each list holds the values of parameter, array, or column i for every page.
+ * Each page is started, filled, and written without returning to Python.
+ *
+ * @param self Python object (unused).
+ * @param args Python tuple containing:
+ *        - fileIndex: Index of the dataset file.
+ *        - pages: Number of pages to write.
+ *        - rows: Number of rows to allocate for each page.
+ *        - parameterData: List with the list of page values of each parameter.
+ *        - arrayData: List with the list of page values of each array.
+ *        - arrayDimensions: List with the list of page dimensions of each array.
+ *        - columnData: List with the list of page value lists of each column.
+ * 
+ * @return PyObject*:
+ *         - 0 on error.
+ *         - 1 on success.
+ */
+static PyObject* sddsdata_WritePages( PyObject* self, PyObject* args )
+{
+  long fileIndex;
+  long pages, rows;
+  PyObject *parameterData, *arrayData, *arrayDimensions, *columnData;
+  PyObject *values, *dimensions;
+  char **names=NULL;
+  int32_t number=0;
+  long page, i;
+  long status=1;
+  if (!PyArg_ParseTuple(args, "lllO!O!O!O!", &fileIndex, &pages, &rows,
+                        &PyList_Type, &parameterData, &PyList_Type, &arrayData,
+                        &PyList_Type, &arrayDimensions, &PyList_Type, &columnData)) {
+    return 0;
+  }
+  if (!sddsdata_CheckIndex(fileIndex))
+    return PyLong_FromLong(0);
+  if (PyList_Size(arrayData) != PyList_Size(arrayDimensions))
+    return PyLong_FromLong(0);
+  if (PyList_Size(arrayData) > 0) {
+    names = SDDS_GetArrayNames(&dataset_f[fileIndex], &number);
+    if (!(names) || (number < PyList_Size(arrayData)))
+      status = 0;
   }
 
-  originalType = SDDS_GetColumnType(&(dataset_f[fileIndex]), index);
-    
-  columnValue = SDDS_GetColumn(&(dataset_f[fileIndex]), name);
-
-  for (i=0;i<number;i++)
-    free(data[i]);
-  free(data);
+  for (page = 0; (status == 1) && (page < pages); page++) {
+    status = SDDS_StartPage(&dataset_f[fileIndex], rows);
+    for (i = 0; (status == 1) && (i < PyList_Size(parameterData)); i++) {
+      if ((values = PySequence_GetItem(PyList_GET_ITEM(parameterData, i), page)) == NULL) {
+        status = -1;
+        break;
+      }
+      status = sddsdata_ResultStatus(sddsdata_SetParameterValue(fileIndex, i, values));
+      Py_DECREF(values);
+    }
+    for (i = 0; (status == 1) && (i < PyList_Size(arrayData)); i++) {
+      if ((values = PySequence_GetItem(PyList_GET_ITEM(arrayData, i), page)) == NULL) {
+        status = -1;
+        break;
+      }
+      if ((dimensions = PySequence_GetItem(PyList_GET_ITEM(arrayDimensions, i), page)) == NULL) {
+        Py_DECREF(values);
+        status = -1;
+        break;
+      }
+      if (PyList_Check(dimensions))
+        status = sddsdata_ResultStatus(sddsdata_SetArrayValues(fileIndex, names[i], values, dimensions));
+      else
+        status = 0;
+      Py_DECREF(values);
+      Py_DECREF(dimensions);
+    }
+    for (i = 0; (status == 1) && (i < PyList_Size(columnData)); i++) {
+      if ((values = PySequence_GetItem(PyList_GET_ITEM(columnData, i), page)) == NULL) {
+        status = -1;
+        break;
+      }
+      status = sddsdata_ResultStatus(sddsdata_SetColumnValues(fileIndex, i, values));
+      Py_DECREF(values);
+    }
+    if (status == 1) {
+      status = SDDS_WritePage(&dataset_f[fileIndex]);
+    }
+  }
 
-  if (!(columnValue))
-    return NULL;
+  if (names) {
+    for (i = 0; i < number; i++)
+      free(names[i]);
+    free(names);
+  }
+  if (status == -1) {
+    if (PyErr_Occurred())
+      return 0;
+    status = 0;
+  }
+  return PyLong_FromLong(status);
+}
 
-  if (!(v = PyList_New(rows)))
-    return NULL;
-  
-  switch (originalType) {
+/**
+ * @brief Sets the value of one column in a row of the current page.
+ *
+ * @param fileIndex Index of the dataset file.
+ * @param row Row number to set the value for.
+ * @param index Index of the column.
+ * @param temp Python value, converted to the column type.
+ * 
+ * @return long:
+ *         - 0 on error.
+ *         - 1 on success.
+ */
+static long sddsdata_SetRowValue( long fileIndex, long row, long index, PyObject *temp )
+{
+  long type;
+  if ((type = SDDS_GetColumnType(&dataset_f[fileIndex], index)) == 0)
+    return 0;
+  switch (type) {
   case SDDS_SHORT:
-    for (i=0;i < rows;i++) {
-      PyList_SetItem(v, i, PyLong_FromLong((long)(((short*)columnValue)[i])));
-    }
-    free((short*)columnValue);
-    break;
   case SDDS_USHORT:
-    for (i=0;i < rows;i++) {
-      PyList_SetItem(v, i, PyLong_FromLong((long)(((unsigned short*)columnValue)[i])));
-    }
-    free((unsigned short*)columnValue);
-    break;
   case SDDS_LONG:
-    for (i=0;i < rows;i++) {
-      PyList_SetItem(v, i, PyLong_FromLong((long)(((int32_t*)columnValue)[i])));
+    if (PyLong_Check(temp)) {
+      if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyLong_AsLong(temp),-1) == 0)
+        return 0;
+    } else {
+      if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyInt_AsLong(temp),-1) == 0)
+        return 0;
     }
-    free((int32_t*)columnValue);
     break;
   case SDDS_ULONG:
-    for (i=0;i < rows;i++) {
-      PyList_SetItem(v, i, PyLong_FromUnsignedLong((unsigned long)(((uint32_t*)columnValue)[i])));
+    if (PyLong_Check(temp)) {
+      if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyLong_AsUnsignedLong(temp),-1) == 0)
+        return 0;
+    } else {
+      if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyInt_AsUnsignedLong(temp),-1) == 0)
+        return 0;
     }
-    free((uint32_t*)columnValue);
     break;
   case SDDS_LONG64:
-    for (i=0;i < rows;i++) {
-      PyList_SetItem(v, i, PyLong_FromLongLong((long long)(((int64_t*)columnValue)[i])));
+    if (PyLong_Check(temp)) {
+      if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyLong_AsLongLong(temp),-1) == 0)
+        return 0;
+    } else {
+      if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyInt_AsLongLong(temp),-1) == 0)
+        return 0;
     }
-    free((int64_t*)columnValue);
     break;
   case SDDS_ULONG64:
-    for (i=0;i < rows;i++) {
-      PyList_SetItem(v, i, PyLong_FromUnsignedLongLong((unsigned long long)(((uint64_t*)columnValue)[i])));
+    if (PyLong_Check(temp)) {
+      if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyLong_AsUnsignedLongLong(temp),-1) == 0)
+        return 0;
+    } else {
+      if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyInt_AsUnsignedLongLong(temp),-1) == 0)
+        return 0;
     }
-    free((uint64_t*)columnValue);
     break;
   case SDDS_FLOAT:
-    for (i=0;i < rows;i++) {
-      sprintf(buffer, "%.6E", ((float*)columnValue)[i]);
-      PyList_SetItem(v, i, PyFloat_FromDouble(atof(buffer)));
-    }
-    free((float*)columnValue);
-    break;
   case SDDS_DOUBLE:
-    for (i=0;i < rows;i++) {
-      PyList_SetItem(v, i, PyFloat_FromDouble(((double*)columnValue)[i]));
-    }
-    free((double*)columnValue);
+    if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyFloat_AsDouble(temp),-1) == 0)
+        return 0;
     break;
   case SDDS_CHARACTER:
-    for (i=0;i < rows;i++) {
-      sprintf(buffer, "%c", ((char*)columnValue)[i]);
-      PyList_SetItem(v, i, PyString_FromString(buffer));
-    }
-    free((char*)columnValue);
+    if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,sddsdata_CharacterValue(temp),-1) == 0)
+        return 0;
     break;
   case SDDS_STRING:
-    for (i=0;i < rows;i++) {
-      PyList_SetItem(v, i, PyString_FromString(((char**)columnValue)[i]));
-    }
-    for (i=0;i < rows;i++)
-      free(((char**)columnValue)[i]);
-    free((char**)columnValue);
+    if (SDDS_SetRowValues(&dataset_f[fileIndex],SDDS_SET_BY_INDEX|SDDS_PASS_BY_VALUE,row,index,PyString_AsString(temp),-1) == 0)
+        return 0;
     break;
-  default:
-    return NULL;
   }
-  return v;
+  return 1;
 }
 
 /**
- * @brief Retrieves an array's data from a dataset.
+ * @brief Sets values for a specific row in a dataset.
  *
  * @param self Python object (unused).
  * @param args Python tuple containing:
  *        - fileIndex: Index of the dataset file.
- *        - indexOrName: Index or name of the array to retrieve.
+ *        - row: Row number to set values for.
+ *        - v: List of column-value pairs (alternating column name and value).
  * 
  * @return PyObject*:
- *         - NULL on error.
- *         - List of values from the array on success.
+ *         - 0 on error.
+ *         - 1 on success.
  */
-static PyObject* sddsdata_GetArray( PyObject* self, PyObject* args )
+static PyObject* sddsdata_SetRowValues( PyObject* self, PyObject* args )
 {
   long fileIndex;
-  PyObject *indexOrName;
-  long originalType, i, elements;
-  SDDS_ARRAY *arrayValue=NULL;
+  long row, elements;
+  PyObject *v;
+  long i;
+  long index;
+  PyObject *temp;
+  if (!PyArg_ParseTuple(args, "llO", &fileIndex, &row, &v)) {
+    return 0;
+  }
+  elements = (long)PyList_Size(v);
+  for (i=0; i<elements; i=i+2) {
+    index = SDDS_GetColumnIndex(&dataset_f[fileIndex], (char*)PyString_AsString(PyList_GetItem(v, i)));
+    temp = PyList_GetItem(v, i+1);
+    if (sddsdata_SetRowValue(fileIndex, row, index, temp) == 0)
+      return 0;
+  }
+  return PyLong_FromLong(1);
+}
+
+/**
+ * @brief Sets all column values of a specific row in a dataset.
+ *
+ * Unlike SetRowValues, the values are given in column order without the column
+ * names, so no names are looked up and the same sequence can be reused for
+ * every row.
+ *
+ * @param self Python object (unused).
+ * @param args Python tuple containing:
+ *        - fileIndex: Index of the dataset file.
+ *        - row: Row number to set values for.
+ *        - v: Sequence (list or tuple) with one value per column, in column order.
+ * 
+ * @return PyObject*:
+ *         - 0 on error.
+ *         - 1 on success.
+ */
+static PyObject* sddsdata_SetRow( PyObject* self, PyObject* args )
+{
+  long fileIndex;
+  long row;
+  PyObject *v;
+  PyObject *values;
+  Py_ssize_t i, elements;
+  if (!PyArg_ParseTuple(args, "llO", &fileIndex, &row, &v)) {
+    return 0;
+  }
+  if (!sddsdata_CheckIndex(fileIndex))
+    return PyLong_FromLong(0);
+  if ((values = PySequence_Fast(v, "row values must be a sequence")) == NULL)
+    return 0;
+  elements = PySequence_Fast_GET_SIZE(values);
+  if (elements != SDDS_ColumnCount(&dataset_f[fileIndex])) {
+    Py_DECREF(values);
+    SDDS_SetError("Number of row values does not match the number of columns (SetRow)");
+    return PyLong_FromLong(0);
+  }
+  for (i=0; i<elements; i++) {
+    if (sddsdata_SetRowValue(fileIndex, row, (long)i, PySequence_Fast_GET_ITEM(values, i)) == 0) {
+      Py_DECREF(values);
+      if (PyErr_Occurred())
+        return 0;
+      return PyLong_FromLong(0);
+    }
+  }
+  Py_DECREF(values);
+  if (PyErr_Occurred())
+    return 0;
+  return PyLong_FromLong(1);
+}
+
+/**
+ * @brief Converts the current page's data for one column into a Python list.
+ *
+ * @param fileIndex Index of the dataset file.
+ * @param index Index of the column.
+ * @param name Name of the column.
+ * @param rows Number of rows on the current page.
+ * 
+ * @return PyObject*:
+ *         - NULL on error.
+ *         - List of values from the column on success.
+ */
+static PyObject* sddsdata_ColumnToList( long fileIndex, long index, char *name, int64_t rows )
+{
+  long originalType;
+  int64_t i;
+  void *columnValue;
+  char buffer[40];
+  PyObject *v;
+
+  originalType = SDDS_GetColumnType(&(dataset_f[fileIndex]), index);
+    
+  columnValue = SDDS_GetColumn(&(dataset_f[fileIndex]), name);
+
+  if (!(columnValue))
+    return NULL;
+
+  if (!(v = PyList_New(rows)))
+    return NULL;
+  
+  switch (originalType) {
+  case SDDS_SHORT:
+    for (i=0;i < rows;i++) {
+      PyList_SetItem(v, i, PyLong_FromLong((long)(((short*)columnValue)[i])));
+    }
+    free((short*)columnValue);
+    break;
+  case SDDS_USHORT:
+    for (i=0;i < rows;i++) {
+      PyList_SetItem(v, i, PyLong_FromLong((long)(((unsigned short*)columnValue)[i])));
+    }
+    free((unsigned short*)columnValue);
+    break;
+  case SDDS_LONG:
+    for (i=0;i < rows;i++) {
+      PyList_SetItem(v, i, PyLong_FromLong((long)(((int32_t*)columnValue)[i])));
+    }
+    free((int32_t*)columnValue);
+    break;
+  case SDDS_ULONG:
+    for (i=0;i < rows;i++) {
+      PyList_SetItem(v, i, PyLong_FromUnsignedLong((unsigned long)(((uint32_t*)columnValue)[i])));
+    }
+    free((uint32_t*)columnValue);
+    break;
+  case SDDS_LONG64:
+    for (i=0;i < rows;i++) {
+      PyList_SetItem(v, i, PyLong_FromLongLong((long long)(((int64_t*)columnValue)[i])));
+    }
+    free((int64_t*)columnValue);
+    break;
+  case SDDS_ULONG64:
+    for (i=0;i < rows;i++) {
+      PyList_SetItem(v, i, PyLong_FromUnsignedLongLong((unsigned long long)(((uint64_t*)columnValue)[i])));
+    }
+    free((uint64_t*)columnValue);
+    break;
+  case SDDS_FLOAT:
+    for (i=0;i < rows;i++) {
+      sprintf(buffer, "%.6E", ((float*)columnValue)[i]);
+      PyList_SetItem(v, i, PyFloat_FromDouble(atof(buffer)));
+    }
+    free((float*)columnValue);
+    break;
+  case SDDS_DOUBLE:
+    for (i=0;i < rows;i++) {
+      PyList_SetItem(v, i, PyFloat_FromDouble(((double*)columnValue)[i]));
+    }
+    free((double*)columnValue);
+    break;
+  case SDDS_CHARACTER:
+    for (i=0;i < rows;i++) {
+      sprintf(buffer, "%c", ((char*)columnValue)[i]);
+      PyList_SetItem(v, i, PyString_FromString(buffer));
+    }
+    free((char*)columnValue);
+    break;
+  case SDDS_STRING:
+    for (i=0;i < rows;i++) {
+      PyList_SetItem(v, i, PyString_FromString(((char**)columnValue)[i]));
+    }
+    for (i=0;i < rows;i++)
+      free(((char**)columnValue)[i]);
+    free((char**)columnValue);
+    break;
+  default:
+    return NULL;
+  }
+  return v;
+}
+
+/**
+ * @brief Retrieves a column's data from a dataset.
+ *
+ * @param self Python object (unused).
+ * @param args Python tuple containing:
+ *        - fileIndex: Index of the dataset file.
+ *        - indexOrName: Index or name of the column to retrieve.
+ * 
+ * @return PyObject*:
+ *         - NULL on error.
+ *         - List of values from the column on success.
+ */
+static PyObject* sddsdata_GetColumn( PyObject* self, PyObject* args )
+{
+  long fileIndex;
+  PyObject *indexOrName;
+  int64_t rows, i;
   char *name;
   char **data;
   int32_t number;
-  char buffer[40];
   long index;
   PyObject *v;
   if (!PyArg_ParseTuple(args, "lO", &fileIndex, &indexOrName)) {
     return NULL;
   }
   if (PyString_Check(indexOrName)) {
-    index = SDDS_GetArrayIndex(&dataset_f[fileIndex], (char*)PyString_AsString(indexOrName));
+    index = SDDS_GetColumnIndex(&dataset_f[fileIndex], (char*)PyString_AsString(indexOrName));
   } else if (PyNumber_Check(indexOrName)) {
     if (PyInt_Check(indexOrName))
       index = PyInt_AsLong(indexOrName);
@@ -3270,7 +3896,7 @@ static PyObject* sddsdata_GetArray( PyObject* self, PyObject* args )
   } else
     return NULL;
   
-  data = SDDS_GetArrayNames(&dataset_f[fileIndex], &number);
+  data = SDDS_GetColumnNames(&dataset_f[fileIndex], &number);
   if (!(data))
     return NULL;
   if ((index >= 0) && (index < number)) {
@@ -3279,28 +3905,108 @@ static PyObject* sddsdata_GetArray( PyObject* self, PyObject* args )
     return NULL;
   }
 
-  arrayValue = SDDS_GetArray(&(dataset_f[fileIndex]), name, NULL);
+  rows = SDDS_RowCount(&(dataset_f[fileIndex]));
+  if (rows < 0) {
+    Py_RETURN_NONE;
+  }
+
+  v = sddsdata_ColumnToList(fileIndex, index, name, rows);
 
   for (i=0;i<number;i++)
     free(data[i]);
   free(data);
 
-  originalType = arrayValue->definition->type;
+  return v;
+}
 
-  if (!(arrayValue))
+/**
+ * @brief Retrieves the data for every column on the current page in a single call.
+ *
+ * Pages without rows yield an empty list for each column, so callers do not
+ * need to check the row count first.
+ *
+ * @param self Python object (unused).
+ * @param args Python tuple containing:
+ *        - fileIndex: Index of the dataset file.
+ * 
+ * @return PyObject*:
+ *         - NULL on error.
+ *         - List with one list of values per column, in column index order, on success.
+ */
+static PyObject* sddsdata_GetColumns( PyObject* self, PyObject* args )
+{
+  long fileIndex;
+  int64_t rows;
+  char **data;
+  int32_t number;
+  long index;
+  PyObject *v, *column;
+  if (!PyArg_ParseTuple(args, "l", &fileIndex)) {
     return NULL;
+  }
+  if (!sddsdata_CheckIndex(fileIndex))
+    Py_RETURN_NONE;
 
-  elements = arrayValue->elements;
+  rows = SDDS_RowCount(&(dataset_f[fileIndex]));
+  if (rows < 0) {
+    Py_RETURN_NONE;
+  }
 
-  /*
-  if (!(v = PyList_New(arrayValue->definition->dimensions)))
-    return NULL;
-  for (i=0;i<arrayValue>dimensions;i++) {
-    if (!(v[i] = PyList_New(arrayValue->dimension[i])))
+  if (rows == 0) {
+    /* Empty pages need no column names or data, only one new empty list per column */
+    number = SDDS_ColumnCount(&dataset_f[fileIndex]);
+    if (!(v = PyList_New(number)))
       return NULL;
+    for (index = 0; index < number; index++) {
+      if (!(column = PyList_New(0))) {
+        Py_DECREF(v);
+        return NULL;
+      }
+      PyList_SET_ITEM(v, index, column);
+    }
+    return v;
+  }
+
+  data = SDDS_GetColumnNames(&dataset_f[fileIndex], &number);
+  if (!(data))
+    return NULL;
+
+  v = PyList_New(number);
+  for (index = 0; v && (index < number); index++) {
+    column = sddsdata_ColumnToList(fileIndex, index, data[index], rows);
+    if (!(column)) {
+      Py_DECREF(v);
+      v = NULL;
+      break;
+    }
+    PyList_SetItem(v, index, column);
   }
-  */
-  if (!(v = PyList_New(arrayValue->elements)))
+
+  for (index = 0; index < number; index++)
+    free(data[index]);
+  free(data);
+  return v;
+}
+
+/**
+ * @brief Converts the values of an array to a Python list.
+ *
+ * @param arrayValue Array returned by SDDS_GetArray.
+ * 
+ * @return PyObject*:
+ *         - NULL on error.
+ *         - List of values from the array on success.
+ */
+static PyObject* sddsdata_ArrayToList( SDDS_ARRAY *arrayValue )
+{
+  long originalType, i, elements;
+  char buffer[40];
+  PyObject *v;
+
+  originalType = arrayValue->definition->type;
+  elements = arrayValue->elements;
+
+  if (!(v = PyList_New(elements)))
     return NULL;
 
   switch (originalType) {
@@ -3357,25 +4063,25 @@ static PyObject* sddsdata_GetArray( PyObject* self, PyObject* args )
     }
     break;
   default:
+    Py_DECREF(v);
     return NULL;
   }
-  SDDS_FreeArray(arrayValue);
   return v;
 }
 
 /**
- * @brief Retrieves the dimensions of an array in a dataset.
+ * @brief Retrieves an array's data from a dataset.
  *
  * @param self Python object (unused).
  * @param args Python tuple containing:
  *        - fileIndex: Index of the dataset file.
- *        - indexOrName: Index or name of the array.
+ *        - indexOrName: Index or name of the array to retrieve.
  * 
  * @return PyObject*:
  *         - NULL on error.
- *         - List of dimensions of the array on success.
+ *         - List of values from the array on success.
  */
-static PyObject* sddsdata_GetArrayDimensions( PyObject* self, PyObject* args )
+static PyObject* sddsdata_GetArray( PyObject* self, PyObject* args )
 {
   long fileIndex;
   PyObject *indexOrName;
@@ -3418,46 +4124,40 @@ static PyObject* sddsdata_GetArrayDimensions( PyObject* self, PyObject* args )
 
   if (!(arrayValue))
     return NULL;
-  
-  if (!(v = PyList_New(arrayValue->definition->dimensions)))
-    return NULL;
-  for (i=0;i<arrayValue->definition->dimensions;i++) {
-    PyList_SetItem(v, i, PyLong_FromLong(arrayValue->dimension[i]));
-  }
+
+  v = sddsdata_ArrayToList(arrayValue);
   SDDS_FreeArray(arrayValue);
   return v;
 }
 
 /**
- * @brief Retrieves the value of a parameter from a dataset.
+ * @brief Retrieves the dimensions of an array in a dataset.
  *
  * @param self Python object (unused).
  * @param args Python tuple containing:
  *        - fileIndex: Index of the dataset file.
- *        - indexOrName: Index or name of the parameter.
+ *        - indexOrName: Index or name of the array.
  * 
  * @return PyObject*:
  *         - NULL on error.
- *         - Parameter value on success.
+ *         - List of dimensions of the array on success.
  */
-static PyObject* sddsdata_GetParameter( PyObject* self, PyObject* args ) 
+static PyObject* sddsdata_GetArrayDimensions( PyObject* self, PyObject* args )
 {
   long fileIndex;
   PyObject *indexOrName;
-  long originalType;
-  void *parameterValue;
+  long i;
+  SDDS_ARRAY *arrayValue=NULL;
   char *name;
   char **data;
   int32_t number;
-  char buffer[40];
   long index;
-  long i;
-  PyObject *v=NULL;
+  PyObject *v;
   if (!PyArg_ParseTuple(args, "lO", &fileIndex, &indexOrName)) {
     return NULL;
   }
   if (PyString_Check(indexOrName)) {
-    index = SDDS_GetParameterIndex(&dataset_f[fileIndex], (char*)PyString_AsString(indexOrName));
+    index = SDDS_GetArrayIndex(&dataset_f[fileIndex], (char*)PyString_AsString(indexOrName));
   } else if (PyNumber_Check(indexOrName)) {
     if (PyInt_Check(indexOrName))
       index = PyInt_AsLong(indexOrName);
@@ -3467,8 +4167,8 @@ static PyObject* sddsdata_GetParameter( PyObject* self, PyObject* args )
       return NULL;
   } else
     return NULL;
-
-  data = SDDS_GetParameterNames(&dataset_f[fileIndex], &number);
+  
+  data = SDDS_GetArrayNames(&dataset_f[fileIndex], &number);
   if (!(data))
     return NULL;
   if ((index >= 0) && (index < number)) {
@@ -3476,16 +4176,102 @@ static PyObject* sddsdata_GetParameter( PyObject* self, PyObject* args )
   } else {
     return NULL;
   }
-  if (!name) {
-    return NULL;
-  }
 
-  parameterValue = SDDS_GetParameter(&(dataset_f[fileIndex]), name, NULL);
+  arrayValue = SDDS_GetArray(&(dataset_f[fileIndex]), name, NULL);
 
   for (i=0;i<number;i++)
     free(data[i]);
   free(data);
 
+  if (!(arrayValue))
+    return NULL;
+  
+  if (!(v = PyList_New(arrayValue->definition->dimensions)))
+    return NULL;
+  for (i=0;i<arrayValue->definition->dimensions;i++) {
+    PyList_SetItem(v, i, PyLong_FromLong(arrayValue->dimension[i]));
+  }
+  SDDS_FreeArray(arrayValue);
+  return v;
+}
+
+/**
+ * @brief Retrieves the data and dimensions of every array on the current page in a single call.
+ *
+ * @param self Python object (unused).
+ * @param args Python tuple containing:
+ *        - fileIndex: Index of the dataset file.
+ * 
+ * @return PyObject*:
+ *         - NULL on error.
+ *         - List of (values, dimensions) tuples, in array index order, on success.
+ */
+static PyObject* sddsdata_GetArrays( PyObject* self, PyObject* args )
+{
+  long fileIndex;
+  long i, index;
+  SDDS_ARRAY *arrayValue;
+  char **data;
+  int32_t number;
+  PyObject *v, *values, *dimensions;
+  if (!PyArg_ParseTuple(args, "l", &fileIndex)) {
+    return NULL;
+  }
+  if (!sddsdata_CheckIndex(fileIndex))
+    Py_RETURN_NONE;
+
+  if (SDDS_ArrayCount(&dataset_f[fileIndex]) == 0)
+    return PyList_New(0);
+  data = SDDS_GetArrayNames(&dataset_f[fileIndex], &number);
+  if (!(data))
+    return NULL;
+
+  v = PyList_New(number);
+  for (index = 0; v && (index < number); index++) {
+    values = dimensions = NULL;
+    if ((arrayValue = SDDS_GetArray(&(dataset_f[fileIndex]), data[index], NULL))) {
+      if ((values = sddsdata_ArrayToList(arrayValue)) &&
+          (dimensions = PyList_New(arrayValue->definition->dimensions))) {
+        for (i=0;i<arrayValue->definition->dimensions;i++) {
+          PyList_SetItem(dimensions, i, PyLong_FromLong(arrayValue->dimension[i]));
+        }
+      }
+      SDDS_FreeArray(arrayValue);
+    }
+    if (!(dimensions)) {
+      Py_XDECREF(values);
+      Py_DECREF(v);
+      v = NULL;
+      break;
+    }
+    PyList_SetItem(v, index, Py_BuildValue("(NN)", values, dimensions));
+  }
+
+  for (index = 0; index < number; index++)
+    free(data[index]);
+  free(data);
+  return v;
+}
+
+/**
+ * @brief Converts the value of a parameter on the current page to a Python object.
+ *
+ * @param fileIndex Index of the dataset file.
+ * @param index Index of the parameter.
+ * @param name Name of the parameter.
+ * 
+ * @return PyObject*:
+ *         - NULL on error.
+ *         - Parameter value on success.
+ */
+static PyObject* sddsdata_ParameterToValue( long fileIndex, long index, char *name )
+{
+  long originalType;
+  void *parameterValue;
+  char buffer[40];
+  PyObject *v=NULL;
+
+  parameterValue = SDDS_GetParameter(&(dataset_f[fileIndex]), name, NULL);
   if (!(parameterValue)) {
     return NULL;
   }
@@ -3539,6 +4325,102 @@ static PyObject* sddsdata_GetParameter( PyObject* self, PyObject* args )
   return v;
 }
 
+/**
+ * @brief Retrieves the value of a parameter from a dataset.
+ *
+ * @param self Python object (unused).
+ * @param args Python tuple containing:
+ *        - fileIndex: Index of the dataset file.
+ *        - indexOrName: Index or name of the parameter.
+ * 
+ * @return PyObject*:
+ *         - NULL on error.
+ *         - Parameter value on success.
+ */
+static PyObject* sddsdata_GetParameter( PyObject* self, PyObject* args ) 
+{
+  long fileIndex;
+  PyObject *indexOrName;
+  char **data;
+  int32_t number;
+  long index;
+  long i;
+  PyObject *v=NULL;
+  if (!PyArg_ParseTuple(args, "lO", &fileIndex, &indexOrName)) {
+    return NULL;
+  }
+  if (PyString_Check(indexOrName)) {
+    index = SDDS_GetParameterIndex(&dataset_f[fileIndex], (char*)PyString_AsString(indexOrName));
+  } else if (PyNumber_Check(indexOrName)) {
+    if (PyInt_Check(indexOrName))
+      index = PyInt_AsLong(indexOrName);
+    else if (PyLong_Check(indexOrName))
+      index = PyLong_AsLong(indexOrName);
+    else
+      return NULL;
+  } else
+    return NULL;
+
+  data = SDDS_GetParameterNames(&dataset_f[fileIndex], &number);
+  if (!(data))
+    return NULL;
+  if ((index >= 0) && (index < number) && (data[index])) {
+    v = sddsdata_ParameterToValue(fileIndex, index, data[index]);
+  }
+
+  for (i=0;i<number;i++)
+    free(data[i]);
+  free(data);
+
+  return v;
+}
+
+/**
+ * @brief Retrieves the values of every parameter on the current page in a single call.
+ *
+ * @param self Python object (unused).
+ * @param args Python tuple containing:
+ *        - fileIndex: Index of the dataset file.
+ * 
+ * @return PyObject*:
+ *         - NULL on error.
+ *         - List of parameter values, in parameter index order, on success.
+ */
+static PyObject* sddsdata_GetParameters( PyObject* self, PyObject* args )
+{
+  long fileIndex;
+  char **data;
+  int32_t number;
+  long index;
+  PyObject *v, *value;
+  if (!PyArg_ParseTuple(args, "l", &fileIndex)) {
+    return NULL;
+  }
+  if (!sddsdata_CheckIndex(fileIndex))
+    Py_RETURN_NONE;
+
+  if (SDDS_ParameterCount(&dataset_f[fileIndex]) == 0)
+    return PyList_New(0);
+  data = SDDS_GetParameterNames(&dataset_f[fileIndex], &number);
+  if (!(data))
+    return NULL;
+
+  v = PyList_New(number);
+  for (index = 0; v && (index < number); index++) {
+    if (!(value = sddsdata_ParameterToValue(fileIndex, index, data[index]))) {
+      Py_DECREF(v);
+      v = NULL;
+      break;
+    }
+    PyList_SetItem(v, index, value);
+  }
+
+  for (index = 0; index < number; index++)
+    free(data[index]);
+  free(data);
+  return v;
+}
+
 /**
  * @brief Retrieves the data mode of a dataset.
  *
@@ -3580,6 +4462,7 @@ static PyMethodDef sddsdata_methods[] = {
   { "EnableFSync", sddsdata_EnableFSync, METH_VARARGS },
   { "DisableFSync", sddsdata_DisableFSync, METH_VARARGS },
   { "Terminate", sddsdata_Terminate, METH_VARARGS },
+  { "SetOutputBufferSize", sddsdata_SetOutputBufferSize, METH_VARARGS },
   { "SetTerminateMode", sddsdata_SetTerminateMode, METH_VARARGS },
   { "DefineParameter", sddsdata_DefineParameter, METH_VARARGS },
   { "DefineArray", sddsdata_DefineArray, METH_VARARGS },
@@ -3589,6 +4472,9 @@ static PyMethodDef sddsdata_methods[] = {
   { "DefineSimpleColumn", sddsdata_DefineSimpleColumn, METH_VARARGS },
   { "DefineSimpleArray", sddsdata_DefineSimpleArray, METH_VARARGS },
   { "DefineSimpleParameter", sddsdata_DefineSimpleParameter, METH_VARARGS },
+  { "DefineSimpleParameters", sddsdata_DefineSimpleParameters, METH_VARARGS },
+  { "DefineSimpleColumns", sddsdata_DefineSimpleColumns, METH_VARARGS },
+  { "DefineSimpleArrays", sddsdata_DefineSimpleArrays, METH_VARARGS },
   { "WriteLayout", sddsdata_WriteLayout, METH_VARARGS },
   { "EraseData", sddsdata_EraseData, METH_VARARGS },
   { "ProcessColumnString", sddsdata_ProcessColumnString, METH_VARARGS },
@@ -3671,6 +4557,7 @@ static PyMethodDef sddsdata_methods[] = {
   { "SetDataMode", sddsdata_SetDataMode, METH_VARARGS },
   { "CheckDataset", sddsdata_CheckDataset, METH_VARARGS },
   { "SetAutoCheckMode", sddsdata_SetAutoCheckMode, METH_VARARGS },
+  { "SetDefaultIOBufferSize", sddsdata_SetDefaultIOBufferSize, METH_VARARGS },
   { "GetColumnNameFromIndex", sddsdata_GetColumnNameFromIndex, METH_VARARGS },
   { "GetColumnNames", sddsdata_GetColumnNames, METH_VARARGS },
   { "GetArrayNameFromIndex", sddsdata_GetArrayNameFromIndex, METH_VARARGS },
@@ -3678,13 +4565,20 @@ static PyMethodDef sddsdata_methods[] = {
   { "GetParameterNameFromIndex", sddsdata_GetParameterNameFromIndex, METH_VARARGS },
   { "GetParameterNames", sddsdata_GetParameterNames, METH_VARARGS },
   { "SetParameter", sddsdata_SetParameter, METH_VARARGS },
+  { "SetParameters", sddsdata_SetParameters, METH_VARARGS },
   { "SetColumn", sddsdata_SetColumn, METH_VARARGS },
+  { "SetColumnsFromDict", sddsdata_SetColumnsFromDict, METH_VARARGS },
+  { "WritePages", sddsdata_WritePages, METH_VARARGS },
   { "SetArray", sddsdata_SetArray, METH_VARARGS },
   { "SetRowValues", sddsdata_SetRowValues, METH_VARARGS },
+  { "SetRow", sddsdata_SetRow, METH_VARARGS },
   { "GetColumn", sddsdata_GetColumn, METH_VARARGS },
+  { "GetColumns", sddsdata_GetColumns, METH_VARARGS },
   { "GetArray", sddsdata_GetArray, METH_VARARGS },
   { "GetArrayDimensions", sddsdata_GetArrayDimensions, METH_VARARGS },
+  { "GetArrays", sddsdata_GetArrays, METH_VARARGS },
   { "GetParameter", sddsdata_GetParameter, METH_VARARGS },
+  { "GetParameters", sddsdata_GetParameters, METH_VARARGS },
   { "GetMode", sddsdata_GetMode, METH_VARARGS },
   { NULL, NULL }
 };